@@ -6,11 +6,14 @@ Create Date: 2024-01-27 10:00:00.000000
 
 """
 
+from datetime import date
 from typing import Sequence, Union
 
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 from alembic import op
+from app.db.partitions import default_partition_sql, partition_statements
 
 # revision identifiers, used by Alembic.
 revision: str = "001"
@@ -19,6 +22,28 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _create_index_concurrently(
+    name: str, table: str, columns: list[str], unique: bool = False
+) -> None:
+    """Build an index without blocking writes to the table.
+
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so the
+    build happens in an autocommit block. The trade-off is that a failed
+    build is not rolled back with the rest of the migration and may leave an
+    INVALID index behind; IF NOT EXISTS makes re-running the upgrade safe once
+    that index has been dropped.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=unique,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
 def upgrade() -> None:
     """Create initial database schema."""
 
@@ -48,12 +73,14 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index("idx_users_deleted_at", "users", ["deleted_at"], unique=False)
-    op.create_index("idx_users_email", "users", ["email"], unique=False)
-    op.create_index("idx_users_is_active", "users", ["is_active"], unique=False)
-    op.create_index("idx_users_username", "users", ["username"], unique=False)
-    op.create_index("ix_users_email", "users", ["email"], unique=True)
-    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    _create_index_concurrently(
+        "idx_users_deleted_at", "users", ["deleted_at"], unique=False
+    )
+    _create_index_concurrently(
+        "idx_users_is_active", "users", ["is_active"], unique=False
+    )
+    _create_index_concurrently("ix_users_email", "users", ["email"], unique=True)
+    _create_index_concurrently("ix_users_username", "users", ["username"], unique=True)
 
     # Create refresh_tokens table
     op.create_table(
@@ -78,26 +105,23 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(
+    _create_index_concurrently(
         "idx_refresh_tokens_expires", "refresh_tokens", ["expires_at"], unique=False
     )
-    op.create_index(
-        "idx_refresh_tokens_hash", "refresh_tokens", ["token_hash"], unique=False
-    )
-    op.create_index(
+    _create_index_concurrently(
         "idx_refresh_tokens_user", "refresh_tokens", ["user_id"], unique=False
     )
-    op.create_index(
+    _create_index_concurrently(
         "ix_refresh_tokens_token_hash", "refresh_tokens", ["token_hash"], unique=True
     )
 
     # Create login_attempts table
     op.create_table(
         "login_attempts",
-        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), nullable=False),
         sa.Column("email", sa.String(length=255), nullable=False),
         sa.Column("user_id", sa.UUID(), nullable=True),
-        sa.Column("ip_address", sa.String(length=45), nullable=False),
+        sa.Column("ip_address", postgresql.INET(), nullable=True),
         sa.Column("user_agent", sa.String(length=500), nullable=True),
         sa.Column("success", sa.Boolean(), nullable=False),
         sa.Column(
@@ -121,37 +145,31 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="SET NULL"),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(
-        "idx_login_attempts_email", "login_attempts", ["email"], unique=False
-    )
-    op.create_index(
+    _create_index_concurrently(
         "idx_login_attempts_email_ip",
         "login_attempts",
         ["email", "ip_address"],
         unique=False,
     )
-    op.create_index(
-        "idx_login_attempts_ip", "login_attempts", ["ip_address"], unique=False
-    )
-    op.create_index(
+    _create_index_concurrently(
         "idx_login_attempts_time", "login_attempts", ["attempted_at"], unique=False
     )
     # Add missing index on foreign key
-    op.create_index(
+    _create_index_concurrently(
         "idx_login_attempts_user_id", "login_attempts", ["user_id"], unique=False
     )
 
     # Create audit_logs table
     op.create_table(
         "audit_logs",
-        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), nullable=False),
         sa.Column("user_id", sa.UUID(), nullable=True),
         sa.Column("action", sa.String(length=100), nullable=False),
         sa.Column("resource_type", sa.String(length=50), nullable=True),
         sa.Column("resource_id", sa.String(length=100), nullable=True),
-        sa.Column("ip_address", sa.String(length=45), nullable=True),
+        sa.Column("ip_address", postgresql.INET(), nullable=True),
         sa.Column("user_agent", sa.Text(), nullable=True),
-        sa.Column("request_data", sa.JSON(), nullable=True),
+        sa.Column("request_data", postgresql.JSONB(), nullable=True),
         sa.Column("response_status", sa.Integer(), nullable=True),
         sa.Column(
             "created_at",
@@ -166,8 +184,16 @@ def upgrade() -> None:
             nullable=False,
         ),
         sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="SET NULL"),
-        sa.PrimaryKeyConstraint("id"),
+        # The partition key must be part of the primary key
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
     )
+    for statement in partition_statements(date.today()):
+        op.execute(statement)
+    op.execute(default_partition_sql())
+
+    # Indexes on a partitioned table cascade to every partition but cannot be
+    # built CONCURRENTLY; the table is empty here, so a plain build is instant.
     op.create_index("idx_audit_action", "audit_logs", ["action"], unique=False)
     op.create_index("idx_audit_created", "audit_logs", ["created_at"], unique=False)
     op.create_index(
@@ -0,0 +1,60 @@
+"""Drop redundant non-unique user indexes.
+
+The unique ``ix_users_email``/``ix_users_username`` indexes already serve
+every lookup the plain ``idx_users_email``/``idx_users_username`` indexes
+did, so the duplicates only add write and storage overhead.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-02-05 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop duplicate indexes without blocking writers."""
+    # DROP INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_users_email",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "idx_users_username",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Recreate the non-unique user indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_users_email",
+            "users",
+            ["email"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_users_username",
+            "users",
+            ["username"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,45 @@
+"""Drop redundant non-unique refresh token hash index.
+
+``ix_refresh_tokens_token_hash`` is unique on the same column, so the plain
+``idx_refresh_tokens_hash`` index only doubles the index maintenance done
+on every token rotation.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-02-05 10:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop the duplicate token hash index without blocking writers."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_refresh_tokens_hash",
+            table_name="refresh_tokens",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Recreate the non-unique token hash index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_refresh_tokens_hash",
+            "refresh_tokens",
+            ["token_hash"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
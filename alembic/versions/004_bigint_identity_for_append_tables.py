@@ -0,0 +1,120 @@
+"""Switch login_attempts/audit_logs primary keys to BIGINT identity.
+
+Both tables are append-only; random UUID keys scatter inserts across the
+primary key B-tree, while sequential identity values keep them on the
+rightmost leaf page and shrink every index that embeds the key.
+
+Databases created from the current 001 revision already use BIGINT keys and
+are left untouched. Older databases get a new column that is backfilled in
+batches (ordered by insertion time via ``row_number()``) before the keys are
+swapped. Nothing references these ids, so no foreign keys need rewiring.
+
+This migration inspects the live schema and must run in online mode.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-02-06 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 10_000
+
+# table name -> column giving the original insertion order
+TABLES = {
+    "login_attempts": "attempted_at",
+    "audit_logs": "created_at",
+}
+
+
+def _id_is_bigint(table: str) -> bool:
+    """Check whether the table's primary key is already a BIGINT."""
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    id_column = next(column for column in columns if column["name"] == "id")
+    return isinstance(id_column["type"], sa.BigInteger)
+
+
+def _backfill_in_batches(table: str, order_column: str) -> None:
+    """Number existing rows in insertion order, one batch at a time."""
+    bind = op.get_bind()
+    bind.execute(
+        sa.text(
+            f"CREATE TEMPORARY TABLE {table}_id_map ON COMMIT DROP AS "
+            f"SELECT id, row_number() OVER (ORDER BY {order_column}, id) AS rn "
+            f"FROM {table}"
+        )
+    )
+    bind.execute(sa.text(f"CREATE INDEX ON {table}_id_map (rn)"))
+    total = bind.execute(sa.text(f"SELECT count(*) FROM {table}_id_map")).scalar()
+
+    for start in range(0, total or 0, BACKFILL_BATCH_SIZE):
+        bind.execute(
+            sa.text(
+                f"UPDATE {table} AS t SET new_id = m.rn "
+                f"FROM {table}_id_map AS m "
+                "WHERE t.id = m.id AND m.rn > :start AND m.rn <= :stop"
+            ),
+            {"start": start, "stop": start + BACKFILL_BATCH_SIZE},
+        )
+
+
+def upgrade() -> None:
+    """Replace UUID primary keys with BIGINT identity columns."""
+    if context.is_offline_mode():
+        raise RuntimeError("Revision 004 inspects the live schema; run it online.")
+
+    for table, order_column in TABLES.items():
+        if _id_is_bigint(table):
+            continue
+
+        op.add_column(table, sa.Column("new_id", sa.BigInteger(), nullable=True))
+        _backfill_in_batches(table, order_column)
+
+        op.drop_constraint(f"{table}_pkey", table, type_="primary")
+        op.drop_column(table, "id")
+        op.alter_column(table, "new_id", new_column_name="id", nullable=False)
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY"
+        )
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE(max(id), 0) + 1, false) FROM {table}"
+        )
+        op.create_primary_key(f"{table}_pkey", table, ["id"])
+
+
+def downgrade() -> None:
+    """Restore random UUID primary keys."""
+    if context.is_offline_mode():
+        raise RuntimeError("Revision 004 inspects the live schema; run it online.")
+
+    for table in TABLES:
+        if not _id_is_bigint(table):
+            continue
+
+        op.add_column(
+            table,
+            sa.Column(
+                "new_id",
+                sa.UUID(),
+                server_default=sa.text("gen_random_uuid()"),
+                nullable=False,
+            ),
+        )
+        op.alter_column(table, "new_id", server_default=None)
+
+        op.drop_constraint(f"{table}_pkey", table, type_="primary")
+        op.drop_column(table, "id")
+        op.alter_column(table, "new_id", new_column_name="id")
+        op.create_primary_key(f"{table}_pkey", table, ["id"])
@@ -0,0 +1,60 @@
+"""Drop single-column login attempt indexes covered by the composite.
+
+``idx_login_attempts_email_ip`` on ``(email, ip_address)`` already serves
+email-only filters through its leftmost prefix, and the rate limiter never
+filters on ``ip_address`` without ``email``. Dropping the two single-column
+indexes removes two B-tree updates from every recorded login attempt.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-02-06 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop the redundant indexes without blocking writers."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_login_attempts_email",
+            table_name="login_attempts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "idx_login_attempts_ip",
+            table_name="login_attempts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Recreate the single-column login attempt indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_login_attempts_email",
+            "login_attempts",
+            ["email"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_login_attempts_ip",
+            "login_attempts",
+            ["ip_address"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
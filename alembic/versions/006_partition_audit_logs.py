@@ -0,0 +1,141 @@
+"""Partition audit_logs by month on created_at.
+
+Databases created from the current 001 revision already have a partitioned
+audit_logs table and are left untouched. Older databases get the table
+rebuilt: the plain table is renamed aside, a range-partitioned replacement
+with monthly partitions covering the existing rows is created, the rows are
+copied over and the old table is dropped.
+
+New partitions must keep being created ahead of time; schedule
+``app create-audit-partitions`` monthly. Either way the table gets a
+DEFAULT partition, so a missed run does not make inserts fail.
+
+This migration inspects the live schema and must run in online mode.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-02-07 09:00:00.000000
+
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import context, op
+from app.db.partitions import default_partition_sql, partition_statements
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, user_id, action, resource_type, resource_id, ip_address, user_agent, "
+    "request_data, response_status, created_at, updated_at"
+)
+INDEXES = {
+    "idx_audit_action": ["action"],
+    "idx_audit_created": ["created_at"],
+    "idx_audit_resource": ["resource_type", "resource_id"],
+    "idx_audit_user_action": ["user_id", "action"],
+}
+
+
+def _is_partitioned() -> bool:
+    """Check whether audit_logs is already a partitioned table."""
+    relkind = (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT relkind FROM pg_class WHERE oid = 'audit_logs'::regclass")
+        )
+        .scalar()
+    )
+    return bool(relkind == "p")
+
+
+def _create_audit_logs(partitioned: bool) -> None:
+    """Create an empty audit_logs table, optionally range-partitioned."""
+    options = {"postgresql_partition_by": "RANGE (created_at)"} if partitioned else {}
+    op.create_table(
+        "audit_logs",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=True),
+        sa.Column("action", sa.String(length=100), nullable=False),
+        sa.Column("resource_type", sa.String(length=50), nullable=True),
+        sa.Column("resource_id", sa.String(length=100), nullable=True),
+        sa.Column("ip_address", sa.String(length=45), nullable=True),
+        sa.Column("user_agent", sa.Text(), nullable=True),
+        sa.Column("request_data", sa.JSON(), nullable=True),
+        sa.Column("response_status", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint(*(("id", "created_at") if partitioned else ("id",))),
+        **options,
+    )
+
+
+def _rebuild(partitioned: bool) -> None:
+    """Move audit_logs rows into a freshly created table."""
+    op.rename_table("audit_logs", "audit_logs_old")
+    op.execute(
+        "ALTER TABLE audit_logs_old RENAME CONSTRAINT audit_logs_pkey TO audit_logs_old_pkey"
+    )
+    for name in INDEXES:
+        op.drop_index(name, table_name="audit_logs_old", if_exists=True)
+
+    _create_audit_logs(partitioned)
+    if partitioned:
+        oldest = (
+            op.get_bind()
+            .execute(sa.text("SELECT min(created_at) FROM audit_logs_old"))
+            .scalar()
+        )
+        first = oldest.date() if oldest else date.today()
+        for statement in partition_statements(first):
+            op.execute(statement)
+
+    op.execute(
+        f"INSERT INTO audit_logs ({COLUMNS}) OVERRIDING SYSTEM VALUE "
+        f"SELECT {COLUMNS} FROM audit_logs_old"
+    )
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('audit_logs', 'id'), "
+        "COALESCE(max(id), 0) + 1, false) FROM audit_logs"
+    )
+    op.drop_table("audit_logs_old")
+
+    for name, columns in INDEXES.items():
+        op.create_index(name, "audit_logs", columns, unique=False)
+
+
+def upgrade() -> None:
+    """Convert audit_logs into a monthly range-partitioned table."""
+    if context.is_offline_mode():
+        raise RuntimeError("Revision 006 inspects the live schema; run it online.")
+
+    if not _is_partitioned():
+        _rebuild(partitioned=True)
+    op.execute(default_partition_sql())
+
+
+def downgrade() -> None:
+    """Convert audit_logs back into a plain table."""
+    if context.is_offline_mode():
+        raise RuntimeError("Revision 006 inspects the live schema; run it online.")
+
+    if _is_partitioned():
+        _rebuild(partitioned=False)
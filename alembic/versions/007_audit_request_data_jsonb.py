@@ -0,0 +1,47 @@
+"""Store audit_logs.request_data as JSONB.
+
+JSONB keeps a parsed binary form, so reads skip re-parsing the text and
+the column can be GIN-indexed once JSON-path filters are needed.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-02-07 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert request_data from json to jsonb."""
+    op.alter_column(
+        "audit_logs",
+        "request_data",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="request_data::jsonb",
+    )
+
+
+def downgrade() -> None:
+    """Convert request_data back to json."""
+    op.alter_column(
+        "audit_logs",
+        "request_data",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="request_data::json",
+    )
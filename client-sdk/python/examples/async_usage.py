@@ -1,6 +1,7 @@
 """Async usage example for the Full-Stack API Python SDK."""
 
 import asyncio
+import sys
 
 from fullstack_api import AsyncClient
 from fullstack_api.exceptions import AuthenticationError, RateLimitError
@@ -10,22 +11,49 @@ async def demonstrate_rate_limiting(client: AsyncClient):
     """Demonstrate handling rate limiting."""
     print("\nTesting rate limiting...")
 
-    # Make multiple rapid login attempts
-    for i in range(10):
-        try:
-            await client.auth.login(
+    # Fire the login attempts concurrently and stop at the first rate limit
+    tasks = [
+        asyncio.create_task(
+            client.auth.login(
                 username="test@example.com",
                 password="wrong_password",
             )
-        except AuthenticationError:
-            print(f"  Attempt {i + 1}: Invalid credentials")
-        except RateLimitError as e:
-            print(f"  Attempt {i + 1}: Rate limited!")
-            if e.retry_after:
-                print(f"  Retry after: {e.retry_after} seconds")
-            break
-        except Exception as e:
-            print(f"  Attempt {i + 1}: {e}")
+        )
+        for _ in range(10)
+    ]
+    pending = set(tasks)
+    retry_after = None
+    rate_limited = False
+    while pending and not rate_limited:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            error = task.exception()
+            if isinstance(error, RateLimitError):
+                rate_limited = True
+                retry_after = error.retry_after
+
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    # Collect the report and write it once, keeping terminal I/O out of the
+    # measurement
+    msgs = []
+    for i, task in enumerate(tasks):
+        if task.cancelled():
+            msgs.append(f"  Attempt {i + 1}: Cancelled")
+            continue
+        error = task.exception()
+        if isinstance(error, AuthenticationError):
+            msgs.append(f"  Attempt {i + 1}: Invalid credentials")
+        elif isinstance(error, RateLimitError):
+            msgs.append(f"  Attempt {i + 1}: Rate limited!")
+        elif error is not None:
+            msgs.append(f"  Attempt {i + 1}: {error}")
+
+    if retry_after:
+        msgs.append(f"  Retry after: {retry_after} seconds")
+    sys.stdout.write("\n".join(msgs) + "\n")
 
 
 async def demonstrate_auto_refresh(client: AsyncClient):
@@ -42,16 +70,25 @@ async def demonstrate_auto_refresh(client: AsyncClient):
     # Simulate waiting for token to near expiration
     print("  Simulating API calls over time...")
 
-    # Make multiple API calls - the SDK will auto-refresh when needed
-    for i in range(5):
-        user = await client.users.get_current_user()
-        print(f"  Call {i + 1}: User {user.username} still authenticated")
-        await asyncio.sleep(1)
+    # Make batches of concurrent API calls - the SDK will auto-refresh when
+    # needed. The pause between batches lets the token age between them.
+    for batch in range(2):
+        if batch:
+            await asyncio.sleep(1)
+        users = await asyncio.gather(
+            *(client.users.get_current_user() for _ in range(5))
+        )
+        print(
+            f"  Batch {batch + 1}: {len(users)} calls, "
+            f"user {users[0].username} still authenticated"
+        )
 
 
 async def main():
     """Demonstrate async SDK usage."""
-    # Use async context manager for automatic cleanup
+    # Use async context manager for automatic cleanup. The client pools up to
+    # 100 connections (50 kept alive for 60s); pass limits=httpx.Limits(...)
+    # to tune this for heavier concurrency.
     async with AsyncClient(base_url="http://localhost:8000") as client:
         # Basic authentication flow
         try:
@@ -1,18 +1,30 @@
-"""Basic usage example for the Full-Stack API Python SDK."""
+"""Basic usage example for the Full-Stack API Python SDK.
 
-from fullstack_api import Client
+This uses ``AsyncClient``, the recommended interface: network waits yield to
+the event loop instead of blocking a thread. The synchronous ``Client`` has
+the same API for callers that cannot adopt async.
+"""
+
+import asyncio
+
+from fullstack_api import AsyncClient
 from fullstack_api.exceptions import AuthenticationError, ValidationError
 
 
-def main():
+async def main():
     """Demonstrate basic SDK usage."""
-    # Initialize client
-    client = Client(base_url="http://localhost:8000")
+    # Initialize client (pools up to 100 keep-alive connections by default;
+    # pass limits=httpx.Limits(...) to tune)
+    async with AsyncClient(base_url="http://localhost:8000") as client:
+        await run_examples(client)
+
 
+async def run_examples(client: AsyncClient):
+    """Register, log in, update the profile and log out."""
     try:
         # Register a new user
         print("Registering new user...")
-        user = client.auth.register(
+        user = await client.auth.register(
             email="demo@example.com",
             username="demo_user",
             password="DemoPass123!",
@@ -27,7 +39,7 @@ def main():
     try:
         # Login
         print("\nLogging in...")
-        tokens = client.auth.login(
+        tokens = await client.auth.login(
             username="demo@example.com",  # Can use email or username
             password="DemoPass123!",
         )
@@ -36,21 +48,21 @@ def main():
 
         # Get current user
         print("\nFetching user profile...")
-        me = client.users.get_current_user()
+        me = await client.users.get_current_user()
         print(f"✓ Current user: {me.full_name} ({me.email})")
         print(f"  Account created: {me.created_at}")
         print(f"  Email verified: {me.is_verified}")
 
         # Update profile
         print("\nUpdating profile...")
-        updated = client.users.update_profile(
+        updated = await client.users.update_profile(
             full_name="Demo User Updated",
         )
         print(f"✓ Profile updated: {updated.full_name}")
 
         # Logout
         print("\nLogging out...")
-        client.auth.logout()
+        await client.auth.logout()
         print("✓ Logged out successfully")
 
     except AuthenticationError as e:
@@ -60,4 +72,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,6 +1,14 @@
-"""Error handling example for the Full-Stack API Python SDK."""
+"""Error handling example for the Full-Stack API Python SDK.
 
-from fullstack_api import Client
+The examples use ``AsyncClient``, the recommended interface; the synchronous
+``Client`` raises the same exceptions for callers that cannot adopt async.
+"""
+
+import asyncio
+import random
+import time
+
+from fullstack_api import AsyncClient
 from fullstack_api.exceptions import (
     APIError,
     AuthenticationError,
@@ -9,16 +17,21 @@ from fullstack_api.exceptions import (
     ValidationError,
 )
 
+# Exponential backoff delays in seconds, capped so late retries stay bounded
+MAX_BACKOFF = 30
+_BACKOFF = tuple(min(1 << i, MAX_BACKOFF) for i in range(10))
+
+# Errors worth retrying, bound once rather than rebuilt on every attempt
+_RETRYABLE = (APIError, RateLimitError)
 
-def demonstrate_validation_errors():
-    """Show how to handle validation errors."""
-    client = Client(base_url="http://localhost:8000")
 
+async def demonstrate_validation_errors(client: AsyncClient):
+    """Show how to handle validation errors."""
     print("Testing validation errors...")
 
     # Invalid email
     try:
-        client.auth.register(
+        await client.auth.register(
             email="not-an-email",
             username="test",
             password="pass",
@@ -33,7 +46,7 @@ def demonstrate_validation_errors():
 
     # Weak password
     try:
-        client.auth.register(
+        await client.auth.register(
             email="test@example.com",
             username="test",
             password="weak",
@@ -44,20 +57,18 @@ def demonstrate_validation_errors():
 
     # Missing required fields
     try:
-        client.auth.login(username="", password="")
+        await client.auth.login(username="", password="")
     except ValidationError as e:
         print(f"✓ Caught missing fields: {e.message}")
 
 
-def demonstrate_auth_errors():
+async def demonstrate_auth_errors(client: AsyncClient):
     """Show how to handle authentication errors."""
-    client = Client(base_url="http://localhost:8000")
-
     print("\nTesting authentication errors...")
 
     # Invalid credentials
     try:
-        client.auth.login(
+        await client.auth.login(
             username="nonexistent@example.com",
             password="wrongpassword",
         )
@@ -66,71 +77,131 @@ def demonstrate_auth_errors():
 
     # Accessing protected endpoint without auth
     try:
-        client.users.get_current_user()
+        await client.users.get_current_user()
     except AuthenticationError as e:
         print(f"✓ Caught unauthorized access: {e.message}")
 
     # Expired token simulation
-    client._token = None  # Clear token
+    client._clear_token()
     try:
-        client.users.get_current_user()
+        await client.users.get_current_user()
     except AuthenticationError as e:
         print(f"✓ Caught missing token: {e.message}")
 
 
-def demonstrate_rate_limiting():
-    """Show how to handle rate limiting."""
-    client = Client(base_url="http://localhost:8000")
+async def _maybe_sleep(e: RateLimitError):
+    """Wait out the server's Retry-After window, capped at MAX_BACKOFF."""
+    if e.retry_after:
+        await asyncio.sleep(min(e.retry_after, MAX_BACKOFF))
 
+
+async def demonstrate_rate_limiting(client: AsyncClient):
+    """Show how to handle rate limiting."""
     print("\nTesting rate limiting...")
 
-    # Make rapid requests
+    # Make rapid requests until the server says to back off; further attempts
+    # inside the Retry-After window would only be rejected again
     attempt = 0
+    rate_limited = None
     while attempt < 10:
         try:
-            attempt += 1
             # Rapid login attempts
-            client.auth.login(
+            await client.auth.login(
                 username="test@example.com",
                 password="wrong",
             )
         except RateLimitError as e:
-            print(f"✓ Rate limited after {attempt} attempts")
-            print(f"  Message: {e.message}")
-            if e.retry_after:
-                print(f"  Retry after: {e.retry_after} seconds")
+            rate_limited = e
             break
         except AuthenticationError:
             # Expected for wrong password
-            pass
+            attempt += 1
 
+    if rate_limited is None:
+        return
 
-def demonstrate_error_recovery():
-    """Show error recovery patterns."""
-    client = Client(base_url="http://localhost:8000")
+    retry_after = rate_limited.retry_after
+    print(f"✓ Rate limited after {attempt + 1} attempts")
+    print(f"  Message: {rate_limited.message}")
+    if retry_after:
+        print(f"  Retry after: {retry_after} seconds")
+
+    # Honor the cooldown, then retry once
+    await _maybe_sleep(rate_limited)
+    try:
+        await client.auth.login(username="test@example.com", password="wrong")
+    except RateLimitError:
+        print("  Still rate limited after waiting")
+    except AuthenticationError:
+        print("✓ Accepted again after the cooldown")
+
+
+class CircuitBreaker:
+    """Simple circuit breaker implementation."""
+
+    __slots__ = (
+        "failure_threshold",
+        "recovery_timeout",
+        "failures",
+        "last_failure_time",
+        "is_open",
+    )
+
+    def __init__(self, failure_threshold=3, recovery_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.last_failure_time = 0.0
+        self.is_open = False
+
+    async def call(self, func):
+        """Await a coroutine function with circuit breaker."""
+        # Monotonic time is immune to wall-clock adjustments
+        now = time.monotonic()
+        if self.is_open:
+            if now - self.last_failure_time > self.recovery_timeout:
+                self.is_open = False
+                self.failures = 0
+            else:
+                raise APIError("Circuit breaker is open")
+
+        try:
+            result = await func()
+            self.failures = 0
+            return result
+        except APIError:
+            self.failures += 1
+            self.last_failure_time = time.monotonic()
+            if self.failures >= self.failure_threshold:
+                self.is_open = True
+                print(f"  Circuit breaker opened after {self.failures} failures")
+            raise
 
+
+async def demonstrate_error_recovery(client: AsyncClient):
+    """Show error recovery patterns."""
     print("\nDemonstrating error recovery...")
 
     # Pattern 1: Retry with exponential backoff
-    import time
-
-    def retry_with_backoff(func, max_retries=3):
-        """Retry function with exponential backoff."""
+    async def retry_with_backoff(func, max_retries=3):
+        """Retry a coroutine function with exponential backoff."""
         for i in range(max_retries):
             try:
-                return func()
-            except (APIError, RateLimitError) as e:
+                return await func()
+            except _RETRYABLE as e:
                 if i == max_retries - 1:
                     raise
-                wait_time = 2**i  # Exponential backoff
-                print(f"  Retry {i + 1}/{max_retries} after {wait_time}s...")
-                time.sleep(wait_time)
+                wait_time = _BACKOFF[min(i, len(_BACKOFF) - 1)]
+                # Jitter keeps concurrent clients from retrying in lockstep
+                wait_time += random.uniform(0, 0.25)
+                print(f"  Retry {i + 1}/{max_retries} after {wait_time:.2f}s...")
+                await asyncio.sleep(wait_time)
 
     # Pattern 2: Fallback behavior
-    def get_user_safe(client):
+    async def get_user_safe(client):
         """Get user with fallback."""
         try:
-            return client.users.get_current_user()
+            return await client.users.get_current_user()
         except AuthenticationError:
             print("  Not authenticated, using guest mode")
             return None
@@ -138,56 +209,29 @@ def demonstrate_error_recovery():
             print(f"  API error, using cached data: {e}")
             return {"username": "cached_user", "email": "cached@example.com"}
 
-    # Pattern 3: Circuit breaker
-    class CircuitBreaker:
-        """Simple circuit breaker implementation."""
-
-        def __init__(self, failure_threshold=3, recovery_timeout=60):
-            self.failure_threshold = failure_threshold
-            self.recovery_timeout = recovery_timeout
-            self.failures = 0
-            self.last_failure_time = None
-            self.is_open = False
-
-        def call(self, func):
-            """Call function with circuit breaker."""
-            if self.is_open:
-                if time.time() - self.last_failure_time > self.recovery_timeout:
-                    self.is_open = False
-                    self.failures = 0
-                else:
-                    raise APIError("Circuit breaker is open")
-
-            try:
-                result = func()
-                self.failures = 0
-                return result
-            except APIError:
-                self.failures += 1
-                self.last_failure_time = time.time()
-                if self.failures >= self.failure_threshold:
-                    self.is_open = True
-                    print(f"  Circuit breaker opened after {self.failures} failures")
-                raise
+    # Pattern 3: Circuit breaker, see the module-level CircuitBreaker class
 
     print("✓ Error recovery patterns demonstrated")
 
 
-def main():
+async def main():
     """Run all error handling demonstrations."""
     print("Error Handling Examples")
     print("=" * 50)
 
-    try:
-        demonstrate_validation_errors()
-        demonstrate_auth_errors()
-        demonstrate_rate_limiting()
-        demonstrate_error_recovery()
-    except Exception as e:
-        print(f"\n✗ Unexpected error: {type(e).__name__}: {e}")
+    # Share one client so every demonstration reuses its connection pool
+    # (100 connections, 50 kept alive for 60s by default)
+    async with AsyncClient(base_url="http://localhost:8000") as client:
+        try:
+            await demonstrate_validation_errors(client)
+            await demonstrate_auth_errors(client)
+            await demonstrate_rate_limiting(client)
+            await demonstrate_error_recovery(client)
+        except Exception as e:
+            print(f"\n✗ Unexpected error: {type(e).__name__}: {e}")
 
     print("\n✓ Error handling examples completed")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,10 +1,25 @@
 """Setup configuration for Full-Stack API Python SDK."""
 
+import os
+
 from setuptools import find_packages, setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Opt-in: FULLSTACK_API_USE_MYPYC=1 compiles the per-response hot path to C
+# extensions with mypyc (needs mypy and a C compiler at build time)
+ext_modules = []
+if os.environ.get("FULLSTACK_API_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "src/fullstack_api/exceptions.py",
+            "src/fullstack_api/_response.py",
+        ]
+    )
+
 setup(
     name="fullstack-api-client",
     version="0.1.0",
@@ -16,6 +31,7 @@ setup(
     url="https://github.com/yourusername/fullstack-api-python",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -31,7 +47,9 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "httpx>=0.25.0",
+        "httpx[http2]>=0.25.0",
+        "msgspec>=0.18.0",
+        "orjson>=3.9.0",
         "pydantic>=2.0.0",
         "python-dateutil>=2.8.0",
     ],
@@ -1,14 +1,18 @@
 """Full-Stack API Python SDK."""
 
-from .client import AsyncClient, Client
-from .exceptions import (
-    APIError,
-    AuthenticationError,
-    NotFoundError,
-    RateLimitError,
-    ValidationError,
-)
-from .models import Token, User
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .client import AsyncClient, Client
+    from .exceptions import (
+        APIError,
+        AuthenticationError,
+        NotFoundError,
+        RateLimitError,
+        ValidationError,
+    )
+    from .models import Token, User
 
 __version__ = "0.1.0"
 
@@ -23,3 +27,33 @@ __all__ = [
     "NotFoundError",
     "RateLimitError",
 ]
+
+# Public names are imported on first access (PEP 562), so e.g. importing an
+# exception class does not pull in the HTTP client stack.
+_LAZY = {
+    "Client": ".client",
+    "AsyncClient": ".client",
+    "User": ".models",
+    "Token": ".models",
+    "APIError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "RateLimitError": ".exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first access and cache it on the module."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including not-yet-imported public names."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,152 @@
+"""Response decoding and error dispatch for the SDK clients.
+
+Kept free of client state and fully annotated so that it can be compiled
+with mypyc (see setup.py).
+"""
+
+import math
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, NoReturn, Optional
+
+import orjson
+from httpx import Response
+
+from .exceptions import (
+    APIError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+
+
+@lru_cache(maxsize=256)
+def _retry_after_timestamp(value: str) -> Optional[float]:
+    """Parse an HTTP-date Retry-After value to a Unix timestamp."""
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return retry_at.timestamp()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """Return the seconds to wait from a Retry-After header, if valid.
+
+    The header is either delay-seconds or an HTTP-date (RFC 7231). Dates are
+    parsed once per distinct value and compared with the current time on
+    every call, so cached values never go stale.
+    """
+    if not value:
+        return None
+    if value.isdigit():
+        return int(value)
+    timestamp = _retry_after_timestamp(value)
+    if timestamp is None:
+        return None
+    return max(0, math.ceil(timestamp - time.time()))
+
+
+def _raise_auth(
+    data: Dict[str, Any], headers: Mapping[str, str], message: str, details: Any
+) -> NoReturn:
+    """Raise for 401 responses."""
+    raise AuthenticationError(message, details=details)
+
+
+def _raise_validation(
+    data: Dict[str, Any], headers: Mapping[str, str], message: str, details: Any
+) -> NoReturn:
+    """Raise for 422 responses."""
+    raise ValidationError(message, errors=data.get("errors", []), details=details)
+
+
+def _raise_not_found(
+    data: Dict[str, Any], headers: Mapping[str, str], message: str, details: Any
+) -> NoReturn:
+    """Raise for 404 responses."""
+    raise NotFoundError(message, details=details)
+
+
+def _raise_rate_limit(
+    data: Dict[str, Any], headers: Mapping[str, str], message: str, details: Any
+) -> NoReturn:
+    """Raise for 429 responses."""
+    raise RateLimitError(
+        message,
+        retry_after=parse_retry_after(headers.get("Retry-After")),
+        details=details,
+    )
+
+
+# Status codes with a dedicated exception; other 5xx raise ServerError and
+# everything else APIError
+_ERROR_HANDLERS: Dict[
+    int, Callable[[Dict[str, Any], Mapping[str, str], str, Any], NoReturn]
+] = {
+    401: _raise_auth,
+    404: _raise_not_found,
+    422: _raise_validation,
+    429: _raise_rate_limit,
+}
+
+
+def invalid_response(response: Response) -> APIError:
+    """Build the error for a body that is not the expected JSON."""
+    if response.status_code >= 500:
+        return ServerError(f"Server error: {response.status_code}")
+    return APIError(f"Invalid response: {response.text}")
+
+
+def dispatch_error(
+    status_code: int, data: Dict[str, Any], headers: Mapping[str, str]
+) -> NoReturn:
+    """Raise the exception matching an error response."""
+    message = data.get("message", "Unknown error")
+    details = data.get("details", {})
+
+    handler = _ERROR_HANDLERS.get(status_code)
+    if handler is not None:
+        handler(data, headers, message, details)
+    if status_code >= 500:
+        raise ServerError(message, details=details)
+    raise APIError(
+        message,
+        status_code=status_code,
+        code=data.get("code", "unknown_error"),
+        details=details,
+    )
+
+
+def handle_response(response: Response) -> Any:
+    """Return the decoded body of a response, or raise for errors."""
+    status_code = response.status_code
+    if status_code == 204:
+        return None
+
+    # Decide from the headers whether to parse at all, so the common path
+    # is a single check before orjson
+    content = response.content
+    if content and "json" in response.headers.get("content-type", ""):
+        try:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Malformed body despite the JSON content type
+            raise invalid_response(response) from None
+    elif not content:
+        if 200 <= status_code < 300:
+            return None
+        data = {}
+    else:
+        # e.g. an HTML error page from a proxy; not worth parsing
+        raise invalid_response(response)
+
+    if 200 <= status_code < 300:
+        return data
+    dispatch_error(status_code, data, response.headers)
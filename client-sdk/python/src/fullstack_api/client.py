@@ -1,112 +1,184 @@
 """Main client implementation for the Full-Stack API SDK."""
 
-import json
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, Union
+
+import msgspec
+import orjson
+from httpx import URL
 from httpx import AsyncClient as HttpxAsyncClient
+from httpx import BaseTransport
 from httpx import Client as HttpxClient
-from httpx import Response
-
-from .exceptions import (
-    APIError,
-    AuthenticationError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-    ValidationError,
-)
-from .models import (
-    LoginRequest,
-    RefreshTokenRequest,
-    RegisterRequest,
-    Token,
-    UpdateProfileRequest,
-    User,
+from httpx import HTTPTransport, Limits, Request, Response
+
+from ._response import handle_response, invalid_response, parse_retry_after
+from .exceptions import APIError, AuthenticationError
+from .models import Token, User
+
+T = TypeVar("T")
+
+# Responses worth retrying, and methods safe to resend. POST is never retried:
+# the server records even a throttled login as a failed attempt, so resending
+# it would only extend the lockout.
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+# Base delay in seconds for exponential backoff without a Retry-After
+RETRY_BACKOFF = 0.1
+# Longest Retry-After the client will wait out before raising instead
+MAX_RETRY_AFTER = 30
+
+# Connection pool sized for concurrent SDK calls; idle connections are kept
+# alive long enough to be reused across bursts of requests.
+DEFAULT_LIMITS = Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60.0,
 )
 
+# Process-wide connection pools shared by synchronous clients with the same
+# settings, so short-lived clients reuse warm TCP/TLS connections.
+_TRANSPORT_CACHE: Dict[Tuple[Any, ...], HTTPTransport] = {}
+_TRANSPORT_LOCK = threading.Lock()
+
+
+class _SharedTransport(BaseTransport):
+    """Transport wrapper whose close() leaves the shared pool open."""
+
+    def __init__(self, transport: HTTPTransport):
+        """Wrap a shared transport."""
+        self._transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        """Send the request over the shared pool."""
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        """Leave the shared pool to other clients."""
+
+
+def _get_shared_transport(
+    base_url: str, verify_ssl: bool, limits: Limits, http2: bool
+) -> _SharedTransport:
+    """Return the process-wide transport for these connection settings."""
+    key = (
+        base_url,
+        verify_ssl,
+        http2,
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+    )
+    with _TRANSPORT_LOCK:
+        transport = _TRANSPORT_CACHE.get(key)
+        if transport is None:
+            transport = HTTPTransport(verify=verify_ssl, limits=limits, http2=http2)
+            _TRANSPORT_CACHE[key] = transport
+    return _SharedTransport(transport)
+
 
 class BaseClient:
     """Base client with common functionality."""
 
+    __slots__ = (
+        "base_url",
+        "timeout",
+        "max_retries",
+        "verify_ssl",
+        "limits",
+        "http2",
+        "_token",
+        "_token_expires_at_monotonic",
+        "_cached_headers",
+        "_auth_header",
+    )
+
     def __init__(
         self,
         base_url: str,
         timeout: float = 30.0,
         max_retries: int = 3,
         verify_ssl: bool = True,
+        limits: Optional[Limits] = None,
+        http2: bool = True,
     ):
         """Initialize the client."""
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.verify_ssl = verify_ssl
+        self.limits = limits or DEFAULT_LIMITS
+        # Multiplex requests over one connection; disable for HTTP/1.1 servers
+        self.http2 = http2
         self._token: Optional[Token] = None
-        self._token_expires_at: Optional[datetime] = None
+        # time.monotonic() deadline after which the token is refreshed
+        self._token_expires_at_monotonic: float = 0.0
+        # Built once and updated only when the token changes
+        self._cached_headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        # "Bearer <token>", formatted once per token rather than per request
+        self._auth_header: Optional[str] = None
 
     def _handle_response(self, response: Response) -> Any:
         """Handle API response and raise appropriate exceptions."""
-        if response.status_code == 204:
-            return None
+        return handle_response(response)
 
-        try:
-            data = response.json()
-        except json.JSONDecodeError:
-            if response.status_code >= 500:
-                raise ServerError(f"Server error: {response.status_code}")
-            raise APIError(f"Invalid response: {response.text}")
-
-        if response.status_code >= 200 and response.status_code < 300:
-            return data
-
-        # Handle error responses
-        error_message = data.get("message", "Unknown error")
-        error_code = data.get("code", "unknown_error")
-        error_details = data.get("details", {})
-
-        if response.status_code == 401:
-            raise AuthenticationError(error_message, details=error_details)
-        elif response.status_code == 422:
-            raise ValidationError(
-                error_message,
-                errors=data.get("errors", []),
-                details=error_details,
-            )
-        elif response.status_code == 404:
-            raise NotFoundError(error_message, details=error_details)
-        elif response.status_code == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise RateLimitError(
-                error_message,
-                retry_after=int(retry_after) if retry_after else None,
-                details=error_details,
-            )
-        elif response.status_code >= 500:
-            raise ServerError(error_message, details=error_details)
-        else:
-            raise APIError(
-                error_message,
-                status_code=response.status_code,
-                code=error_code,
-                details=error_details,
-            )
+    def _retry_delay(self, response: Response, attempt: int) -> Optional[float]:
+        """Return seconds to wait before retrying, or None to give up."""
+        status_code = response.status_code
+        if status_code not in _RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        if status_code in (429, 503):
+            seconds = parse_retry_after(response.headers.get("Retry-After"))
+            if seconds is not None:
+                # Surface long cooldowns rather than block the caller
+                return float(seconds) if seconds <= MAX_RETRY_AFTER else None
+        return RETRY_BACKOFF * 2**attempt + random.uniform(0, RETRY_BACKOFF)
+
+    def _decode(self, response: Response, type_: Type[T]) -> T:
+        """Decode a successful JSON response straight into ``type_``.
+
+        msgspec fills the model's fields directly from the response bytes,
+        with no intermediate dict. Error responses go through
+        _handle_response() to raise the matching exception.
+        """
+        if 200 <= response.status_code < 300 and response.content:
+            try:
+                return msgspec.json.decode(response.content, type=type_)
+            except msgspec.DecodeError:
+                raise invalid_response(response) from None
+        self._handle_response(response)
+        raise APIError("Invalid response: empty body")
 
     def _get_headers(self) -> Dict[str, str]:
-        """Get request headers."""
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token.access_token}"
-        return headers
+        """Get request headers (shared dict, do not mutate)."""
+        return self._cached_headers
+
+    def _set_token(self, token: Token) -> None:
+        """Set authentication token."""
+        self._token = token
+        # Refresh 1 minute before the token actually expires
+        self._token_expires_at_monotonic = time.monotonic() + token.expires_in - 60.0
+        self._auth_header = f"Bearer {token.access_token}"
+        self._cached_headers["Authorization"] = self._auth_header
+
+    def _clear_token(self) -> None:
+        """Clear authentication token."""
+        self._token = None
+        self._token_expires_at_monotonic = 0.0
+        self._auth_header = None
+        self._cached_headers.pop("Authorization", None)
 
     def _should_refresh_token(self) -> bool:
         """Check if token should be refreshed."""
-        if not self._token or not self._token_expires_at:
-            return False
-        # Refresh if token expires in less than 1 minute
-        return datetime.utcnow() >= self._token_expires_at - timedelta(minutes=1)
+        return (
+            self._token is not None
+            and time.monotonic() >= self._token_expires_at_monotonic
+        )
 
 
 class AuthAPI:
@@ -115,16 +187,20 @@ class AuthAPI:
     def __init__(self, client: "Client"):
         """Initialize auth API."""
         self._client = client
+        # Parsed once so requests skip URL building and parsing
+        self._login_url = URL(f"{client.base_url}/api/v1/auth/login")
+        self._register_url = URL(f"{client.base_url}/api/v1/auth/register")
+        self._refresh_url = URL(f"{client.base_url}/api/v1/auth/refresh")
+        self._logout_url = URL(f"{client.base_url}/api/v1/auth/logout")
 
     def login(self, username: str, password: str) -> Token:
         """Login with username/email and password."""
-        request = LoginRequest(username=username, password=password)
-        response = self._client._request(
+        response = self._client._send(
             "POST",
-            "/api/v1/auth/login",
-            json=request.model_dump(),
+            self._login_url,
+            json={"username": username, "password": password},
         )
-        token = Token(**response)
+        token = self._client._decode(response, Token)
         self._client._set_token(token)
         return token
 
@@ -136,18 +212,15 @@ class AuthAPI:
         full_name: Optional[str] = None,
     ) -> User:
         """Register a new user."""
-        request = RegisterRequest(
-            email=email,
-            username=username,
-            password=password,
-            full_name=full_name,
-        )
-        response = self._client._request(
+        body = {"email": email, "username": username, "password": password}
+        if full_name is not None:
+            body["full_name"] = full_name
+        response = self._client._send(
             "POST",
-            "/api/v1/auth/register",
-            json=request.model_dump(exclude_none=True),
+            self._register_url,
+            json=body,
         )
-        return User(**response)
+        return self._client._decode(response, User)
 
     def refresh_token(self, refresh_token: Optional[str] = None) -> Token:
         """Refresh access token."""
@@ -156,13 +229,12 @@ class AuthAPI:
         if not refresh_token:
             raise AuthenticationError("No refresh token available")
 
-        request = RefreshTokenRequest(refresh_token=refresh_token)
-        response = self._client._request(
+        response = self._client._send(
             "POST",
-            "/api/v1/auth/refresh",
-            json=request.model_dump(),
+            self._refresh_url,
+            json={"refresh_token": refresh_token},
         )
-        token = Token(**response)
+        token = self._client._decode(response, Token)
         self._client._set_token(token)
         return token
 
@@ -170,7 +242,7 @@ class AuthAPI:
         """Logout and invalidate tokens."""
         if self._client._token:
             try:
-                self._client._request("POST", "/api/v1/auth/logout")
+                self._client._request_url("POST", self._logout_url, content=b"")
             except Exception:
                 pass  # Ignore logout errors
         self._client._clear_token()
@@ -182,11 +254,12 @@ class UsersAPI:
     def __init__(self, client: "Client"):
         """Initialize users API."""
         self._client = client
+        self._me_url = URL(f"{client.base_url}/api/v1/users/me")
 
     def get_current_user(self) -> User:
         """Get current authenticated user."""
-        response = self._client._request("GET", "/api/v1/users/me")
-        return User(**response)
+        response = self._client._send("GET", self._me_url)
+        return self._client._decode(response, User)
 
     def update_profile(
         self,
@@ -194,34 +267,56 @@ class UsersAPI:
         full_name: Optional[str] = None,
     ) -> User:
         """Update user profile."""
-        request = UpdateProfileRequest(email=email, full_name=full_name)
-        response = self._client._request(
+        body = {}
+        if email is not None:
+            body["email"] = email
+        if full_name is not None:
+            body["full_name"] = full_name
+        response = self._client._send(
             "PUT",
-            "/api/v1/users/me",
-            json=request.model_dump(exclude_none=True),
+            self._me_url,
+            json=body,
         )
-        return User(**response)
+        return self._client._decode(response, User)
 
     def delete_account(self, password: str) -> None:
         """Delete user account."""
-        self._client._request(
+        self._client._request_url(
             "DELETE",
-            "/api/v1/users/me",
-            json={"password": password},
+            self._me_url,
+            content=orjson.dumps({"password": password}),
         )
         self._client._clear_token()
 
 
 class Client(BaseClient):
-    """Synchronous client for the Full-Stack API."""
+    """Synchronous client for the Full-Stack API.
+
+    By default, clients with the same base URL, SSL verification and pool
+    limits share one process-wide connection pool, which close() leaves
+    open. Pass ``share_transport=False`` for a private pool.
+    """
 
-    def __init__(self, *args, **kwargs):
+    __slots__ = ("_http_client", "_refresh_lock", "auth", "users")
+
+    def __init__(self, *args: Any, share_transport: bool = True, **kwargs: Any):
         """Initialize the client."""
         super().__init__(*args, **kwargs)
-        self._http_client = HttpxClient(
-            timeout=self.timeout,
-            verify=self.verify_ssl,
-        )
+        if share_transport:
+            self._http_client = HttpxClient(
+                timeout=self.timeout,
+                transport=_get_shared_transport(
+                    self.base_url, self.verify_ssl, self.limits, self.http2
+                ),
+            )
+        else:
+            self._http_client = HttpxClient(
+                timeout=self.timeout,
+                verify=self.verify_ssl,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        self._refresh_lock = threading.Lock()
         self.auth = AuthAPI(self)
         self.users = UsersAPI(self)
 
@@ -237,15 +332,12 @@ class Client(BaseClient):
         """Close the HTTP client."""
         self._http_client.close()
 
-    def _set_token(self, token: Token) -> None:
-        """Set authentication token."""
-        self._token = token
-        self._token_expires_at = datetime.utcnow() + timedelta(seconds=token.expires_in)
-
-    def _clear_token(self) -> None:
-        """Clear authentication token."""
-        self._token = None
-        self._token_expires_at = None
+    def _refresh_token_once(self) -> None:
+        """Refresh the token, with concurrent callers sharing one refresh."""
+        with self._refresh_lock:
+            # Another thread may have refreshed while we waited
+            if self._should_refresh_token():
+                self.auth.refresh_token()
 
     def _request(
         self,
@@ -253,22 +345,51 @@ class Client(BaseClient):
         path: str,
         **kwargs,
     ) -> Any:
-        """Make HTTP request."""
+        """Make HTTP request to a path under the base URL."""
+        return self._request_url(method, f"{self.base_url}{path}", **kwargs)
+
+    def _request_url(
+        self,
+        method: str,
+        url: Union[str, URL],
+        **kwargs,
+    ) -> Any:
+        """Make HTTP request to a full URL."""
+        return self._handle_response(self._send(method, url, **kwargs))
+
+    def _send(
+        self,
+        method: str,
+        url: Union[str, URL],
+        **kwargs,
+    ) -> Response:
+        """Send an authenticated request and return the raw response."""
         # Auto-refresh token if needed
-        if self._should_refresh_token() and path != "/api/v1/auth/refresh":
-            self.auth.refresh_token()
-
-        url = f"{self.base_url}{path}"
-        headers = kwargs.pop("headers", {})
-        headers.update(self._get_headers())
-
-        response = self._http_client.request(
-            method,
-            url,
-            headers=headers,
-            **kwargs,
-        )
-        return self._handle_response(response)
+        if self._should_refresh_token() and url != self.auth._refresh_url:
+            self._refresh_token_once()
+
+        headers = kwargs.pop("headers", None)
+        if headers:
+            headers = {**headers, **self._cached_headers}
+        else:
+            headers = self._cached_headers
+        if "json" in kwargs:
+            # Encode with orjson; _get_headers() already sets the JSON Content-Type
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+
+        retryable = method in _IDEMPOTENT_METHODS
+        for attempt in range(self.max_retries + 1):
+            response = self._http_client.request(
+                method,
+                url,
+                headers=headers,
+                **kwargs,
+            )
+            delay = self._retry_delay(response, attempt) if retryable else None
+            if delay is None:
+                return response
+            time.sleep(delay)
+        return response
 
 
 class AsyncAuthAPI:
@@ -277,16 +398,20 @@ class AsyncAuthAPI:
     def __init__(self, client: "AsyncClient"):
         """Initialize auth API."""
         self._client = client
+        # Parsed once so requests skip URL building and parsing
+        self._login_url = URL(f"{client.base_url}/api/v1/auth/login")
+        self._register_url = URL(f"{client.base_url}/api/v1/auth/register")
+        self._refresh_url = URL(f"{client.base_url}/api/v1/auth/refresh")
+        self._logout_url = URL(f"{client.base_url}/api/v1/auth/logout")
 
     async def login(self, username: str, password: str) -> Token:
         """Login with username/email and password."""
-        request = LoginRequest(username=username, password=password)
-        response = await self._client._request(
+        response = await self._client._send(
             "POST",
-            "/api/v1/auth/login",
-            json=request.model_dump(),
+            self._login_url,
+            json={"username": username, "password": password},
         )
-        token = Token(**response)
+        token = self._client._decode(response, Token)
         self._client._set_token(token)
         return token
 
@@ -298,18 +423,15 @@ class AsyncAuthAPI:
         full_name: Optional[str] = None,
     ) -> User:
         """Register a new user."""
-        request = RegisterRequest(
-            email=email,
-            username=username,
-            password=password,
-            full_name=full_name,
-        )
-        response = await self._client._request(
+        body = {"email": email, "username": username, "password": password}
+        if full_name is not None:
+            body["full_name"] = full_name
+        response = await self._client._send(
             "POST",
-            "/api/v1/auth/register",
-            json=request.model_dump(exclude_none=True),
+            self._register_url,
+            json=body,
         )
-        return User(**response)
+        return self._client._decode(response, User)
 
     async def refresh_token(self, refresh_token: Optional[str] = None) -> Token:
         """Refresh access token."""
@@ -318,13 +440,12 @@ class AsyncAuthAPI:
         if not refresh_token:
             raise AuthenticationError("No refresh token available")
 
-        request = RefreshTokenRequest(refresh_token=refresh_token)
-        response = await self._client._request(
+        response = await self._client._send(
             "POST",
-            "/api/v1/auth/refresh",
-            json=request.model_dump(),
+            self._refresh_url,
+            json={"refresh_token": refresh_token},
         )
-        token = Token(**response)
+        token = self._client._decode(response, Token)
         self._client._set_token(token)
         return token
 
@@ -332,7 +453,7 @@ class AsyncAuthAPI:
         """Logout and invalidate tokens."""
         if self._client._token:
             try:
-                await self._client._request("POST", "/api/v1/auth/logout")
+                await self._client._request_url("POST", self._logout_url, content=b"")
             except Exception:
                 pass  # Ignore logout errors
         self._client._clear_token()
@@ -344,11 +465,12 @@ class AsyncUsersAPI:
     def __init__(self, client: "AsyncClient"):
         """Initialize users API."""
         self._client = client
+        self._me_url = URL(f"{client.base_url}/api/v1/users/me")
 
     async def get_current_user(self) -> User:
         """Get current authenticated user."""
-        response = await self._client._request("GET", "/api/v1/users/me")
-        return User(**response)
+        response = await self._client._send("GET", self._me_url)
+        return self._client._decode(response, User)
 
     async def update_profile(
         self,
@@ -356,20 +478,24 @@ class AsyncUsersAPI:
         full_name: Optional[str] = None,
     ) -> User:
         """Update user profile."""
-        request = UpdateProfileRequest(email=email, full_name=full_name)
-        response = await self._client._request(
+        body = {}
+        if email is not None:
+            body["email"] = email
+        if full_name is not None:
+            body["full_name"] = full_name
+        response = await self._client._send(
             "PUT",
-            "/api/v1/users/me",
-            json=request.model_dump(exclude_none=True),
+            self._me_url,
+            json=body,
         )
-        return User(**response)
+        return self._client._decode(response, User)
 
     async def delete_account(self, password: str) -> None:
         """Delete user account."""
-        await self._client._request(
+        await self._client._request_url(
             "DELETE",
-            "/api/v1/users/me",
-            json={"password": password},
+            self._me_url,
+            content=orjson.dumps({"password": password}),
         )
         self._client._clear_token()
 
@@ -377,13 +503,20 @@ class AsyncUsersAPI:
 class AsyncClient(BaseClient):
     """Asynchronous client for the Full-Stack API."""
 
-    def __init__(self, *args, **kwargs):
+    __slots__ = ("_http_client", "_refresh_task", "auth", "users")
+
+    def __init__(self, *args: Any, **kwargs: Any):
         """Initialize the client."""
         super().__init__(*args, **kwargs)
+        # Async pools are bound to the event loop that opened their
+        # connections, so each AsyncClient keeps its own
         self._http_client = HttpxAsyncClient(
             timeout=self.timeout,
             verify=self.verify_ssl,
+            limits=self.limits,
+            http2=self.http2,
         )
+        self._refresh_task: Optional["asyncio.Future[Token]"] = None
         self.auth = AsyncAuthAPI(self)
         self.users = AsyncUsersAPI(self)
 
@@ -399,15 +532,20 @@ class AsyncClient(BaseClient):
         """Close the HTTP client."""
         await self._http_client.aclose()
 
-    def _set_token(self, token: Token) -> None:
-        """Set authentication token."""
-        self._token = token
-        self._token_expires_at = datetime.utcnow() + timedelta(seconds=token.expires_in)
-
-    def _clear_token(self) -> None:
-        """Clear authentication token."""
-        self._token = None
-        self._token_expires_at = None
+    async def _refresh_token_once(self) -> None:
+        """Refresh the token, with concurrent callers sharing one refresh."""
+        task = self._refresh_task
+        if task is None:
+            task = asyncio.ensure_future(self.auth.refresh_token())
+            task.add_done_callback(self._forget_refresh_task)
+            self._refresh_task = task
+        # Shielded so one cancelled caller does not cancel the others' refresh
+        await asyncio.shield(task)
+
+    def _forget_refresh_task(self, task: "asyncio.Future[Token]") -> None:
+        """Allow a new refresh once the in-flight one has finished."""
+        if self._refresh_task is task:
+            self._refresh_task = None
 
     async def _request(
         self,
@@ -415,19 +553,48 @@ class AsyncClient(BaseClient):
         path: str,
         **kwargs,
     ) -> Any:
-        """Make HTTP request."""
+        """Make HTTP request to a path under the base URL."""
+        return await self._request_url(method, f"{self.base_url}{path}", **kwargs)
+
+    async def _request_url(
+        self,
+        method: str,
+        url: Union[str, URL],
+        **kwargs,
+    ) -> Any:
+        """Make HTTP request to a full URL."""
+        return self._handle_response(await self._send(method, url, **kwargs))
+
+    async def _send(
+        self,
+        method: str,
+        url: Union[str, URL],
+        **kwargs,
+    ) -> Response:
+        """Send an authenticated request and return the raw response."""
         # Auto-refresh token if needed
-        if self._should_refresh_token() and path != "/api/v1/auth/refresh":
-            await self.auth.refresh_token()
-
-        url = f"{self.base_url}{path}"
-        headers = kwargs.pop("headers", {})
-        headers.update(self._get_headers())
-
-        response = await self._http_client.request(
-            method,
-            url,
-            headers=headers,
-            **kwargs,
-        )
-        return self._handle_response(response)
+        if self._should_refresh_token() and url != self.auth._refresh_url:
+            await self._refresh_token_once()
+
+        headers = kwargs.pop("headers", None)
+        if headers:
+            headers = {**headers, **self._cached_headers}
+        else:
+            headers = self._cached_headers
+        if "json" in kwargs:
+            # Encode with orjson; _get_headers() already sets the JSON Content-Type
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+
+        retryable = method in _IDEMPOTENT_METHODS
+        for attempt in range(self.max_retries + 1):
+            response = await self._http_client.request(
+                method,
+                url,
+                headers=headers,
+                **kwargs,
+            )
+            delay = self._retry_delay(response, attempt) if retryable else None
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+        return response
@@ -1,11 +1,13 @@
 """Exception classes for the Full-Stack API SDK."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 class APIError(Exception):
     """Base exception for API errors."""
 
+    __slots__ = ("message", "status_code", "code", "details")
+
     def __init__(
         self,
         message: str,
@@ -30,7 +32,9 @@ class APIError(Exception):
 class AuthenticationError(APIError):
     """Raised when authentication fails."""
 
-    def __init__(self, message: str = "Authentication failed", **kwargs):
+    __slots__ = ()
+
+    def __init__(self, message: str = "Authentication failed", **kwargs: Any):
         """Initialize authentication error."""
         super().__init__(
             message, status_code=401, code="authentication_error", **kwargs
@@ -40,11 +44,13 @@ class AuthenticationError(APIError):
 class ValidationError(APIError):
     """Raised when request validation fails."""
 
+    __slots__ = ("errors",)
+
     def __init__(
         self,
         message: str = "Validation failed",
-        errors: Optional[list] = None,
-        **kwargs,
+        errors: Optional[List[Any]] = None,
+        **kwargs: Any,
     ):
         """Initialize validation error."""
         super().__init__(message, status_code=422, code="validation_error", **kwargs)
@@ -54,7 +60,9 @@ class ValidationError(APIError):
 class NotFoundError(APIError):
     """Raised when a resource is not found."""
 
-    def __init__(self, message: str = "Resource not found", **kwargs):
+    __slots__ = ()
+
+    def __init__(self, message: str = "Resource not found", **kwargs: Any):
         """Initialize not found error."""
         super().__init__(message, status_code=404, code="not_found", **kwargs)
 
@@ -62,11 +70,13 @@ class NotFoundError(APIError):
 class RateLimitError(APIError):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
         retry_after: Optional[int] = None,
-        **kwargs,
+        **kwargs: Any,
     ):
         """Initialize rate limit error."""
         super().__init__(message, status_code=429, code="rate_limit_exceeded", **kwargs)
@@ -76,6 +86,8 @@ class RateLimitError(APIError):
 class ServerError(APIError):
     """Raised when server encounters an error."""
 
-    def __init__(self, message: str = "Internal server error", **kwargs):
+    __slots__ = ()
+
+    def __init__(self, message: str = "Internal server error", **kwargs: Any):
         """Initialize server error."""
         super().__init__(message, status_code=500, code="server_error", **kwargs)
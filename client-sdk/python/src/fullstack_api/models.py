@@ -1,31 +1,45 @@
 """Data models for the Full-Stack API SDK."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+import msgspec
+from pydantic import BaseModel, Field
 
 
-class User(BaseModel):
+# Response models are msgspec Structs: the server's output is trusted, so
+# they are decoded straight from JSON bytes into slotted objects without
+# pydantic validation.
+class User(msgspec.Struct, frozen=True):
     """User model."""
 
-    id: str = Field(..., description="User ID")
-    email: EmailStr = Field(..., description="User email address")
-    username: str = Field(..., description="Username")
-    full_name: Optional[str] = Field(None, description="User's full name")
-    is_active: bool = Field(True, description="Whether the user is active")
-    is_verified: bool = Field(False, description="Whether the user's email is verified")
-    created_at: datetime = Field(..., description="Account creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    id: str
+    email: str
+    username: str
+    created_at: datetime
+    updated_at: datetime
+    full_name: Optional[str] = None
+    is_active: bool = True
+    is_verified: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "User":
+        """Build a user from a decoded API response body."""
+        return msgspec.convert(data, cls)
 
 
-class Token(BaseModel):
+class Token(msgspec.Struct, frozen=True):
     """Authentication token response."""
 
-    access_token: str = Field(..., description="JWT access token")
-    refresh_token: str = Field(..., description="JWT refresh token")
-    token_type: str = Field("Bearer", description="Token type")
-    expires_in: int = Field(..., description="Access token expiration time in seconds")
+    access_token: str
+    refresh_token: str
+    expires_in: int
+    token_type: str = "Bearer"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Token":
+        """Build a token from a decoded API response body."""
+        return msgspec.convert(data, cls)
 
 
 class LoginRequest(BaseModel):
@@ -38,7 +52,7 @@ class LoginRequest(BaseModel):
 class RegisterRequest(BaseModel):
     """User registration request."""
 
-    email: EmailStr = Field(..., description="Email address")
+    email: str = Field(..., description="Email address")
     username: str = Field(..., description="Username")
     password: str = Field(..., description="Password")
     full_name: Optional[str] = Field(None, description="Full name")
@@ -47,7 +61,7 @@ class RegisterRequest(BaseModel):
 class UpdateProfileRequest(BaseModel):
     """Update profile request."""
 
-    email: Optional[EmailStr] = Field(None, description="New email address")
+    email: Optional[str] = Field(None, description="New email address")
     full_name: Optional[str] = Field(None, description="New full name")
 
 
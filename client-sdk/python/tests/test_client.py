@@ -1,15 +1,19 @@
 """Tests for the Full-Stack API Python SDK client."""
 
+import asyncio
 import json
-from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from fullstack_api import Client
+from fullstack_api import AsyncClient, Client
 from fullstack_api.exceptions import (
     AuthenticationError,
     NotFoundError,
     RateLimitError,
+    ServerError,
     ValidationError,
 )
 from fullstack_api.models import Token, User
@@ -23,8 +27,8 @@ def mock_response():
     def _mock_response(status_code=200, json_data=None, headers=None):
         response = Mock(spec=Response)
         response.status_code = status_code
-        response.headers = headers or {}
-        response.json.return_value = json_data or {}
+        response.headers = {"content-type": "application/json", **(headers or {})}
+        response.content = json.dumps(json_data or {}).encode()
         response.text = json.dumps(json_data) if json_data else ""
         return response
 
@@ -78,6 +82,22 @@ class TestClient:
         # After exiting, client should be closed
         assert client._http_client._closed is False  # httpx doesn't set _closed
 
+    def test_shared_transport(self):
+        """Test clients with the same settings share one connection pool."""
+        first = Client(base_url="https://api.example.com")
+        second = Client(base_url="https://api.example.com")
+        private = Client(base_url="https://api.example.com", share_transport=False)
+
+        shared = first._http_client._transport._transport
+        assert second._http_client._transport._transport is shared
+        assert private._http_client._transport is not shared
+
+        # Closing one client leaves the pool open for the others
+        first.close()
+        assert not second._http_client.is_closed
+        private.close()
+        second.close()
+
     @patch("httpx.Client.request")
     def test_login_success(self, mock_request, client, mock_response):
         """Test successful login."""
@@ -114,6 +134,24 @@ class TestClient:
 
         assert "Invalid credentials" in str(exc_info.value)
 
+    @patch("fullstack_api.client.time.sleep")
+    @patch("httpx.Client.request")
+    def test_login_throttled_not_retried(
+        self, mock_request, mock_sleep, client, mock_response
+    ):
+        """Test a throttled login is raised without resending it."""
+        mock_request.return_value = mock_response(
+            status_code=429,
+            json_data={"code": "rate_limit_error", "message": "Too many attempts"},
+            headers={"Retry-After": "1"},
+        )
+
+        with pytest.raises(RateLimitError):
+            client.auth.login("test@example.com", "password123")
+
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
+
     @patch("httpx.Client.request")
     def test_register_success(self, mock_request, client, mock_response):
         """Test successful registration."""
@@ -187,6 +225,21 @@ class TestClient:
 
         assert exc_info.value.retry_after == 60
 
+    @patch("httpx.Client.request")
+    def test_rate_limit_http_date(self, mock_request, client, mock_response):
+        """Test Retry-After given as an HTTP-date is converted to seconds."""
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(hours=1))
+        mock_request.return_value = mock_response(
+            status_code=429,
+            json_data={"code": "rate_limit_exceeded", "message": "Slow down"},
+            headers={"Retry-After": retry_at},
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            client.auth.login("test@example.com", "password")
+
+        assert 3590 <= exc_info.value.retry_after <= 3600
+
     @patch("httpx.Client.request")
     def test_get_current_user(self, mock_request, authenticated_client, mock_response):
         """Test getting current user."""
@@ -221,9 +274,7 @@ class TestClient:
     ):
         """Test automatic token refresh."""
         # Set token to expire soon
-        authenticated_client._token_expires_at = datetime.utcnow() + timedelta(
-            seconds=30
-        )
+        authenticated_client._token_expires_at_monotonic = time.monotonic() - 30
 
         # Mock refresh token response
         refresh_response = mock_response(
@@ -268,9 +319,48 @@ class TestClient:
         authenticated_client.auth.logout()
 
         assert authenticated_client._token is None
-        assert authenticated_client._token_expires_at is None
+        assert authenticated_client._token_expires_at_monotonic == 0.0
         mock_request.assert_called_once()
 
+    @patch("fullstack_api.client.time.sleep")
+    @patch("httpx.Client.request")
+    def test_retries_with_retry_after(
+        self, mock_request, mock_sleep, authenticated_client, mock_response
+    ):
+        """Test throttled idempotent requests are retried after Retry-After."""
+        user_data = {
+            "id": "123",
+            "email": "test@example.com",
+            "username": "testuser",
+            "created_at": datetime.utcnow().isoformat(),
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        mock_request.side_effect = [
+            mock_response(status_code=503, headers={"Retry-After": "2"}),
+            mock_response(status_code=200, json_data=user_data),
+        ]
+
+        user = authenticated_client.users.get_current_user()
+
+        assert user.username == "testuser"
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("fullstack_api.client.time.sleep")
+    @patch("httpx.Client.request")
+    def test_non_json_server_error(self, mock_request, mock_sleep, client):
+        """Test non-JSON error pages raise without being parsed."""
+        response = Mock(spec=Response)
+        response.status_code = 502
+        response.headers = {"content-type": "text/html"}
+        response.content = b"<html>Bad Gateway</html>"
+        mock_request.return_value = response
+
+        with pytest.raises(ServerError) as exc_info:
+            client.users.get_current_user()
+
+        assert "502" in str(exc_info.value)
+
     @patch("httpx.Client.request")
     def test_not_found_error(self, mock_request, client, mock_response):
         """Test not found error handling."""
@@ -286,3 +376,75 @@ class TestClient:
             client.users.get_current_user()
 
         assert "User not found" in str(exc_info.value)
+
+
+class TestAsyncClient:
+    """Test AsyncClient class."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_refresh(self, mock_response):
+        """Test a burst of requests at expiry triggers a single refresh."""
+        client = AsyncClient(base_url="https://api.example.com")
+        client._set_token(
+            Token(access_token="old", refresh_token="refresh", expires_in=30)
+        )
+        token_data = {
+            "access_token": "new",
+            "refresh_token": "new_refresh",
+            "expires_in": 900,
+        }
+        user_data = {
+            "id": "123",
+            "email": "test@example.com",
+            "username": "testuser",
+            "created_at": datetime.utcnow().isoformat(),
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+
+        async def respond(method, url, **kwargs):
+            if str(url).endswith("/auth/refresh"):
+                await asyncio.sleep(0.01)  # Let the other requests pile up
+                return mock_response(status_code=200, json_data=token_data)
+            return mock_response(status_code=200, json_data=user_data)
+
+        with patch("httpx.AsyncClient.request", AsyncMock(side_effect=respond)) as req:
+            users = await asyncio.gather(
+                *(client.users.get_current_user() for _ in range(5))
+            )
+
+        refreshes = [c for c in req.call_args_list if "refresh" in str(c.args[1])]
+        assert len(users) == 5
+        assert len(refreshes) == 1
+        assert client._token.access_token == "new"
+        await client.close()
+
+
+class TestModels:
+    """Test response models."""
+
+    def test_user_from_dict(self):
+        """Test users parse API timestamps and ignore unknown fields."""
+        user = User.from_dict(
+            {
+                "id": "123",
+                "email": "test@example.com",
+                "username": "testuser",
+                "created_at": "2024-01-01T12:00:00Z",
+                "updated_at": "2024-01-02T12:00:00.123456+00:00",
+                "is_superuser": False,
+            }
+        )
+
+        assert user.created_at == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        assert user.updated_at.microsecond == 123456
+        assert user.full_name is None
+        assert user.is_active is True
+
+    def test_token_from_dict_defaults_type(self):
+        """Test token type defaults to Bearer."""
+        token = Token.from_dict(
+            {"access_token": "a", "refresh_token": "r", "expires_in": 900}
+        )
+
+        assert token == Token(access_token="a", refresh_token="r", expires_in=900)
+        assert token.token_type == "Bearer"
@@ -5,17 +5,17 @@ FullStack API CLI Example
 A command-line interface for interacting with the FullStack API.
 """
 
+import atexit
+import functools
 import os
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 from dotenv import load_dotenv
-from rich import print as rprint
 from rich.console import Console
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
 
 # Add the SDK to the path if running from examples directory
 sdk_path = Path(__file__).parent.parent.parent / "sdk" / "python" / "src"
@@ -31,9 +31,15 @@ from fullstack_api import (
     RateLimitError,
     RegisterRequest,
     UpdateUserRequest,
+    User,
     ValidationError,
 )
 
+# rich.table and rich.prompt are imported where they are used so that
+# --help and non-interactive commands start faster
+if TYPE_CHECKING:
+    from rich.table import Table
+
 # Load environment variables
 load_dotenv()
 
@@ -44,10 +50,66 @@ console = Console()
 API_URL = os.getenv("FULLSTACK_API_URL", "http://localhost:8000")
 TOKEN_FILE = Path.home() / ".fullstack" / "cli_tokens.json"
 
+# How long the interactive menu trusts the last fetched user
+USER_CACHE_TTL = 30
+_user_cache = {"token": None, "user": None, "expires": 0.0}
+
 
+@functools.lru_cache(maxsize=1)
 def get_client() -> FullStackClient:
-    """Get API client with file-based token storage."""
-    return FullStackClient(API_URL, token_storage=FileTokenStorage(str(TOKEN_FILE)))
+    """Get the shared API client with file-based token storage.
+
+    The client is built once per process so every command, including each
+    pass through the interactive menu, reuses its keep-alive connections.
+    """
+    client = FullStackClient(API_URL, token_storage=FileTokenStorage(str(TOKEN_FILE)))
+    atexit.register(client.close)
+    return client
+
+
+def get_cached_user(client: FullStackClient) -> Optional[User]:
+    """Get the current user, reusing the last result for the same token."""
+    token = client.token_storage.get_access_token()
+    now = time.monotonic()
+    if (
+        token is not None
+        and token == _user_cache["token"]
+        and now < _user_cache["expires"]
+    ):
+        return _user_cache["user"]
+
+    user = client.try_get_current_user()
+    _user_cache.update(
+        token=client.token_storage.get_access_token(),
+        user=user,
+        expires=now + USER_CACHE_TTL,
+    )
+    return user
+
+
+def invalidate_user_cache() -> None:
+    """Forget the cached user so the next lookup hits the API."""
+    _user_cache["token"] = None
+
+
+def _user_table() -> "Table":
+    """Create the empty user information table."""
+    from rich.table import Table
+
+    table = Table(title="User Information", show_header=False)
+    table.add_column("Field", style="cyan")
+    table.add_column("Value")
+    return table
+
+
+def _health_table() -> "Table":
+    """Create the empty API health status table."""
+    from rich.table import Table
+
+    table = Table(title="API Health Status")
+    table.add_column("Component", style="cyan")
+    table.add_column("Status")
+    return table
 
 
 @click.group()
@@ -59,17 +121,19 @@ def cli():
 @cli.command()
 def login():
     """Login to the API"""
+    from rich.prompt import Confirm, Prompt
+
     client = get_client()
 
     # Check if already logged in
-    if client.is_authenticated():
-        try:
-            user = client.get_current_user()
-            rprint(f"[green]Already logged in as {user.username}[/green]")
-            if not Confirm.ask("Do you want to login as a different user?"):
-                return
-        except:
-            pass
+    try:
+        user = client.try_get_current_user()
+    except Exception:
+        user = None
+    if user is not None:
+        console.print(f"[green]Already logged in as {user.username}[/green]")
+        if not Confirm.ask("Do you want to login as a different user?"):
+            return
 
     username = Prompt.ask("Username")
     password = Prompt.ask("Password", password=True)
@@ -77,21 +141,22 @@ def login():
     try:
         with console.status("Logging in..."):
             client.login(LoginRequest(username=username, password=password))
+            invalidate_user_cache()
             user = client.get_current_user()
 
-        rprint(f"[green]✓ Successfully logged in as {user.username}![/green]")
+        console.print(f"[green]✓ Successfully logged in as {user.username}![/green]")
 
     except AuthenticationError as e:
-        rprint(f"[red]✗ Login failed: {e.message}[/red]")
+        console.print(f"[red]✗ Login failed: {e.message}[/red]")
         sys.exit(1)
     except RateLimitError as e:
         retry_after = e.retry_after or 900
-        rprint(
+        console.print(
             f"[red]✗ Too many login attempts. Try again in {retry_after} seconds.[/red]"
         )
         sys.exit(1)
     except Exception as e:
-        rprint(f"[red]✗ Error: {str(e)}[/red]")
+        console.print(f"[red]✗ Error: {str(e)}[/red]")
         sys.exit(1)
 
 
@@ -101,25 +166,29 @@ def logout():
     client = get_client()
 
     if not client.is_authenticated():
-        rprint("[yellow]Not logged in[/yellow]")
+        console.print("[yellow]Not logged in[/yellow]")
         return
 
     try:
         with console.status("Logging out..."):
             client.logout()
-        rprint("[green]✓ Successfully logged out[/green]")
+        console.print("[green]✓ Successfully logged out[/green]")
     except Exception as e:
-        rprint(f"[red]✗ Error: {str(e)}[/red]")
+        console.print(f"[red]✗ Error: {str(e)}[/red]")
         # Clear tokens anyway
         client.clear_tokens()
+    finally:
+        invalidate_user_cache()
 
 
 @cli.command()
 def register():
     """Register a new account"""
+    from rich.prompt import Confirm, Prompt
+
     client = get_client()
 
-    rprint("[bold]Register New Account[/bold]")
+    console.print("[bold]Register New Account[/bold]")
 
     email = Prompt.ask("Email")
     username = Prompt.ask("Username")
@@ -128,7 +197,7 @@ def register():
     confirm_password = Prompt.ask("Confirm Password", password=True)
 
     if password != confirm_password:
-        rprint("[red]✗ Passwords do not match[/red]")
+        console.print("[red]✗ Passwords do not match[/red]")
         sys.exit(1)
 
     try:
@@ -142,21 +211,21 @@ def register():
                 )
             )
 
-        rprint(f"[green]✓ Account created successfully![/green]")
+        console.print(f"[green]✓ Account created successfully![/green]")
 
         # Auto-login
         if Confirm.ask("Do you want to login now?", default=True):
             with console.status("Logging in..."):
                 client.login(LoginRequest(username=username, password=password))
-            rprint(f"[green]✓ Logged in as {username}[/green]")
+            console.print(f"[green]✓ Logged in as {username}[/green]")
 
     except ValidationError as e:
-        rprint("[red]✗ Validation errors:[/red]")
+        console.print("[red]✗ Validation errors:[/red]")
         for error in e.errors:
-            rprint(f"  - {error['field']}: {error['message']}")
+            console.print(f"  - {error['field']}: {error['message']}")
         sys.exit(1)
     except Exception as e:
-        rprint(f"[red]✗ Error: {str(e)}[/red]")
+        console.print(f"[red]✗ Error: {str(e)}[/red]")
         sys.exit(1)
 
 
@@ -165,20 +234,16 @@ def whoami():
     """Show current user information"""
     client = get_client()
 
-    if not client.is_authenticated():
-        rprint("[yellow]Not logged in[/yellow]")
-        rprint("Use 'fullstack-cli login' to authenticate")
-        return
-
     try:
         with console.status("Fetching user information..."):
-            user = client.get_current_user()
+            user = client.try_get_current_user()
 
-        # Create a table for user info
-        table = Table(title="User Information", show_header=False)
-        table.add_column("Field", style="cyan")
-        table.add_column("Value")
+        if user is None:
+            console.print("[yellow]Not logged in[/yellow]")
+            console.print("Use 'fullstack-cli login' to authenticate")
+            return
 
+        table = _user_table()
         table.add_row("ID", user.id)
         table.add_row("Username", user.username)
         table.add_row("Email", user.email)
@@ -196,30 +261,27 @@ def whoami():
 
         console.print(table)
 
-    except AuthenticationError:
-        rprint("[red]✗ Authentication failed. Please login again.[/red]")
-        client.clear_tokens()
-        sys.exit(1)
     except Exception as e:
-        rprint(f"[red]✗ Error: {str(e)}[/red]")
+        console.print(f"[red]✗ Error: {str(e)}[/red]")
         sys.exit(1)
 
 
 @cli.command()
 def update():
     """Update user profile"""
-    client = get_client()
+    from rich.prompt import Confirm, Prompt
 
-    if not client.is_authenticated():
-        rprint("[yellow]Not logged in[/yellow]")
-        return
+    client = get_client()
 
     try:
-        # Get current user
-        user = client.get_current_user()
+        # Get current user; a missing or rejected token means not logged in
+        user = client.try_get_current_user()
+        if user is None:
+            console.print("[yellow]Not logged in[/yellow]")
+            return
 
-        rprint("[bold]Update Profile[/bold]")
-        rprint("[dim]Press Enter to keep current value[/dim]\n")
+        console.print("[bold]Update Profile[/bold]")
+        console.print("[dim]Press Enter to keep current value[/dim]\n")
 
         # Prompt for updates
         email = Prompt.ask(f"Email [{user.email}]", default=user.email)
@@ -237,27 +299,29 @@ def update():
         if full_name != (user.full_name or ""):
             update_data.full_name = full_name if full_name else None
 
-        if not update_data.to_dict():
-            rprint("[yellow]No changes made[/yellow]")
+        changes = update_data.to_dict()
+        if not changes:
+            console.print("[yellow]No changes made[/yellow]")
             return
 
         # Confirm changes
-        rprint("\n[bold]Changes to be made:[/bold]")
-        for field, value in update_data.to_dict().items():
-            rprint(f"  {field}: {value}")
+        console.print("\n[bold]Changes to be made:[/bold]")
+        for field, value in changes.items():
+            console.print(f"  {field}: {value}")
 
         if not Confirm.ask("\nApply these changes?"):
-            rprint("[yellow]Update cancelled[/yellow]")
+            console.print("[yellow]Update cancelled[/yellow]")
             return
 
         # Apply updates
         with console.status("Updating profile..."):
             updated_user = client.update_current_user(update_data)
+        invalidate_user_cache()
 
-        rprint("[green]✓ Profile updated successfully![/green]")
+        console.print("[green]✓ Profile updated successfully![/green]")
 
     except Exception as e:
-        rprint(f"[red]✗ Error: {str(e)}[/red]")
+        console.print(f"[red]✗ Error: {str(e)}[/red]")
         sys.exit(1)
 
 
@@ -268,27 +332,23 @@ def change_password(old: str, new: str) -> None:
     """Change account password"""
     client = get_client()
 
-    if not client.is_authenticated():
-        rprint("[yellow]Not logged in[/yellow]")
-        return
-
     try:
         with console.status("Changing password..."):
             client.change_password(
                 ChangePasswordRequest(old_password=old, new_password=new)
             )
 
-        rprint("[green]✓ Password changed successfully![/green]")
-        rprint("[dim]You can continue using your current session[/dim]")
+        console.print("[green]✓ Password changed successfully![/green]")
+        console.print("[dim]You can continue using your current session[/dim]")
 
     except AuthenticationError as e:
         if "password" in e.message.lower():
-            rprint("[red]✗ Current password is incorrect[/red]")
+            console.print("[red]✗ Current password is incorrect[/red]")
         else:
-            rprint(f"[red]✗ {e.message}[/red]")
+            console.print(f"[red]✗ {e.message}[/red]")
         sys.exit(1)
     except Exception as e:
-        rprint(f"[red]✗ Error: {str(e)}[/red]")
+        console.print(f"[red]✗ Error: {str(e)}[/red]")
         sys.exit(1)
 
 
@@ -301,11 +361,7 @@ def health():
         with console.status("Checking API health..."):
             health_data = client.health_check()
 
-        # Create health status table
-        table = Table(title="API Health Status")
-        table.add_column("Component", style="cyan")
-        table.add_column("Status")
-
+        table = _health_table()
         # API Status
         status_color = "green" if health_data.status == "healthy" else "red"
         table.add_row("API", f"[{status_color}]{health_data.status}[/{status_color}]")
@@ -323,8 +379,8 @@ def health():
         console.print(table)
 
     except Exception as e:
-        rprint(f"[red]✗ Health check failed: {str(e)}[/red]")
-        rprint(f"[dim]API URL: {API_URL}[/dim]")
+        console.print(f"[red]✗ Health check failed: {str(e)}[/red]")
+        console.print(f"[dim]API URL: {API_URL}[/dim]")
         sys.exit(1)
 
 
@@ -332,26 +388,29 @@ def health():
 @click.option("--force", is_flag=True, help="Skip confirmation prompts")
 def delete_account(force: bool) -> None:
     """Delete your account (irreversible!)"""
-    client = get_client()
+    from rich.prompt import Confirm, Prompt
 
-    if not client.is_authenticated():
-        rprint("[yellow]Not logged in[/yellow]")
-        return
+    client = get_client()
 
     try:
-        # Get user info
-        user = client.get_current_user()
+        # Get user info; a missing or rejected token means not logged in
+        user = client.try_get_current_user()
+        if user is None:
+            console.print("[yellow]Not logged in[/yellow]")
+            return
 
-        rprint(f"[red][bold]⚠️  WARNING: Account Deletion[/bold][/red]")
-        rprint(f"You are about to delete the account: [bold]{user.username}[/bold]")
-        rprint("[red]This action cannot be undone![/red]\n")
+        console.print(f"[red][bold]⚠️  WARNING: Account Deletion[/bold][/red]")
+        console.print(
+            f"You are about to delete the account: [bold]{user.username}[/bold]"
+        )
+        console.print("[red]This action cannot be undone![/red]\n")
 
         if not force:
             # First confirmation
             if not Confirm.ask(
                 "Are you sure you want to delete your account?", default=False
             ):
-                rprint("[green]Account deletion cancelled[/green]")
+                console.print("[green]Account deletion cancelled[/green]")
                 return
 
             # Second confirmation
@@ -359,7 +418,7 @@ def delete_account(force: bool) -> None:
                 f'Type your username "{user.username}" to confirm'
             )
             if confirm_username != user.username:
-                rprint("[red]Username does not match. Cancelling.[/red]")
+                console.print("[red]Username does not match. Cancelling.[/red]")
                 return
 
         # Get password
@@ -369,41 +428,45 @@ def delete_account(force: bool) -> None:
         if not force and not Confirm.ask(
             "[red]This is your last chance. Delete account?[/red]", default=False
         ):
-            rprint("[green]Account deletion cancelled[/green]")
+            console.print("[green]Account deletion cancelled[/green]")
             return
 
         # Delete account
         with console.status("Deleting account..."):
             result = client.delete_account(password)
+        invalidate_user_cache()
 
-        rprint("[green]✓ Account deleted successfully[/green]")
-        rprint(result.get("message", "Your account has been deleted"))
+        console.print("[green]✓ Account deleted successfully[/green]")
+        console.print(result.get("message", "Your account has been deleted"))
 
     except AuthenticationError:
-        rprint("[red]✗ Invalid password[/red]")
+        console.print("[red]✗ Invalid password[/red]")
         sys.exit(1)
     except Exception as e:
-        rprint(f"[red]✗ Error: {str(e)}[/red]")
+        console.print(f"[red]✗ Error: {str(e)}[/red]")
         sys.exit(1)
 
 
 @cli.command()
 def interactive():
     """Interactive mode with menu"""
+    from rich.prompt import Prompt
+
+    # Commands below resolve to this same cached client
+    client = get_client()
+
     while True:
         console.clear()
-        rprint("[bold]FullStack API CLI - Interactive Mode[/bold]\n")
-
-        client = get_client()
-        if client.is_authenticated():
-            try:
-                user = client.get_current_user()
-                rprint(f"[green]Logged in as: {user.username}[/green]\n")
-            except:
-                client.clear_tokens()
-                rprint("[yellow]Not logged in[/yellow]\n")
+        console.print("[bold]FullStack API CLI - Interactive Mode[/bold]\n")
+
+        try:
+            user = get_cached_user(client)
+        except Exception:
+            user = None
+        if user is not None:
+            console.print(f"[green]Logged in as: {user.username}[/green]\n")
         else:
-            rprint("[yellow]Not logged in[/yellow]\n")
+            console.print("[yellow]Not logged in[/yellow]\n")
 
         # Menu options
         options = [
@@ -419,7 +482,7 @@ def interactive():
         ]
 
         for option in options:
-            rprint(option)
+            console.print(option)
 
         choice = Prompt.ask(
             "\nSelect an option", choices=["0", "1", "2", "3", "4", "5", "6", "7", "8"]
@@ -429,7 +492,7 @@ def interactive():
 
         try:
             if choice == "0":
-                rprint("[yellow]Goodbye![/yellow]")
+                console.print("[yellow]Goodbye![/yellow]")
                 break
             elif choice == "1":
                 login()
@@ -451,7 +514,7 @@ def interactive():
         except SystemExit:
             pass  # Catch sys.exit() calls from commands
 
-        rprint("\n[dim]Press Enter to continue...[/dim]")
+        console.print("\n[dim]Press Enter to continue...[/dim]")
         input()
 
 
@@ -2,120 +2,150 @@
 """Generate API documentation in various formats."""
 
 import json
+import os
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the stdlib encoder
+    orjson = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Only the routes are needed; skip building the database engine
+os.environ.setdefault("SKIP_DB_INIT", "1")
+
 from app.api.main import app
 
+# Where the generated documents are written
+DOCS_DIR = Path(__file__).parent.parent / "docs" / "api"
+
+# Shared defaults for missing OpenAPI fields; never mutated
+_DEFAULT_TAGS = ("Other",)
+_EMPTY = {}
+
+# Placeholder JSON body shared by every Postman request that takes one
+_EXAMPLE_BODY = json.dumps({"example": "data"}, indent=2)
+
+
+def _write_json(output_path, data):
+    """Write data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        output_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
 
 def generate_openapi_json():
     """Generate OpenAPI JSON schema."""
     schema = app.openapi()
 
     # Save to file
-    output_path = Path(__file__).parent.parent / "docs" / "api" / "openapi.json"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, "w") as f:
-        json.dump(schema, f, indent=2)
+    output_path = DOCS_DIR / "openapi.json"
+    _write_json(output_path, schema)
 
     print(f"✅ OpenAPI schema saved to {output_path}")
     return schema
 
 
-def generate_markdown_docs(schema):
+def _group_by_tag(schema):
+    """Group operations by tag as ``tag -> [(path, method, operation)]``."""
+    tags = {}
+
+    paths = schema["paths"].items()
+    for path, methods in paths:
+        for method, operation in methods.items():
+            if method in ("get", "post", "put", "patch", "delete"):
+                for tag in operation.get("tags", _DEFAULT_TAGS):
+                    if tag not in tags:
+                        tags[tag] = []
+                    tags[tag].append((path, method, operation))
+
+    return tags
+
+
+def generate_markdown_docs(schema, tags):
     """Generate Markdown documentation from OpenAPI schema."""
-    output_path = Path(__file__).parent.parent / "docs" / "api" / "API_REFERENCE.md"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, "w") as f:
-        # Header
-        f.write(f"# {schema['info']['title']} API Reference\n\n")
-        f.write(f"Version: {schema['info']['version']}\n\n")
-        f.write(schema["info"]["description"])
-        f.write("\n\n")
-
-        # Servers
-        f.write("## Servers\n\n")
-        for server in schema["servers"]:
-            f.write(f"- **{server['description']}**: `{server['url']}`\n")
-        f.write("\n")
-
-        # Authentication
-        f.write("## Authentication\n\n")
-        f.write(
-            "This API uses JWT Bearer token authentication. Include the token in the Authorization header:\n\n"
-        )
-        f.write("```\nAuthorization: Bearer <your-token>\n```\n\n")
-
-        # Endpoints by tag
-        paths = schema["paths"]
-        tags = {}
-
-        # Group endpoints by tag
-        for path, methods in paths.items():
-            for method, operation in methods.items():
-                if method in ["get", "post", "put", "patch", "delete"]:
-                    tag_list = operation.get("tags", ["Other"])
-                    for tag in tag_list:
-                        if tag not in tags:
-                            tags[tag] = []
-                        tags[tag].append((path, method, operation))
-
-        # Write endpoints
-        f.write("## Endpoints\n\n")
-        for tag, endpoints in sorted(tags.items()):
-            f.write(f"### {tag}\n\n")
-
-            for path, method, operation in endpoints:
-                # Operation summary
-                f.write(f"#### {operation.get('summary', 'No summary')}\n\n")
-                f.write(f"`{method.upper()} {path}`\n\n")
-
-                # Description
-                if "description" in operation:
-                    f.write(f"{operation['description']}\n\n")
-
-                # Parameters
-                if "parameters" in operation:
-                    f.write("**Parameters:**\n\n")
-                    for param in operation["parameters"]:
-                        required = (
-                            "required" if param.get("required", False) else "optional"
-                        )
-                        f.write(
-                            f"- `{param['name']}` ({param['in']}, {required}): {param.get('description', 'No description')}\n"
-                        )
-                    f.write("\n")
-
-                # Request body
-                if "requestBody" in operation:
-                    f.write("**Request Body:**\n\n")
-                    content = operation["requestBody"].get("content", {})
-                    for content_type, media_type in content.items():
-                        if "schema" in media_type:
-                            schema_ref = media_type["schema"].get("$ref", "")
-                            if schema_ref:
-                                schema_name = schema_ref.split("/")[-1]
-                                f.write(f"Content-Type: `{content_type}`\n\n")
-                                f.write(f"Schema: `{schema_name}`\n\n")
-                    f.write("\n")
-
-                # Responses
-                f.write("**Responses:**\n\n")
-                for status_code, response in operation.get("responses", {}).items():
-                    f.write(
-                        f"- `{status_code}`: {response.get('description', 'No description')}\n"
+    output_path = DOCS_DIR / "API_REFERENCE.md"
+
+    # Collect the document and write it out once
+    parts = []
+    write = parts.append
+
+    # Header
+    write(f"# {schema['info']['title']} API Reference\n\n")
+    write(f"Version: {schema['info']['version']}\n\n")
+    write(schema["info"]["description"])
+    write("\n\n")
+
+    # Servers
+    write("## Servers\n\n")
+    for server in schema["servers"]:
+        write(f"- **{server['description']}**: `{server['url']}`\n")
+    write("\n")
+
+    # Authentication
+    write("## Authentication\n\n")
+    write(
+        "This API uses JWT Bearer token authentication. Include the token in the Authorization header:\n\n"
+    )
+    write("```\nAuthorization: Bearer <your-token>\n```\n\n")
+
+    # Write endpoints
+    write("## Endpoints\n\n")
+    for tag, endpoints in sorted(tags.items()):
+        write(f"### {tag}\n\n")
+
+        for path, method, operation in endpoints:
+            # Operation summary
+            write(f"#### {operation.get('summary', 'No summary')}\n\n")
+            write(f"`{method.upper()} {path}`\n\n")
+
+            # Description
+            if "description" in operation:
+                write(f"{operation['description']}\n\n")
+
+            # Parameters
+            if "parameters" in operation:
+                write("**Parameters:**\n\n")
+                for param in operation["parameters"]:
+                    required = (
+                        "required" if param.get("required", False) else "optional"
+                    )
+                    write(
+                        f"- `{param['name']}` ({param['in']}, {required}): {param.get('description', 'No description')}\n"
                     )
-                f.write("\n---\n\n")
+                write("\n")
+
+            # Request body
+            if "requestBody" in operation:
+                write("**Request Body:**\n\n")
+                content = operation["requestBody"].get("content", _EMPTY)
+                for content_type, media_type in content.items():
+                    if "schema" in media_type:
+                        schema_ref = media_type["schema"].get("$ref", "")
+                        if schema_ref:
+                            schema_name = schema_ref.split("/")[-1]
+                            write(f"Content-Type: `{content_type}`\n\n")
+                            write(f"Schema: `{schema_name}`\n\n")
+                write("\n")
+
+            # Responses
+            write("**Responses:**\n\n")
+            for status_code, response in operation.get("responses", _EMPTY).items():
+                write(
+                    f"- `{status_code}`: {response.get('description', 'No description')}\n"
+                )
+            write("\n---\n\n")
+
+    output_path.write_text("".join(parts), encoding="utf-8")
 
     print(f"✅ Markdown documentation saved to {output_path}")
 
 
-def generate_postman_collection(schema):
+def generate_postman_collection(schema, tags):
     """Generate Postman collection from OpenAPI schema."""
     collection = {
         "info": {
@@ -130,78 +160,81 @@ def generate_postman_collection(schema):
         ],
     }
 
-    # Group by tags
+    # Split each path into Postman URL parts once, however many operations
+    # and tags share it
+    urls = {
+        path: ("{{baseUrl}}" + path, path.strip("/").split("/"))
+        for path in schema["paths"]
+    }
+
+    # One folder per tag
     tag_folders = {}
 
-    for path, methods in schema["paths"].items():
-        for method, operation in methods.items():
-            if method in ["get", "post", "put", "patch", "delete"]:
-                tags = operation.get("tags", ["Other"])
-
-                for tag in tags:
-                    if tag not in tag_folders:
-                        tag_folders[tag] = {"name": tag, "item": []}
-
-                    # Create Postman request
-                    request = {
-                        "name": operation.get("summary", path),
-                        "request": {
-                            "method": method.upper(),
-                            "header": [],
-                            "url": {
-                                "raw": "{{baseUrl}}" + path,
-                                "host": ["{{baseUrl}}"],
-                                "path": path.strip("/").split("/"),
-                            },
-                            "description": operation.get("description", ""),
-                        },
+    for tag, endpoints in tags.items():
+        tag_folders[tag] = {"name": tag, "item": []}
+
+        for path, method, operation in endpoints:
+            raw_url, path_parts = urls[path]
+
+            # Create Postman request
+            request = {
+                "name": operation.get("summary", path),
+                "request": {
+                    "method": method.upper(),
+                    "header": [],
+                    "url": {
+                        "raw": raw_url,
+                        "host": ["{{baseUrl}}"],
+                        "path": path_parts,
+                    },
+                    "description": operation.get("description", ""),
+                },
+            }
+
+            # Add auth header if needed
+            if "security" in operation:
+                request["request"]["header"].append(
+                    {
+                        "key": "Authorization",
+                        "value": "Bearer {{accessToken}}",
+                        "type": "text",
+                    }
+                )
+
+            # Add request body if present
+            if "requestBody" in operation:
+                content = operation["requestBody"].get("content", _EMPTY)
+                if "application/json" in content:
+                    request["request"]["body"] = {
+                        "mode": "raw",
+                        "raw": _EXAMPLE_BODY,
+                        "options": {"raw": {"language": "json"}},
                     }
 
-                    # Add auth header if needed
-                    if "security" in operation:
-                        request["request"]["header"].append(
-                            {
-                                "key": "Authorization",
-                                "value": "Bearer {{accessToken}}",
-                                "type": "text",
-                            }
-                        )
-
-                    # Add request body if present
-                    if "requestBody" in operation:
-                        content = operation["requestBody"].get("content", {})
-                        if "application/json" in content:
-                            request["request"]["body"] = {
-                                "mode": "raw",
-                                "raw": json.dumps({"example": "data"}, indent=2),
-                                "options": {"raw": {"language": "json"}},
-                            }
-
-                    tag_folders[tag]["item"].append(request)
+            tag_folders[tag]["item"].append(request)
 
     # Add folders to collection
     collection["item"] = list(tag_folders.values())
 
     # Save collection
-    output_path = (
-        Path(__file__).parent.parent / "docs" / "api" / "postman_collection.json"
-    )
-    with open(output_path, "w") as f:
-        json.dump(collection, f, indent=2)
+    output_path = DOCS_DIR / "postman_collection.json"
+    _write_json(output_path, collection)
 
     print(f"✅ Postman collection saved to {output_path}")
 
 
 if __name__ == "__main__":
     print("🚀 Generating API documentation...")
+    DOCS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Generate OpenAPI JSON
     schema = generate_openapi_json()
+    tags = _group_by_tag(schema)
 
     # Generate Markdown docs
-    generate_markdown_docs(schema)
+    generate_markdown_docs(schema, tags)
 
     # Generate Postman collection
-    generate_postman_collection(schema)
+    generate_postman_collection(schema, tags)
 
     print("\n✨ API documentation generated successfully!")
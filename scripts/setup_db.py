@@ -3,7 +3,6 @@
 
 import asyncio
 import sys
-import time
 from pathlib import Path
 
 # Add parent directory to path
@@ -12,20 +11,54 @@ sys.path.append(str(Path(__file__).parent.parent))
 from app.db.init_db import check_db_connection, init_db  # noqa: E402
 
 
-async def wait_for_db(max_retries: int = 30, retry_interval: int = 2) -> bool:
-    """Wait for database to be ready."""
+async def probe_db(probes: int = 3, timeout: float = 5) -> bool:
+    """Run concurrent connection checks and report the first success."""
+    tasks = [asyncio.create_task(check_db_connection()) for _ in range(probes)]
+    try:
+        for next_result in asyncio.as_completed(tasks, timeout=timeout):
+            if await next_result:
+                return True
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return False
+
+
+async def wait_for_db(
+    max_retries: int = 30,
+    retry_interval: float = 2,
+    max_interval: float = 10,
+    probes: int = 3,
+    probe_timeout: float = 5,
+    timeout: float = 60,
+) -> bool:
+    """Wait for database to be ready.
+
+    Each attempt races ``probes`` connection checks for up to
+    ``probe_timeout`` seconds. Retries back off exponentially from
+    ``retry_interval`` up to ``max_interval`` seconds without blocking the
+    event loop. Waiting gives up after ``max_retries`` attempts or
+    ``timeout`` seconds, whichever comes first, so the backoff does not
+    stretch the overall wait beyond the fixed-interval budget.
+    """
     print("Waiting for database to be ready...")
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
 
     for i in range(max_retries):
-        if await check_db_connection():
+        if await probe_db(probes, probe_timeout):
             print("Database is ready!")
             return True
 
-        print(
-            f"Database not ready, retrying in {retry_interval}s... "
-            f"({i+1}/{max_retries})"
-        )
-        time.sleep(retry_interval)
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        delay = min(retry_interval * (1.5**i), max_interval, remaining)
+        print(f"Database not ready, retrying in {delay:g}s... ({i+1}/{max_retries})")
+        await asyncio.sleep(delay)
 
     print("Database connection failed after maximum retries")
     return False
@@ -2,90 +2,118 @@
 """Test API endpoints by analyzing the route definitions."""
 
 import ast
+import functools
 import re
 import sys
 from pathlib import Path
 
-# Add the project root to the path
-sys.path.append(str(Path(__file__).parent.parent / "src"))
+# Source files are analyzed without importing the app
+API_DIR = Path(__file__).parent.parent / "src/app/api"
+MAIN_FILE = API_DIR / "main.py"
+AUTH_FILE = API_DIR / "routes/auth.py"
+USERS_FILE = API_DIR / "routes/users.py"
+SCHEMAS_FILE = API_DIR / "schemas.py"
 
-from app.api.routes import auth, users
-from app.api.schemas import (
-    PasswordChange,
-    RefreshTokenRequest,
-    TokenResponse,
-    UserCreate,
-    UserLogin,
-    UserResponse,
-    UserUpdate,
-)
+# Output is collected here and written once by main()
+_OUT = []
 
 
-def extract_routes_from_module(module):
-    """Extract route information from a module."""
+def emit(*args):
+    """Queue a line of output, like print()."""
+    _OUT.append(" ".join(map(str, args)))
+
+
+def _flush():
+    """Write the queued output in one call."""
+    if _OUT:
+        sys.stdout.write("\n".join(_OUT) + "\n")
+        _OUT.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_bytes(path: str) -> bytes:
+    """Read a source file once per run.
+
+    Sources are scanned as bytes with ASCII patterns, so only the matched
+    names are ever decoded.
+    """
+    return Path(path).read_bytes()
+
+
+@functools.lru_cache(maxsize=None)
+def _parsed(source_file: str) -> ast.Module:
+    """Parse a source file once per run."""
+    return ast.parse(_read_bytes(source_file))
+
+
+def _literal(node):
+    """Evaluate a literal node, reading plain constants directly."""
+    if isinstance(node, ast.Constant):
+        return node.value
+    return ast.literal_eval(node)
+
+
+def extract_routes_from_file(source_file):
+    """Extract route information from a route module's source."""
     routes = []
 
-    # Get the source file
-    source_file = module.__file__
-    with open(source_file, "r") as f:
-        content = f.read()
-
-    # Parse the AST
-    tree = ast.parse(content)
-
-    # Find all decorated functions
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            for decorator in node.decorator_list:
-                # Check if it's a router decorator
-                if isinstance(decorator, ast.Call) and isinstance(
-                    decorator.func, ast.Attribute
+    # Parse the source file
+    tree = _parsed(str(source_file))
+
+    # Route handlers are module-level (async) functions
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            # Check if it's a router decorator
+            if isinstance(decorator, ast.Call) and isinstance(
+                decorator.func, ast.Attribute
+            ):
+                if (
+                    hasattr(decorator.func.value, "id")
+                    and decorator.func.value.id == "router"
                 ):
-                    if (
-                        hasattr(decorator.func.value, "id")
-                        and decorator.func.value.id == "router"
-                    ):
-                        method = decorator.func.attr.upper()
-
-                        # Extract path from first argument
-                        if decorator.args:
-                            path = ast.literal_eval(decorator.args[0])
-
-                            # Extract additional info from keywords
-                            response_model = None
-                            status_code = 200 if method != "POST" else 201
-                            summary = None
-
-                            for keyword in decorator.keywords:
-                                if keyword.arg == "response_model":
-                                    if hasattr(keyword.value, "id"):
-                                        response_model = keyword.value.id
-                                elif keyword.arg == "status_code":
-                                    if hasattr(keyword.value, "attr"):
-                                        status_code = keyword.value.attr
-                                elif keyword.arg == "summary":
-                                    summary = ast.literal_eval(keyword.value)
-
-                            routes.append(
-                                {
-                                    "method": method,
-                                    "path": path,
-                                    "function": node.name,
-                                    "response_model": response_model,
-                                    "status_code": status_code,
-                                    "summary": summary,
-                                }
-                            )
+                    method = decorator.func.attr.upper()
+
+                    # Extract path from first argument
+                    if decorator.args:
+                        path = _literal(decorator.args[0])
+
+                        # Extract additional info from keywords
+                        response_model = None
+                        status_code = 200 if method != "POST" else 201
+                        summary = None
+
+                        for keyword in decorator.keywords:
+                            if keyword.arg == "response_model":
+                                if hasattr(keyword.value, "id"):
+                                    response_model = keyword.value.id
+                            elif keyword.arg == "status_code":
+                                if hasattr(keyword.value, "attr"):
+                                    status_code = keyword.value.attr
+                            elif keyword.arg == "summary":
+                                summary = _literal(keyword.value)
+
+                        routes.append(
+                            {
+                                "method": method,
+                                "path": path,
+                                "function": node.name,
+                                "response_model": response_model,
+                                "status_code": status_code,
+                                "summary": summary,
+                            }
+                        )
 
     return routes
 
 
 def test_auth_endpoints():
     """Test authentication endpoints."""
-    print("\n🔐 Authentication Endpoints")
-    print("=" * 80)
+    emit("\n🔐 Authentication Endpoints")
+    emit("=" * 80)
 
-    auth_routes = extract_routes_from_module(auth)
+    auth_routes = extract_routes_from_file(AUTH_FILE)
 
     # Expected auth endpoints
     expected_endpoints = [
@@ -95,28 +123,26 @@ def test_auth_endpoints():
         ("POST", "/logout", "User logout"),
     ]
 
+    by_key = {(r["method"], r["path"]): r for r in auth_routes}
     for method, path, description in expected_endpoints:
-        found = any(r["method"] == method and r["path"] == path for r in auth_routes)
-        status = "✅" if found else "❌"
-        print(f"{status} {method:6} /api/v1/auth{path:20} - {description}")
-
-        if found:
-            route = next(
-                r for r in auth_routes if r["method"] == method and r["path"] == path
-            )
-            print(f"         Function: {route['function']}")
+        route = by_key.get((method, path))
+        status = "✅" if route is not None else "❌"
+        emit(f"{status} {method:6} /api/v1/auth{path:20} - {description}")
+
+        if route is not None:
+            emit(f"         Function: {route['function']}")
             if route["response_model"]:
-                print(f"         Response: {route['response_model']}")
+                emit(f"         Response: {route['response_model']}")
 
     return auth_routes
 
 
 def test_user_endpoints():
     """Test user management endpoints."""
-    print("\n👤 User Management Endpoints")
-    print("=" * 80)
+    emit("\n👤 User Management Endpoints")
+    emit("=" * 80)
 
-    user_routes = extract_routes_from_module(users)
+    user_routes = extract_routes_from_file(USERS_FILE)
 
     # Expected user endpoints
     expected_endpoints = [
@@ -126,122 +152,151 @@ def test_user_endpoints():
         ("DELETE", "/me", "Delete account"),
     ]
 
+    by_key = {(r["method"], r["path"]): r for r in user_routes}
     for method, path, description in expected_endpoints:
-        found = any(r["method"] == method and r["path"] == path for r in user_routes)
-        status = "✅" if found else "❌"
-        print(f"{status} {method:6} /api/v1/users{path:20} - {description}")
-
-        if found:
-            route = next(
-                r for r in user_routes if r["method"] == method and r["path"] == path
-            )
-            print(f"         Function: {route['function']}")
+        route = by_key.get((method, path))
+        status = "✅" if route is not None else "❌"
+        emit(f"{status} {method:6} /api/v1/users{path:20} - {description}")
+
+        if route is not None:
+            emit(f"         Function: {route['function']}")
             if route["response_model"]:
-                print(f"         Response: {route['response_model']}")
+                emit(f"         Response: {route['response_model']}")
 
     return user_routes
 
 
+@functools.lru_cache(maxsize=None)
+def _schema_classes():
+    """Map schema class names to their definitions in schemas.py."""
+    return {
+        node.name: node
+        for node in _parsed(str(SCHEMAS_FILE)).body
+        if isinstance(node, ast.ClassDef)
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(name):
+    """List a schema's fields, including those inherited within the module.
+
+    Cached per class, so a base shared by several schemas is walked once.
+    """
+    classes = _schema_classes()
+    node = classes[name]
+    fields = {}
+    for base in node.bases:
+        if isinstance(base, ast.Name) and base.id in classes:
+            fields.update(dict.fromkeys(_field_names(base.id)))
+    for stmt in node.body:
+        if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
+            fields[stmt.target.id] = None
+    return tuple(fields)
+
+
 def test_request_response_models():
     """Test request/response models."""
-    print("\n📦 Request/Response Models")
-    print("=" * 80)
+    emit("\n📦 Request/Response Models")
+    emit("=" * 80)
+
+    classes = _schema_classes()
 
     models = [
-        (UserCreate, "User Registration"),
-        (UserLogin, "User Login"),
-        (UserResponse, "User Response"),
-        (TokenResponse, "Token Response"),
-        (RefreshTokenRequest, "Refresh Token"),
-        (UserUpdate, "User Update"),
-        (PasswordChange, "Password Change"),
+        ("UserCreate", "User Registration"),
+        ("LoginRequest", "User Login"),
+        ("UserResponse", "User Response"),
+        ("LoginResponse", "Token Response"),
+        ("RefreshTokenRequest", "Refresh Token"),
+        ("UserUpdate", "User Update"),
+        ("PasswordChangeRequest", "Password Change"),
     ]
 
-    for model, description in models:
-        try:
-            # Create a sample instance to verify model
-            fields = model.__fields__
-            print(f"✅ {model.__name__:20} - {description}")
-            print(f"   Fields: {', '.join(fields.keys())}")
-        except Exception as e:
-            print(f"❌ {model.__name__:20} - Error: {e}")
+    for name, description in models:
+        if name not in classes:
+            emit(f"❌ {name:20} - Error: not defined in {SCHEMAS_FILE.name}")
+            continue
+        emit(f"✅ {name:20} - {description}")
+        emit(f"   Fields: {', '.join(_field_names(name))}")
+
+
+_SECURITY_RE = re.compile(rb"RateLimiter|CORSMiddleware|SecurityHeadersMiddleware")
+
+
+def _security_markers(content):
+    """Return the security markers present in content, in one scan."""
+    return set(_SECURITY_RE.findall(content))
 
 
 def test_endpoint_security():
     """Test endpoint security configurations."""
-    print("\n🔒 Security Configuration")
-    print("=" * 80)
+    emit("\n🔒 Security Configuration")
+    emit("=" * 80)
 
     # Read auth routes to check for security decorators
-    with open(Path(__file__).parent.parent / "src/app/api/routes/auth.py", "r") as f:
-        auth_content = f.read()
-
-    with open(Path(__file__).parent.parent / "src/app/api/routes/users.py", "r") as f:
-        users_content = f.read()
+    auth_content = _read_bytes(str(AUTH_FILE))
+    users_content = _read_bytes(str(USERS_FILE))
 
     # Check for rate limiting
     rate_limit_endpoints = []
-    if "RateLimiter" in auth_content:
+    if b"RateLimiter" in _security_markers(auth_content):
         rate_limit_endpoints.append("auth endpoints")
 
     # Check for authentication requirements
-    auth_required_count = users_content.count("get_current_user")
+    auth_required_count = users_content.count(b"get_current_user")
 
-    print(
+    emit(
         f"✅ Rate limiting configured on: {', '.join(rate_limit_endpoints) if rate_limit_endpoints else 'None detected'}"
     )
-    print(f"✅ Authentication required on: {auth_required_count} user endpoints")
+    emit(f"✅ Authentication required on: {auth_required_count} user endpoints")
 
     # Check for CORS configuration
-    with open(Path(__file__).parent.parent / "src/app/api/main.py", "r") as f:
-        main_content = f.read()
+    main_markers = _security_markers(_read_bytes(str(MAIN_FILE)))
 
-    if "CORSMiddleware" in main_content:
-        print("✅ CORS middleware configured")
+    if b"CORSMiddleware" in main_markers:
+        emit("✅ CORS middleware configured")
     else:
-        print("❌ CORS middleware not found")
+        emit("❌ CORS middleware not found")
 
-    if "SecurityHeadersMiddleware" in main_content:
-        print("✅ Security headers middleware configured")
+    if b"SecurityHeadersMiddleware" in main_markers:
+        emit("✅ Security headers middleware configured")
     else:
-        print("⚠️  Security headers middleware not found (may be handled by nginx)")
+        emit("⚠️  Security headers middleware not found (may be handled by nginx)")
 
 
 def test_api_documentation():
     """Test API documentation setup."""
-    print("\n📚 API Documentation")
-    print("=" * 80)
+    emit("\n📚 API Documentation")
+    emit("=" * 80)
 
-    with open(Path(__file__).parent.parent / "src/app/api/main.py", "r") as f:
-        main_content = f.read()
+    main_content = _read_bytes(str(MAIN_FILE))
 
     # Check for OpenAPI customization
-    if "custom_openapi" in main_content:
-        print("✅ Custom OpenAPI schema configured")
+    if b"custom_openapi" in main_content:
+        emit("✅ Custom OpenAPI schema configured")
     else:
-        print("⚠️  Using default OpenAPI schema")
+        emit("⚠️  Using default OpenAPI schema")
 
     # Check for API metadata
-    if "title=" in main_content:
-        title_match = re.search(r'title="([^"]+)"', main_content)
+    if b"title=" in main_content:
+        title_match = re.search(rb'title="([^"]+)"', main_content)
         if title_match:
-            print(f"✅ API Title: {title_match.group(1)}")
+            emit(f"✅ API Title: {title_match.group(1).decode()}")
 
-    if "version=" in main_content:
-        version_match = re.search(r'version="([^"]+)"', main_content)
+    if b"version=" in main_content:
+        version_match = re.search(rb'version="([^"]+)"', main_content)
         if version_match:
-            print(f"✅ API Version: {version_match.group(1)}")
+            emit(f"✅ API Version: {version_match.group(1).decode()}")
 
-    print("\n📍 API Documentation URLs:")
-    print("   - Swagger UI: http://localhost:8000/docs")
-    print("   - ReDoc: http://localhost:8000/redoc")
-    print("   - OpenAPI JSON: http://localhost:8000/openapi.json")
+    emit("\n📍 API Documentation URLs:")
+    emit("   - Swagger UI: http://localhost:8000/docs")
+    emit("   - ReDoc: http://localhost:8000/redoc")
+    emit("   - OpenAPI JSON: http://localhost:8000/openapi.json")
 
 
 def generate_curl_examples():
     """Generate example cURL commands."""
-    print("\n🚀 Example API Calls")
-    print("=" * 80)
+    emit("\n🚀 Example API Calls")
+    emit("=" * 80)
 
     examples = [
         {
@@ -284,14 +339,14 @@ def generate_curl_examples():
     ]
 
     for example in examples:
-        print(f"\n{example['name']}:")
-        print(example["curl"])
+        emit(f"\n{example['name']}:")
+        emit(example["curl"])
 
 
 def main():
     """Run all API endpoint tests."""
-    print("API Endpoint Test Suite")
-    print("=" * 80)
+    emit("API Endpoint Test Suite")
+    emit("=" * 80)
 
     try:
         # Test endpoints
@@ -312,20 +367,22 @@ def main():
 
         # Summary
         total_endpoints = len(auth_routes) + len(user_routes)
-        print("\n" + "=" * 80)
-        print(f"✅ Total endpoints found: {total_endpoints}")
-        print("\nTo test the API:")
-        print("1. Start the server: make serve-api")
-        print("2. Visit: http://localhost:8000/docs")
-        print("3. Use the interactive Swagger UI to test endpoints")
+        emit("\n" + "=" * 80)
+        emit(f"✅ Total endpoints found: {total_endpoints}")
+        emit("\nTo test the API:")
+        emit("1. Start the server: make serve-api")
+        emit("2. Visit: http://localhost:8000/docs")
+        emit("3. Use the interactive Swagger UI to test endpoints")
 
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        emit(f"\n❌ Error: {e}")
+        _flush()
         import traceback
 
         traceback.print_exc()
         return 1
 
+    _flush()
     return 0
 
 
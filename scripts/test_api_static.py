@@ -1,87 +1,108 @@
 #!/usr/bin/env python3
 """Test API endpoints by static analysis of route files."""
 
+import functools
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+API_DIR = Path(__file__).parent.parent / "src/app/api"
+AUTH_FILE = API_DIR / "routes/auth.py"
+USERS_FILE = API_DIR / "routes/users.py"
+SCHEMAS_FILE = API_DIR / "schemas.py"
+DEPS_FILE = API_DIR / "dependencies.py"
+MAIN_FILE = API_DIR / "main.py"
+SOURCE_FILES = (AUTH_FILE, USERS_FILE, SCHEMAS_FILE, DEPS_FILE, MAIN_FILE)
+
+# Output is collected here and written once by main()
+_OUT: List[str] = []
+
+
+def emit(*args) -> None:
+    """Queue a line of output, like print()."""
+    _OUT.append(" ".join(map(str, args)))
+
+
+def _flush() -> None:
+    """Write the queued output in one call."""
+    if _OUT:
+        sys.stdout.write("\n".join(_OUT) + "\n")
+        _OUT.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_bytes(path: str) -> bytes:
+    """Read a source file once per run.
+
+    Sources are scanned as bytes with ASCII patterns, so only the matched
+    names are ever decoded.
+    """
+    return Path(path).read_bytes()
+
+
+# HTTP methods the route scanner recognises
+_METHODS = ("get", "post", "put", "delete", "patch")
+
+# One pass per route: the decorator, response_model= and summary= from the
+# rest of the decorator line, the handler name and (without consuming it) the
+# span up to the end of the handler's multi-line signature
+_ROUTE_RE = re.compile(
+    rb"@router\.(?P<method>" + "|".join(_METHODS).encode() + rb")\s*\(\s*"
+    rb"[\"'](?P<path>[^\"']+)[\"']"
+    rb"(?=(?:[^\n]*?response_model=(?P<model>\w+))?)"
+    rb"(?=(?:[^\n]*?summary=[\"'](?P<summary>[^\"']+)[\"'])?)"
+    rb".*?async def (?P<func>\w+)\s*\("
+    rb"(?=(?P<signature>.*?\n\):)?)",
+    re.DOTALL,
+)
+
+# Schema class names, and the name fragments that mark request schemas
+_CLASS_RE = re.compile(rb"class (\w+).*?:")
+_REQUEST_SCHEMA_RE = re.compile(r"Request|Create|Update|Login|Change")
+
 
 def parse_route_file(file_path: Path) -> List[Dict[str, str]]:
     """Parse a route file to extract endpoint information."""
     endpoints = []
 
-    with open(file_path, "r") as f:
-        content = f.read()
-
-    # Pattern to match route decorators
-    # Matches: @router.get("/path", ...)
-    route_pattern = r'@router\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']'
-
-    # Pattern to match function definitions
-    func_pattern = r"async def (\w+)\s*\("
-
-    # Find all routes
-    route_matches = list(re.finditer(route_pattern, content))
-
-    for i, match in enumerate(route_matches):
-        method = match.group(1).upper()
-        path = match.group(2)
-
-        # Find the function name after this decorator
-        start_pos = match.end()
-        func_match = re.search(func_pattern, content[start_pos:])
-
-        if func_match:
-            func_name = func_match.group(1)
-
-            # Extract additional metadata from the decorator line
-            decorator_end = content.find("\n", match.start())
-            decorator_text = content[match.start() : decorator_end]
-
-            # Extract response_model
-            response_model = None
-            model_match = re.search(r"response_model=(\w+)", decorator_text)
-            if model_match:
-                response_model = model_match.group(1)
-
-            # Extract summary
-            summary = None
-            summary_match = re.search(r'summary=["\']([^"\']+)["\']', decorator_text)
-            if summary_match:
-                summary = summary_match.group(1)
-
-            # Check if it requires authentication
-            func_end = content.find("\n):", start_pos)
-            func_signature = (
-                content[start_pos:func_end]
-                if func_end > 0
-                else content[start_pos : start_pos + 200]
-            )
-            requires_auth = (
-                "current_user" in func_signature or "get_current_user" in func_signature
-            )
-
-            endpoints.append(
-                {
-                    "method": method,
-                    "path": path,
-                    "function": func_name,
-                    "response_model": response_model,
-                    "summary": summary,
-                    "requires_auth": requires_auth,
-                }
-            )
+    content = _read_bytes(str(file_path))
+
+    for match in _ROUTE_RE.finditer(content):
+        # Check if it requires authentication
+        start_pos = match.end("path") + 1
+        func_end = match.end("signature")
+        func_signature = (
+            content[start_pos:func_end]
+            if func_end > 0
+            else content[start_pos : start_pos + 200]
+        )
+        requires_auth = (
+            b"current_user" in func_signature or b"get_current_user" in func_signature
+        )
+
+        model, summary = match["model"], match["summary"]
+        endpoints.append(
+            {
+                "method": match["method"].decode().upper(),
+                "path": match["path"].decode(),
+                "function": match["func"].decode(),
+                "response_model": model.decode() if model else None,
+                "summary": summary.decode() if summary else None,
+                "requires_auth": requires_auth,
+            }
+        )
 
     return endpoints
 
 
 def test_auth_routes():
     """Test authentication routes."""
-    print("\n🔐 Authentication Endpoints (/api/v1/auth)")
-    print("=" * 80)
+    emit("\n🔐 Authentication Endpoints (/api/v1/auth)")
+    emit("=" * 80)
 
-    auth_file = Path(__file__).parent.parent / "src/app/api/routes/auth.py"
-    endpoints = parse_route_file(auth_file)
+    endpoints = parse_route_file(AUTH_FILE)
 
     expected = [
         ("POST", "/register", "User registration"),
@@ -90,31 +111,28 @@ def test_auth_routes():
         ("POST", "/logout", "User logout"),
     ]
 
+    by_key = {(ep["method"], ep["path"]): ep for ep in endpoints}
     for method, path, desc in expected:
-        found = False
-        for ep in endpoints:
-            if ep["method"] == method and ep["path"] == path:
-                found = True
-                auth_str = "🔓" if not ep["requires_auth"] else "🔒"
-                print(f"✅ {auth_str} {method:6} {path:20} - {desc}")
-                print(f"     Function: {ep['function']}")
-                if ep["response_model"]:
-                    print(f"     Response: {ep['response_model']}")
-                break
-
-        if not found:
-            print(f"❌ {method:6} {path:20} - {desc} [NOT FOUND]")
+        ep = by_key.get((method, path))
+        if ep is None:
+            emit(f"❌ {method:6} {path:20} - {desc} [NOT FOUND]")
+            continue
+
+        auth_str = "🔓" if not ep["requires_auth"] else "🔒"
+        emit(f"✅ {auth_str} {method:6} {path:20} - {desc}")
+        emit(f"     Function: {ep['function']}")
+        if ep["response_model"]:
+            emit(f"     Response: {ep['response_model']}")
 
     return endpoints
 
 
 def test_user_routes():
     """Test user management routes."""
-    print("\n👤 User Management Endpoints (/api/v1/users)")
-    print("=" * 80)
+    emit("\n👤 User Management Endpoints (/api/v1/users)")
+    emit("=" * 80)
 
-    users_file = Path(__file__).parent.parent / "src/app/api/routes/users.py"
-    endpoints = parse_route_file(users_file)
+    endpoints = parse_route_file(USERS_FILE)
 
     expected = [
         ("GET", "/me", "Get current user"),
@@ -123,116 +141,100 @@ def test_user_routes():
         ("DELETE", "/me", "Delete account"),
     ]
 
+    by_key = {(ep["method"], ep["path"]): ep for ep in endpoints}
     for method, path, desc in expected:
-        found = False
-        for ep in endpoints:
-            if ep["method"] == method and ep["path"] == path:
-                found = True
-                auth_str = "🔓" if not ep["requires_auth"] else "🔒"
-                print(f"✅ {auth_str} {method:6} {path:20} - {desc}")
-                print(f"     Function: {ep['function']}")
-                if ep["response_model"]:
-                    print(f"     Response: {ep['response_model']}")
-                break
-
-        if not found:
-            print(f"❌ {method:6} {path:20} - {desc} [NOT FOUND]")
+        ep = by_key.get((method, path))
+        if ep is None:
+            emit(f"❌ {method:6} {path:20} - {desc} [NOT FOUND]")
+            continue
+
+        auth_str = "🔓" if not ep["requires_auth"] else "🔒"
+        emit(f"✅ {auth_str} {method:6} {path:20} - {desc}")
+        emit(f"     Function: {ep['function']}")
+        if ep["response_model"]:
+            emit(f"     Response: {ep['response_model']}")
 
     return endpoints
 
 
 def analyze_schemas():
     """Analyze Pydantic schemas."""
-    print("\n📦 Request/Response Schemas")
-    print("=" * 80)
-
-    schemas_file = Path(__file__).parent.parent / "src/app/api/schemas.py"
-
-    with open(schemas_file, "r") as f:
-        content = f.read()
-
-    # Extract class definitions
-    class_pattern = r"class (\w+).*?:"
-    classes = re.findall(class_pattern, content)
-
-    # Categorize schemas
-    request_schemas = [
-        c
-        for c in classes
-        if "Request" in c
-        or "Create" in c
-        or "Update" in c
-        or "Login" in c
-        or "Change" in c
-    ]
-    response_schemas = [c for c in classes if "Response" in c]
-    base_schemas = [
-        c for c in classes if c not in request_schemas and c not in response_schemas
-    ]
-
-    print("Request Schemas:")
+    emit("\n📦 Request/Response Schemas")
+    emit("=" * 80)
+
+    content = _read_bytes(str(SCHEMAS_FILE))
+
+    # Extract class definitions and categorize them in one pass; a name can
+    # be both a request and a response schema (e.g. LoginResponse)
+    request_schemas, response_schemas, base_schemas = [], [], []
+    for c in map(bytes.decode, _CLASS_RE.findall(content)):
+        is_request = _REQUEST_SCHEMA_RE.search(c) is not None
+        is_response = "Response" in c
+        if is_request:
+            request_schemas.append(c)
+        if is_response:
+            response_schemas.append(c)
+        if not (is_request or is_response):
+            base_schemas.append(c)
+
+    emit("Request Schemas:")
     for schema in sorted(request_schemas):
-        print(f"  ✅ {schema}")
+        emit(f"  ✅ {schema}")
 
-    print("\nResponse Schemas:")
+    emit("\nResponse Schemas:")
     for schema in sorted(response_schemas):
-        print(f"  ✅ {schema}")
+        emit(f"  ✅ {schema}")
 
     if base_schemas:
-        print("\nBase/Other Schemas:")
+        emit("\nBase/Other Schemas:")
         for schema in sorted(base_schemas):
-            print(f"  ✅ {schema}")
+            emit(f"  ✅ {schema}")
 
 
 def analyze_dependencies():
     """Analyze API dependencies and middleware."""
-    print("\n🔧 Dependencies & Middleware")
-    print("=" * 80)
-
-    deps_file = Path(__file__).parent.parent / "src/app/api/dependencies.py"
-    main_file = Path(__file__).parent.parent / "src/app/api/main.py"
+    emit("\n🔧 Dependencies & Middleware")
+    emit("=" * 80)
 
     # Check dependencies
-    with open(deps_file, "r") as f:
-        deps_content = f.read()
+    deps_content = _read_bytes(str(DEPS_FILE))
 
     deps_found = []
-    if "get_current_user" in deps_content:
+    if b"get_current_user" in deps_content:
         deps_found.append("Authentication (get_current_user)")
-    if "get_current_active_user" in deps_content:
+    if b"get_current_active_user" in deps_content:
         deps_found.append("Active user check")
-    if "RateLimiter" in deps_content:
+    if b"RateLimiter" in deps_content:
         deps_found.append("Rate limiting")
-    if "get_db" in deps_content:
+    if b"get_db" in deps_content:
         deps_found.append("Database session")
 
-    print("Dependencies:")
+    emit("Dependencies:")
     for dep in deps_found:
-        print(f"  ✅ {dep}")
+        emit(f"  ✅ {dep}")
 
     # Check middleware
-    with open(main_file, "r") as f:
-        main_content = f.read()
+    main_content = _read_bytes(str(MAIN_FILE))
 
     middleware_found = []
-    if "CORSMiddleware" in main_content:
+    if b"CORSMiddleware" in main_content:
         middleware_found.append("CORS")
-    if "TrustedHostMiddleware" in main_content:
+    if b"TrustedHostMiddleware" in main_content:
         middleware_found.append("Trusted Host")
-    if "SecurityHeadersMiddleware" in main_content:
+    if b"SecurityHeadersMiddleware" in main_content:
         middleware_found.append("Security Headers")
-    if "RequestValidationError" in main_content:
+    if b"RequestValidationError" in main_content:
         middleware_found.append("Validation Error Handler")
 
-    print("\nMiddleware:")
+    emit("\nMiddleware:")
     for mw in middleware_found:
-        print(f"  ✅ {mw}")
+        emit(f"  ✅ {mw}")
 
 
 def generate_api_test_plan():
     """Generate a test plan for manual API testing."""
-    print("\n📋 Manual API Test Plan")
-    print("=" * 80)
+    emit("\n📋 Manual API Test Plan")
+    emit("=" * 80)
 
     test_scenarios = [
         {
@@ -288,15 +290,15 @@ def generate_api_test_plan():
     ]
 
     for scenario in test_scenarios:
-        print(f"\n{scenario['name']}:")
+        emit(f"\n{scenario['name']}:")
         for step in scenario["steps"]:
-            print(f"  □ {step}")
+            emit(f"  □ {step}")
 
 
 def generate_postman_collection():
     """Generate a basic Postman collection structure."""
-    print("\n📮 Postman Collection Template")
-    print("=" * 80)
+    emit("\n📮 Postman Collection Template")
+    emit("=" * 80)
 
     collection = {
         "info": {
@@ -314,22 +316,27 @@ def generate_postman_collection():
         ],
     }
 
-    print("Create a Postman collection with:")
-    print(f"  - Base URL: {{base_url}}")
-    print(f"  - Auth: Bearer Token ({{access_token}})")
-    print(f"  - Variables: access_token, refresh_token")
-    print("\nOr import the OpenAPI spec directly:")
-    print("  1. Start the API server")
-    print("  2. In Postman: Import > Link > http://localhost:8000/openapi.json")
+    emit("Create a Postman collection with:")
+    emit(f"  - Base URL: {{base_url}}")
+    emit(f"  - Auth: Bearer Token ({{access_token}})")
+    emit(f"  - Variables: access_token, refresh_token")
+    emit("\nOr import the OpenAPI spec directly:")
+    emit("  1. Start the API server")
+    emit("  2. In Postman: Import > Link > http://localhost:8000/openapi.json")
 
 
 def main():
     """Run all API tests."""
-    print("API Endpoint Static Analysis")
-    print("=" * 80)
-    print("Analyzing API routes without running the server...")
+    emit("API Endpoint Static Analysis")
+    emit("=" * 80)
+    emit("Analyzing API routes without running the server...")
 
     try:
+        # Read every source file concurrently up front; the analysis below
+        # then runs in order against the cache, keeping the report ordered
+        with ThreadPoolExecutor(max_workers=len(SOURCE_FILES)) as pool:
+            list(pool.map(_read_bytes, map(str, SOURCE_FILES)))
+
         # Test routes
         auth_endpoints = test_auth_routes()
         user_endpoints = test_user_routes()
@@ -352,28 +359,28 @@ def main():
             1 for ep in auth_endpoints + user_endpoints if ep["requires_auth"]
         )
 
-        print("\n" + "=" * 80)
-        print("📊 Summary:")
-        print(f"  - Total endpoints: {total_endpoints}")
-        print(f"  - Public endpoints: {total_endpoints - auth_required}")
-        print(f"  - Protected endpoints: {auth_required}")
-        print("\n🚀 Next Steps:")
-        print("  1. Start PostgreSQL: docker-compose up -d db")
-        print("  2. Run migrations: make migrate")
-        print("  3. Start API: make serve-api")
-        print("  4. Test endpoints: http://localhost:8000/docs")
+        emit("\n" + "=" * 80)
+        emit("📊 Summary:")
+        emit(f"  - Total endpoints: {total_endpoints}")
+        emit(f"  - Public endpoints: {total_endpoints - auth_required}")
+        emit(f"  - Protected endpoints: {auth_required}")
+        emit("\n🚀 Next Steps:")
+        emit("  1. Start PostgreSQL: docker-compose up -d db")
+        emit("  2. Run migrations: make migrate")
+        emit("  3. Start API: make serve-api")
+        emit("  4. Test endpoints: http://localhost:8000/docs")
 
     except Exception as e:
-        print(f"\n❌ Error: {e}")
+        emit(f"\n❌ Error: {e}")
+        _flush()
         import traceback
 
         traceback.print_exc()
         return 1
 
+    _flush()
     return 0
 
 
 if __name__ == "__main__":
-    import sys
-
     sys.exit(main())
@@ -7,15 +7,30 @@ from pathlib import Path
 # Add the project root to the path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_mock_engine
 from sqlalchemy.schema import CreateTable
 
 from app.db.models import AuditLog, Base, LoginAttempt, RefreshToken, User
 
+# Output is collected here and written once by main()
+_OUT = []
+
+
+def emit(*args):
+    """Queue a line of output, like print()."""
+    _OUT.append(" ".join(map(str, args)))
+
+
+def _flush():
+    """Write the queued output in one call."""
+    if _OUT:
+        sys.stdout.write("\n".join(_OUT) + "\n")
+        _OUT.clear()
+
 
 def test_model_definitions():
     """Test that all models are properly defined."""
-    print("Testing model definitions...")
+    emit("Testing model definitions...")
 
     models = {
         "User": User,
@@ -25,67 +40,72 @@ def test_model_definitions():
     }
 
     for name, model in models.items():
-        print(f"\n{name} ({model.__tablename__}):")
+        emit(f"\n{name} ({model.__tablename__}):")
 
         # Check columns
-        mapper = inspect(model)
-        print("  Columns:")
-        for column in mapper.columns:
-            col_type = str(column.type)
-            nullable = "NULL" if column.nullable else "NOT NULL"
-            print(f"    - {column.name}: {col_type} {nullable}")
+        table = model.__table__
+        mapper = model.__mapper__
+        rows = ["  Columns:"]
+        rows += [
+            f"    - {c.name}: {c.type!s} {'NULL' if c.nullable else 'NOT NULL'}"
+            for c in table.columns
+        ]
 
         # Check relationships
         if mapper.relationships:
-            print("  Relationships:")
-            for rel in mapper.relationships:
-                print(f"    - {rel.key} -> {rel.mapper.class_.__name__}")
+            rows.append("  Relationships:")
+            rows += [
+                f"    - {rel.key} -> {rel.mapper.class_.__name__}"
+                for rel in mapper.relationships
+            ]
 
         # Check indexes
-        if model.__table__.indexes:
-            print("  Indexes:")
-            for idx in model.__table__.indexes:
-                cols = ", ".join([c.name for c in idx.columns])
-                print(f"    - {idx.name}: ({cols})")
+        if table.indexes:
+            rows.append("  Indexes:")
+            rows += [
+                f"    - {idx.name}: ({', '.join(c.name for c in idx.columns)})"
+                for idx in table.indexes
+            ]
+
+        emit("\n".join(rows))
 
 
 def generate_sql_statements():
     """Generate SQL CREATE statements for all tables."""
-    print("\n\nGenerated SQL statements:")
-    print("=" * 80)
+    emit("\n\nGenerated SQL statements:")
+    emit("=" * 80)
 
-    # Create a dummy engine (we won't actually connect)
-    engine = create_engine(
-        "postgresql://dummy", strategy="mock", executor=lambda *a, **kw: None
-    )
+    def executor(sql, *multiparams, **params):
+        if isinstance(sql, CreateTable):
+            emit(f"\n-- Table: {sql.element.name}")
+        emit(f"{str(sql.compile(dialect=engine.dialect)).strip()};")
 
-    # Generate CREATE TABLE statements
-    for table_name, table in Base.metadata.tables.items():
-        print(f"\n-- Table: {table_name}")
-        print(CreateTable(table).compile(engine))
+    # Emit all DDL in dependency order through a mock engine (no connection)
+    engine = create_mock_engine("postgresql://", executor)
+    Base.metadata.create_all(engine, checkfirst=False)
+
+
+def _table_stats(table):
+    """Return a table's FK columns, indexed columns and self-reference flag."""
+    fk_columns = {fk.parent.name for fk in table.foreign_keys}
+    indexed_columns = {c.name for idx in table.indexes for c in idx.columns}
+    self_referential = any(fk.column.table is table for fk in table.foreign_keys)
+    return fk_columns, indexed_columns, self_referential
 
 
 def check_migration_compatibility():
     """Check for common migration issues."""
-    print("\n\nChecking for potential migration issues...")
+    emit("\n\nChecking for potential migration issues...")
 
     issues = []
-
-    # Check for circular dependencies
-    for table_name, table in Base.metadata.tables.items():
-        for fk in table.foreign_keys:
-            ref_table = fk.column.table.name
-            if ref_table == table_name:
-                issues.append(f"Self-referential foreign key in {table_name}")
-
-    # Check for missing indexes on foreign keys
     for table_name, table in Base.metadata.tables.items():
-        fk_columns = {fk.parent.name for fk in table.foreign_keys}
-        indexed_columns = set()
+        fk_columns, indexed_columns, self_referential = _table_stats(table)
 
-        for idx in table.indexes:
-            indexed_columns.update(c.name for c in idx.columns)
+        # Check for circular dependencies
+        if self_referential:
+            issues.append(f"Self-referential foreign key in {table_name}")
 
+        # Check for missing indexes on foreign keys
         missing_indexes = fk_columns - indexed_columns
         if missing_indexes:
             issues.append(
@@ -93,31 +113,33 @@ def check_migration_compatibility():
             )
 
     if issues:
-        print("  Found issues:")
+        emit("  Found issues:")
         for issue in issues:
-            print(f"  - {issue}")
+            emit(f"  - {issue}")
     else:
-        print("  No issues found!")
+        emit("  No issues found!")
 
 
 def main():
     """Run all tests."""
-    print("Database Migration Test Script")
-    print("=" * 80)
+    emit("Database Migration Test Script")
+    emit("=" * 80)
 
     try:
         test_model_definitions()
         generate_sql_statements()
         check_migration_compatibility()
 
-        print("\n\nAll tests passed! ✅")
-        print("\nTo create the initial migration, run:")
-        print("  make migrate-create")
-        print("\nTo apply migrations, run:")
-        print("  make migrate")
+        emit("\n\nAll tests passed! ✅")
+        emit("\nTo create the initial migration, run:")
+        emit("  make migrate-create")
+        emit("\nTo apply migrations, run:")
+        emit("  make migrate")
+        _flush()
 
     except Exception as e:
-        print(f"\n\nError: {e}")
+        emit(f"\n\nError: {e}")
+        _flush()
         import traceback
 
         traceback.print_exc()
@@ -1,71 +1,214 @@
 #!/usr/bin/env python3
 """Validate Docker configurations for the full-stack template."""
 
+import functools
 import os
 import re
 import sys
 from pathlib import Path
-
-import yaml
+from typing import Optional
+
+# Markers each file check looks for; all of them are found in a single scan
+DOCKERFILE_MARKERS = (
+    "USER",
+    "HEALTHCHECK",
+    "--chown=",
+    "apt-get upgrade",
+    "apk upgrade",
+    "apt-get",
+    "rm -rf /var/lib/apt/lists/*",
+)
+NGINX_SECURITY_HEADERS = (
+    "X-Frame-Options",
+    "X-Content-Type-Options",
+    "X-XSS-Protection",
+    "Strict-Transport-Security",
+)
+NGINX_MARKERS = NGINX_SECURITY_HEADERS + ("limit_req", "gzip on", "ssl_protocols")
+RECOMMENDED_IGNORES = (
+    "__pycache__",
+    "*.pyc",
+    ".env",
+    ".git",
+    "node_modules",
+    "dist",
+    "coverage",
+    ".pytest_cache",
+    "venv",
+)
+REQUIRED_FILES = (
+    "requirements.txt",
+    "ui/package.json",
+    ".dockerignore",
+    ".env.example",
+)
+REQUIRED_ENV_VARS = (
+    "DATABASE_URL",
+    "SECRET_KEY",
+    "POSTGRES_USER",
+    "POSTGRES_PASSWORD",
+    "POSTGRES_DB",
+)
+
+
+# Output is collected here and written once by main()
+_OUT = []
+
+
+def emit(*args):
+    """Queue a line of output, like print()."""
+    _OUT.append(" ".join(map(str, args)))
+
+
+def _flush():
+    """Write the queued output in one call."""
+    if _OUT:
+        sys.stdout.write("\n".join(_OUT) + "\n")
+        _OUT.clear()
+
+
+def _marker_pattern(markers: tuple[str, ...]) -> re.Pattern:
+    """Compile markers into one alternation matched at every offset.
+
+    The lookahead keeps overlapping markers from hiding one another, and
+    longer markers are tried first where one is a prefix of another.
+    """
+    ordered = sorted((m.encode() for m in markers), key=len, reverse=True)
+    return re.compile(b"(?=(%s))" % b"|".join(map(re.escape, ordered)))
+
+
+_DOCKERFILE_RE = _marker_pattern(DOCKERFILE_MARKERS)
+_NGINX_RE = _marker_pattern(NGINX_MARKERS)
+_DOCKERIGNORE_RE = _marker_pattern(RECOMMENDED_IGNORES)
+# Build stages are the FROM instructions that start a line
+_FROM_RE = re.compile(rb"^\s*FROM\b", re.M | re.I)
+# Variable names assigned in an env file, e.g. "NAME=value" or "export NAME=value"
+_ENV_NAME_RE = re.compile(rb"^[ \t]*(?:export[ \t]+)?([A-Za-z_]\w*)[ \t]*=", re.M)
+
+
+@functools.lru_cache(maxsize=None)
+def read_cached(path: str) -> Optional[bytes]:
+    """Read a file's bytes once per run, or None if it does not exist."""
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_entries(directory: str) -> frozenset[str]:
+    """List a directory's entry names with a single scandir call."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def exists_cached(path: str) -> bool:
+    """Check that a path exists, sharing one listing per parent directory."""
+    path = Path(path)
+    return path.name in _dir_entries(str(path.parent))
+
+
+@functools.lru_cache(maxsize=None)
+def find_markers(path: str, pattern: re.Pattern) -> Optional[frozenset[str]]:
+    """Collect the markers of pattern present in a file, in one pass.
+
+    Returns None if the file does not exist. Only matched markers are
+    decoded.
+    """
+    content = read_cached(path)
+    if content is None:
+        return None
+    # findall() gathers the matched markers in C; each distinct one is
+    # decoded once, however often it occurs
+    return frozenset(marker.decode() for marker in set(pattern.findall(content)))
 
 
 def check_dockerfile(dockerfile_path: Path, service_name: str) -> list[str]:
     """Check Dockerfile for best practices."""
     issues = []
 
-    if not dockerfile_path.exists():
+    found = find_markers(str(dockerfile_path), _DOCKERFILE_RE)
+    if found is None:
         return [f"Dockerfile not found: {dockerfile_path}"]
 
-    content = dockerfile_path.read_text()
-    lines = content.splitlines()
-
     # Check for multi-stage build
-    if content.count("FROM") < 2:
+    if len(_FROM_RE.findall(read_cached(str(dockerfile_path)))) < 2:
         issues.append(
             f"{service_name}: Not using multi-stage build (recommended for smaller images)"
         )
 
     # Check for non-root user
-    if "USER" not in content:
+    if "USER" not in found:
         issues.append(f"{service_name}: Running as root (security risk)")
 
     # Check for HEALTHCHECK
-    if "HEALTHCHECK" not in content:
+    if "HEALTHCHECK" not in found:
         issues.append(f"{service_name}: No HEALTHCHECK defined")
 
     # Check for proper COPY with chown
-    if service_name == "API" and "--chown=" not in content:
+    if service_name == "API" and "--chown=" not in found:
         issues.append(
             f"{service_name}: COPY without --chown may create permission issues"
         )
 
     # Check for security updates
-    if "apt-get upgrade" not in content and "apk upgrade" not in content:
+    if "apt-get upgrade" not in found and "apk upgrade" not in found:
         issues.append(f"{service_name}: Not applying security updates")
 
-    # Check for cache cleanup
-    if "apt-get" in content and "rm -rf /var/lib/apt/lists/*" not in content:
+    # Check for cache cleanup ("apt-get upgrade" also counts as using apt-get)
+    uses_apt = "apt-get" in found or "apt-get upgrade" in found
+    if uses_apt and "rm -rf /var/lib/apt/lists/*" not in found:
         issues.append(f"{service_name}: Not cleaning apt cache")
 
     return issues
 
 
+@functools.lru_cache(maxsize=None)
+def load_compose(path: str, mtime_ns: int) -> dict:
+    """Parse a compose file, reusing the result until the file changes.
+
+    The returned mapping is shared between callers and must not be mutated.
+    PyYAML is imported here, so runs that never load a compose file skip it.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader
+
+    return yaml.load(Path(path).read_bytes(), Loader=SafeLoader) or {}
+
+
+def _environment(service: dict) -> dict:
+    """Return a service's environment as a dict, in either compose form."""
+    env = service.get("environment") or {}
+    if isinstance(env, list):
+        env = dict(item.split("=", 1) if "=" in item else (item, None) for item in env)
+    return env
+
+
 def check_docker_compose(compose_path: Path) -> list[str]:
     """Check docker-compose.yml for best practices."""
     issues = []
 
-    if not compose_path.exists():
+    try:
+        mtime_ns = compose_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return ["docker-compose.yml not found"]
 
-    with open(compose_path, "r") as f:
-        compose = yaml.safe_load(f)
+    compose = load_compose(str(compose_path), mtime_ns)
 
-    services = compose.get("services", {})
+    services = compose.get("services") or {}
+    db = services.get("db")
+    api = services.get("api")
+    frontend = services.get("frontend")
 
     # Check database service
-    if "db" in services:
-        db = services["db"]
-
+    if db is not None:
         # Check for persistent volume
         if "volumes" not in db:
             issues.append("Database: No persistent volume configured")
@@ -75,34 +218,31 @@ def check_docker_compose(compose_path: Path) -> list[str]:
             issues.append("Database: No healthcheck configured")
 
         # Check environment variables
-        env = db.get("environment", {})
-        if "POSTGRES_PASSWORD" in env and env["POSTGRES_PASSWORD"] == "password":
+        env = _environment(db)
+        if env.get("POSTGRES_PASSWORD") == "password":
             issues.append("Database: Using default password (security risk)")
 
     # Check API service
-    if "api" in services:
-        api = services["api"]
-
+    if api is not None:
         # Check depends_on with condition
-        depends = api.get("depends_on", {})
+        depends = api.get("depends_on") or {}
         if isinstance(depends, dict) and "db" in depends:
             if "condition" not in depends["db"]:
                 issues.append("API: Not waiting for database health")
 
         # Check environment variables
-        env = api.get("environment", {})
+        env = _environment(api)
         if "DATABASE_URL" not in env:
             issues.append("API: DATABASE_URL not configured")
 
-        if "SECRET_KEY" in env and "change-this" in str(env["SECRET_KEY"]):
+        secret_key = env.get("SECRET_KEY")
+        if secret_key is not None and "change-this" in str(secret_key):
             issues.append("API: Using default SECRET_KEY (security risk)")
 
     # Check frontend service
-    if "frontend" in services:
-        frontend = services["frontend"]
-
+    if frontend is not None:
         # Check API URL configuration
-        env = frontend.get("environment", {})
+        env = _environment(frontend)
         if "VITE_API_URL" not in env:
             issues.append("Frontend: VITE_API_URL not configured")
 
@@ -117,33 +257,25 @@ def check_nginx_config(nginx_path: Path) -> list[str]:
     """Check nginx configuration."""
     issues = []
 
-    if not nginx_path.exists():
+    found = find_markers(str(nginx_path), _NGINX_RE)
+    if found is None:
         return ["nginx.conf not found"]
 
-    content = nginx_path.read_text()
-
     # Check for security headers
-    security_headers = [
-        "X-Frame-Options",
-        "X-Content-Type-Options",
-        "X-XSS-Protection",
-        "Strict-Transport-Security",
-    ]
-
-    for header in security_headers:
-        if header not in content:
+    for header in NGINX_SECURITY_HEADERS:
+        if header not in found:
             issues.append(f"Nginx: Missing security header {header}")
 
     # Check for rate limiting
-    if "limit_req" not in content:
+    if "limit_req" not in found:
         issues.append("Nginx: No rate limiting configured")
 
     # Check for gzip compression
-    if "gzip on" not in content:
+    if "gzip on" not in found:
         issues.append("Nginx: Gzip compression not enabled")
 
     # Check for SSL configuration
-    if "ssl_protocols" not in content:
+    if "ssl_protocols" not in found:
         issues.append("Nginx: No SSL configuration (needed for production)")
 
     return issues
@@ -153,15 +285,8 @@ def check_requirements() -> list[str]:
     """Check if required files exist."""
     issues = []
 
-    required_files = [
-        "requirements.txt",
-        "ui/package.json",
-        ".dockerignore",
-        ".env.example",
-    ]
-
-    for file in required_files:
-        if not Path(file).exists():
+    for file in REQUIRED_FILES:
+        if not exists_cached(file):
             issues.append(f"Missing required file: {file}")
 
     return issues
@@ -171,21 +296,13 @@ def validate_env_example() -> list[str]:
     """Check .env.example for required variables."""
     issues = []
 
-    env_path = Path(".env.example")
-    if not env_path.exists():
+    content = read_cached(".env.example")
+    if content is None:
         return ["Missing .env.example file"]
+    defined = {name.decode() for name in set(_ENV_NAME_RE.findall(content))}
 
-    content = env_path.read_text()
-    required_vars = [
-        "DATABASE_URL",
-        "SECRET_KEY",
-        "POSTGRES_USER",
-        "POSTGRES_PASSWORD",
-        "POSTGRES_DB",
-    ]
-
-    for var in required_vars:
-        if var not in content:
+    for var in REQUIRED_ENV_VARS:
+        if var not in defined:
             issues.append(f"Missing environment variable in .env.example: {var}")
 
     return issues
@@ -195,27 +312,11 @@ def check_dockerignore() -> list[str]:
     """Check .dockerignore file."""
     issues = []
 
-    dockerignore_path = Path(".dockerignore")
-    if not dockerignore_path.exists():
+    found = find_markers(".dockerignore", _DOCKERIGNORE_RE)
+    if found is None:
         return [".dockerignore file missing (will copy unnecessary files)"]
 
-    content = dockerignore_path.read_text()
-    recommended_ignores = [
-        "__pycache__",
-        "*.pyc",
-        ".env",
-        ".git",
-        "node_modules",
-        "dist",
-        "coverage",
-        ".pytest_cache",
-        "venv",
-    ]
-
-    missing = []
-    for ignore in recommended_ignores:
-        if ignore not in content:
-            missing.append(ignore)
+    missing = [ignore for ignore in RECOMMENDED_IGNORES if ignore not in found]
 
     if missing:
         issues.append(f".dockerignore: Consider adding {', '.join(missing)}")
@@ -225,71 +326,78 @@ def check_dockerignore() -> list[str]:
 
 def main():
     """Run all Docker validation checks."""
-    print("Docker Configuration Validation")
-    print("=" * 80)
-
-    all_issues = []
-
-    # Check Dockerfiles
-    print("\n📋 Checking Dockerfiles...")
-    api_issues = check_dockerfile(Path("docker/Dockerfile"), "API")
-    frontend_issues = check_dockerfile(Path("docker/Dockerfile.frontend"), "Frontend")
-    all_issues.extend(api_issues)
-    all_issues.extend(frontend_issues)
-
-    # Check docker-compose
-    print("\n📋 Checking docker-compose.yml...")
-    compose_issues = check_docker_compose(Path("docker-compose.yml"))
-    all_issues.extend(compose_issues)
-
-    # Check nginx config
-    print("\n📋 Checking nginx configuration...")
-    nginx_issues = check_nginx_config(Path("docker/nginx.conf"))
-    all_issues.extend(nginx_issues)
-
-    # Check requirements
-    print("\n📋 Checking required files...")
-    req_issues = check_requirements()
-    all_issues.extend(req_issues)
-
-    # Check environment variables
-    print("\n📋 Checking environment variables...")
-    env_issues = validate_env_example()
-    all_issues.extend(env_issues)
-
-    # Check dockerignore
-    print("\n📋 Checking .dockerignore...")
-    ignore_issues = check_dockerignore()
-    all_issues.extend(ignore_issues)
-
-    # Report results
-    print("\n" + "=" * 80)
-    if all_issues:
-        print("❌ Found issues:\n")
-        for issue in all_issues:
-            print(f"  - {issue}")
-
-        print(f"\nTotal issues: {len(all_issues)}")
-
-        # Categorize by severity
-        security_issues = [
-            i
-            for i in all_issues
-            if "security" in i.lower() or "root" in i or "password" in i
-        ]
-        if security_issues:
-            print(f"\n⚠️  Security issues: {len(security_issues)}")
-
-    else:
-        print("✅ All Docker configurations look good!")
-
-    print("\n📦 Docker Build Commands:")
-    print("  docker-compose build       # Build all services")
-    print("  docker-compose up -d       # Start all services")
-    print("  docker-compose logs -f     # View logs")
-    print("  docker-compose down        # Stop all services")
-
-    return 0 if not all_issues else 1
+    try:
+        emit("Docker Configuration Validation")
+        emit("=" * 80)
+
+        all_issues = []
+
+        # Check Dockerfiles
+        emit("\n📋 Checking Dockerfiles...")
+        api_issues = check_dockerfile(Path("docker/Dockerfile"), "API")
+        frontend_issues = check_dockerfile(
+            Path("docker/Dockerfile.frontend"), "Frontend"
+        )
+        all_issues.extend(api_issues)
+        all_issues.extend(frontend_issues)
+
+        # Check docker-compose
+        emit("\n📋 Checking docker-compose.yml...")
+        compose_issues = check_docker_compose(Path("docker-compose.yml"))
+        all_issues.extend(compose_issues)
+
+        # Check nginx config
+        emit("\n📋 Checking nginx configuration...")
+        nginx_issues = check_nginx_config(Path("docker/nginx.conf"))
+        all_issues.extend(nginx_issues)
+
+        # Check requirements
+        emit("\n📋 Checking required files...")
+        req_issues = check_requirements()
+        all_issues.extend(req_issues)
+
+        # Check environment variables
+        emit("\n📋 Checking environment variables...")
+        env_issues = validate_env_example()
+        all_issues.extend(env_issues)
+
+        # Check dockerignore
+        emit("\n📋 Checking .dockerignore...")
+        ignore_issues = check_dockerignore()
+        all_issues.extend(ignore_issues)
+
+        # Report results, dropping repeats of the same issue
+        all_issues = list(dict.fromkeys(all_issues))
+        emit("\n" + "=" * 80)
+        if all_issues:
+            emit("❌ Found issues:\n")
+            for issue in all_issues:
+                emit(f"  - {issue}")
+
+            emit(f"\nTotal issues: {len(all_issues)}")
+
+            # Categorize by severity
+            security_issues = [
+                i
+                for i in all_issues
+                if "security" in i.lower() or "root" in i or "password" in i
+            ]
+            if security_issues:
+                emit(f"\n⚠️  Security issues: {len(security_issues)}")
+
+        else:
+            emit("✅ All Docker configurations look good!")
+
+        emit("\n📦 Docker Build Commands:")
+        emit("  docker-compose build       # Build all services")
+        emit("  docker-compose up -d       # Start all services")
+        emit("  docker-compose logs -f     # View logs")
+        emit("  docker-compose down        # Stop all services")
+
+        return 0 if not all_issues else 1
+    finally:
+        # Also reached on failure, so partial output is never lost
+        _flush()
 
 
 if __name__ == "__main__":
@@ -11,13 +11,26 @@ from sqlalchemy import MetaData, Table
 
 from app.db.models import Base
 
+# Output is collected here and written once by main()
+_OUT = []
+
+
+def emit(*args):
+    """Queue a line of output, like print()."""
+    _OUT.append(" ".join(map(str, args)))
 
-def compare_tables():
-    """Compare expected tables with model definitions."""
 
-    # Expected tables from our models
-    expected_tables = {
-        "users": [
+def _flush():
+    """Write the queued output in one call."""
+    if _OUT:
+        sys.stdout.write("\n".join(_OUT) + "\n")
+        _OUT.clear()
+
+
+# Expected tables from our models
+EXPECTED_TABLES = {
+    "users": frozenset(
+        {
             "id",
             "email",
             "username",
@@ -29,8 +42,10 @@ def compare_tables():
             "deleted_at",
             "created_at",
             "updated_at",
-        ],
-        "refresh_tokens": [
+        }
+    ),
+    "refresh_tokens": frozenset(
+        {
             "id",
             "user_id",
             "token_hash",
@@ -38,8 +53,10 @@ def compare_tables():
             "revoked_at",
             "created_at",
             "updated_at",
-        ],
-        "login_attempts": [
+        }
+    ),
+    "login_attempts": frozenset(
+        {
             "id",
             "email",
             "user_id",
@@ -49,8 +66,10 @@ def compare_tables():
             "attempted_at",
             "created_at",
             "updated_at",
-        ],
-        "audit_logs": [
+        }
+    ),
+    "audit_logs": frozenset(
+        {
             "id",
             "user_id",
             "action",
@@ -62,45 +81,73 @@ def compare_tables():
             "response_status",
             "created_at",
             "updated_at",
-        ],
+        }
+    ),
+}
+
+
+def snapshot_metadata(metadata):
+    """Copy the parts of each table the checks need into plain containers.
+
+    Built once so the checks below work on sets and dicts instead of
+    walking SQLAlchemy column, index and foreign key collections.
+    """
+    return {
+        table.name: {
+            "columns": frozenset(column.name for column in table.columns),
+            "indexed_columns": frozenset(
+                column.name for index in table.indexes for column in index.columns
+            ),
+            # Keyed by the referencing column for direct lookups
+            "foreign_keys": {
+                fk.parent.name: (
+                    f"{fk.column.table.name}.{fk.column.name}",
+                    fk.ondelete,
+                )
+                for fk in table.foreign_keys
+            },
+        }
+        for table in metadata.tables.values()
     }
 
-    print("Verifying table structures...")
-    print("=" * 80)
+
+def compare_tables(snapshot):
+    """Compare expected tables with model definitions."""
+
+    emit("Verifying table structures...")
+    emit("=" * 80)
 
     all_good = True
 
-    for table_name, expected_columns in expected_tables.items():
-        if table_name not in Base.metadata.tables:
-            print(f"❌ Table '{table_name}' is missing from models!")
+    for table_name, expected_columns in EXPECTED_TABLES.items():
+        if table_name not in snapshot:
+            emit(f"❌ Table '{table_name}' is missing from models!")
             all_good = False
             continue
 
-        table = Base.metadata.tables[table_name]
-        actual_columns = set(column.name for column in table.columns)
-        expected_columns_set = set(expected_columns)
-
-        missing = expected_columns_set - actual_columns
-        extra = actual_columns - expected_columns_set
+        actual_columns = snapshot[table_name]["columns"]
 
-        if missing or extra:
-            print(f"\n❌ Table '{table_name}' has mismatched columns:")
+        mismatched = set(actual_columns ^ expected_columns)
+        if mismatched:
+            missing = mismatched - actual_columns
+            extra = mismatched & actual_columns
+            emit(f"\n❌ Table '{table_name}' has mismatched columns:")
             if missing:
-                print(f"   Missing: {missing}")
+                emit(f"   Missing: {missing}")
             if extra:
-                print(f"   Extra: {extra}")
+                emit(f"   Extra: {extra}")
             all_good = False
         else:
-            print(f"✅ Table '{table_name}' has all expected columns")
+            emit(f"✅ Table '{table_name}' has all expected columns")
 
     return all_good
 
 
-def check_indexes():
+def check_indexes(snapshot):
     """Verify that all necessary indexes exist."""
 
-    print("\n\nVerifying indexes...")
-    print("=" * 80)
+    emit("\n\nVerifying indexes...")
+    emit("=" * 80)
 
     required_indexes = {
         "users": ["email", "username", "is_active", "deleted_at"],
@@ -112,12 +159,7 @@ def check_indexes():
     all_good = True
 
     for table_name, required_cols in required_indexes.items():
-        table = Base.metadata.tables[table_name]
-
-        # Get all indexed columns
-        indexed_columns = set()
-        for index in table.indexes:
-            indexed_columns.update(col.name for col in index.columns)
+        indexed_columns = snapshot[table_name]["indexed_columns"]
 
         # Check if required columns are indexed
         missing_indexes = []
@@ -126,19 +168,19 @@ def check_indexes():
                 missing_indexes.append(col)
 
         if missing_indexes:
-            print(f"❌ Table '{table_name}' missing indexes on: {missing_indexes}")
+            emit(f"❌ Table '{table_name}' missing indexes on: {missing_indexes}")
             all_good = False
         else:
-            print(f"✅ Table '{table_name}' has all required indexes")
+            emit(f"✅ Table '{table_name}' has all required indexes")
 
     return all_good
 
 
-def check_foreign_keys():
+def check_foreign_keys(snapshot):
     """Verify foreign key relationships."""
 
-    print("\n\nVerifying foreign keys...")
-    print("=" * 80)
+    emit("\n\nVerifying foreign keys...")
+    emit("=" * 80)
 
     expected_fks = {
         "refresh_tokens": [("user_id", "users.id", "CASCADE")],
@@ -149,29 +191,19 @@ def check_foreign_keys():
     all_good = True
 
     for table_name, expected in expected_fks.items():
-        table = Base.metadata.tables[table_name]
+        foreign_keys = snapshot[table_name]["foreign_keys"]
 
         for fk_col, ref, ondelete in expected:
-            found = False
-            for fk in table.foreign_keys:
-                if fk.parent.name == fk_col:
-                    ref_name = f"{fk.column.table.name}.{fk.column.name}"
-                    if ref_name == ref:
-                        if fk.ondelete == ondelete:
-                            print(
-                                f"✅ {table_name}.{fk_col} -> {ref} (ON DELETE {ondelete})"
-                            )
-                            found = True
-                        else:
-                            print(
-                                f"❌ {table_name}.{fk_col} -> {ref} has wrong ondelete: {fk.ondelete} != {ondelete}"
-                            )
-                            all_good = False
-                            found = True
-                    break
-
-            if not found:
-                print(f"❌ Missing foreign key: {table_name}.{fk_col} -> {ref}")
+            ref_name, fk_ondelete = foreign_keys.get(fk_col, (None, None))
+            if ref_name != ref:
+                emit(f"❌ Missing foreign key: {table_name}.{fk_col} -> {ref}")
+                all_good = False
+            elif fk_ondelete == ondelete:
+                emit(f"✅ {table_name}.{fk_col} -> {ref} (ON DELETE {ondelete})")
+            else:
+                emit(
+                    f"❌ {table_name}.{fk_col} -> {ref} has wrong ondelete: {fk_ondelete} != {ondelete}"
+                )
                 all_good = False
 
     return all_good
@@ -179,22 +211,31 @@ def check_foreign_keys():
 
 def main():
     """Run all verification checks."""
-    print("Migration Verification Script")
-    print("=" * 80)
-
-    checks = [compare_tables(), check_indexes(), check_foreign_keys()]
-
-    if all(checks):
-        print("\n\n✅ All migration checks passed!")
-        print("\nThe migration file is ready to be applied.")
-        print("\nNext steps:")
-        print("1. Ensure PostgreSQL is running")
-        print("2. Run: make migrate")
-        print("3. Verify with: psql -U postgres -d fullstack_db -c '\\dt'")
-    else:
-        print("\n\n❌ Some checks failed!")
-        print("\nPlease fix the issues before running migrations.")
-        sys.exit(1)
+    try:
+        emit("Migration Verification Script")
+        emit("=" * 80)
+
+        snapshot = snapshot_metadata(Base.metadata)
+        checks = [
+            compare_tables(snapshot),
+            check_indexes(snapshot),
+            check_foreign_keys(snapshot),
+        ]
+
+        if all(checks):
+            emit("\n\n✅ All migration checks passed!")
+            emit("\nThe migration file is ready to be applied.")
+            emit("\nNext steps:")
+            emit("1. Ensure PostgreSQL is running")
+            emit("2. Run: make migrate")
+            emit("3. Verify with: psql -U postgres -d fullstack_db -c '\\dt'")
+        else:
+            emit("\n\n❌ Some checks failed!")
+            emit("\nPlease fix the issues before running migrations.")
+            sys.exit(1)
+    finally:
+        # Also reached on failure, so partial output is never lost
+        _flush()
 
 
 if __name__ == "__main__":
@@ -46,6 +46,9 @@ setup(
         "async": [
             "aiohttp>=3.8.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
     },
     project_urls={
         "Bug Reports": "https://github.com/yourusername/fullstack-app/issues",
@@ -1,30 +1,36 @@
 """FullStack API Python Client Library."""
 
-from .client import FullStackClient
-from .exceptions import (
-    AuthenticationError,
-    FullStackAPIError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-    ValidationError,
-)
-from .storage import FileTokenStorage, MemoryTokenStorage, TokenStorage
-from .types import (
-    AuthTokens,
-    ChangePasswordRequest,
-    HealthCheck,
-    LoginRequest,
-    PasswordResetConfirm,
-    PasswordResetRequest,
-    RegisterRequest,
-    UpdateUserRequest,
-    User,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .async_client import AsyncFullStackClient
+    from .client import FullStackClient
+    from .exceptions import (
+        AuthenticationError,
+        FullStackAPIError,
+        NotFoundError,
+        RateLimitError,
+        ServerError,
+        ValidationError,
+    )
+    from .storage import FileTokenStorage, MemoryTokenStorage, TokenStorage
+    from .types import (
+        AuthTokens,
+        ChangePasswordRequest,
+        HealthCheck,
+        LoginRequest,
+        PasswordResetConfirm,
+        PasswordResetRequest,
+        RegisterRequest,
+        UpdateUserRequest,
+        User,
+    )
 
 __version__ = "1.0.0"
-__all__ = [
+__all__ = (
     "FullStackClient",
+    "AsyncFullStackClient",
     "FullStackAPIError",
     "AuthenticationError",
     "ValidationError",
@@ -43,4 +49,53 @@ __all__ = [
     "PasswordResetRequest",
     "PasswordResetConfirm",
     "HealthCheck",
-]
+)
+
+# Submodule defining each public name; imported on first access (PEP 562)
+_EXPORTS = {
+    "FullStackClient": ".client",
+    "AsyncFullStackClient": ".async_client",
+    "FullStackAPIError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "ServerError": ".exceptions",
+    "TokenStorage": ".storage",
+    "MemoryTokenStorage": ".storage",
+    "FileTokenStorage": ".storage",
+    "AuthTokens": ".types",
+    "User": ".types",
+    "LoginRequest": ".types",
+    "RegisterRequest": ".types",
+    "UpdateUserRequest": ".types",
+    "ChangePasswordRequest": ".types",
+    "PasswordResetRequest": ".types",
+    "PasswordResetConfirm": ".types",
+    "HealthCheck": ".types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError as exc:
+        # aiohttp is only installed with the "async" extra
+        if name == "AsyncFullStackClient" and exc.name == "aiohttp":
+            raise ImportError(
+                "AsyncFullStackClient requires the 'async' extra: "
+                "pip install fullstack-api-client[async]"
+            ) from exc
+        raise
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including names not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,362 @@
+"""Async FullStack API Client (requires the ``async`` extra)."""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+from .client import (
+    RETRY_BACKOFF_FACTOR,
+    RETRY_METHODS,
+    RETRY_STATUSES,
+    TOKEN_EXPIRY_SKEW,
+    _dumps,
+    _loads,
+    _raise_api_error,
+)
+from .exceptions import AuthenticationError, FullStackAPIError
+from .storage import MemoryTokenStorage, TokenStorage
+from .types import (
+    AuthTokens,
+    ChangePasswordRequest,
+    HealthCheck,
+    LoginRequest,
+    PasswordResetConfirm,
+    PasswordResetRequest,
+    RegisterRequest,
+    UpdateUserRequest,
+    User,
+)
+
+
+class AsyncFullStackClient:
+    """Async FullStack API Client built on aiohttp.
+
+    Mirrors FullStackClient; every API method is a coroutine. Idempotent
+    requests are retried on the same statuses and with the same exponential
+    backoff as the sync client, and a 401 triggers one token refresh that is
+    shared by all concurrent requests.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token_storage: Optional[TokenStorage] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        verify_ssl: bool = True,
+        pool_maxsize: int = 32,
+    ):
+        """Initialize client.
+
+        Args:
+            base_url: API base URL
+            token_storage: Token storage implementation
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for failed requests
+            verify_ssl: Whether to verify SSL certificates
+            pool_maxsize: Maximum number of concurrent connections
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token_storage = token_storage or MemoryTokenStorage()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.verify_ssl = verify_ssl
+        self.pool_maxsize = pool_maxsize
+
+        # The session needs a running event loop, so it is created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._auth_headers: Dict[str, str] = {}
+        self._set_auth_header(self.token_storage.get_access_token())
+        # Monotonic deadline for refreshing the access token, when known
+        self._access_expires_at: Optional[float] = None
+
+    async def __aenter__(self) -> "AsyncFullStackClient":
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the session on exit."""
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            connector_kwargs: Dict[str, Any] = {}
+            if not self.verify_ssl:
+                connector_kwargs["ssl"] = False
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_maxsize,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    **connector_kwargs,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+            )
+        return self._session
+
+    def _set_auth_header(self, token: Optional[str]) -> None:
+        """Prebuild the Authorization header for the current token."""
+        self._auth_headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    def _access_token_expired(self) -> bool:
+        """Check whether the access token is known to be (nearly) expired."""
+        return (
+            self._access_expires_at is not None
+            and time.monotonic() >= self._access_expires_at
+        )
+
+    async def _refresh_tokens(self, stale_headers: Dict[str, str]) -> bool:
+        """Refresh the access token, clearing tokens if that fails.
+
+        Concurrent callers share one refresh: whoever takes the lock first
+        refreshes, and the rest see that the headers they sent with have
+        been replaced and reuse the result.
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if self._auth_headers != stale_headers:
+                return bool(self._auth_headers)
+            refresh_token = self.token_storage.get_refresh_token()
+            if not refresh_token:
+                return False
+            try:
+                self.set_tokens(await self.refresh_access_token(refresh_token))
+            except (AuthenticationError, FullStackAPIError):
+                # Refresh failed, clear tokens
+                self.clear_tokens()
+                return False
+            return True
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        auth: bool = True,
+        retry_on_401: bool = True,
+    ) -> Any:
+        """Make API request."""
+        if not path.startswith("/"):
+            raise ValueError(f"API path must start with '/': {path!r}")
+        url = self.base_url + path
+        body = _dumps(data) if data is not None else None
+
+        # Refresh ahead of a known expiry instead of waiting for a 401
+        if auth and retry_on_401 and self._access_token_expired():
+            await self._refresh_tokens(self._auth_headers)
+
+        sent_headers = self._auth_headers
+        status, content = await self._send(method, url, body, params, auth)
+
+        # Handle token refresh on 401
+        if status == 401 and auth and retry_on_401:
+            if await self._refresh_tokens(sent_headers):
+                # Retry request with new token
+                status, content = await self._send(method, url, body, params, auth)
+
+        return self._handle_response(status, content)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        params: Optional[Dict[str, Any]],
+        auth: bool,
+    ) -> Tuple[int, bytes]:
+        """Send one request and read its status and body.
+
+        Idempotent methods are retried on RETRY_STATUSES up to max_retries
+        times, sleeping RETRY_BACKOFF_FACTOR * 2 ** (retry - 1) seconds
+        before each retry after the first, as urllib3's Retry does.
+        """
+        retries = self.max_retries if method in RETRY_METHODS else 0
+        for attempt in range(retries + 1):
+            if attempt > 1:
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** (attempt - 1))
+            async with self._get_session().request(
+                method,
+                url,
+                data=body,
+                params=params,
+                headers=self._auth_headers if auth else None,
+            ) as response:
+                status, content = response.status, await response.read()
+            if status not in RETRY_STATUSES:
+                break
+        return status, content
+
+    def _handle_response(self, status: int, content: bytes) -> Any:
+        """Handle API response."""
+        if status >= 400:
+            _raise_api_error(status, content, content.decode("utf-8", "replace"))
+
+        # Return None for 204 No Content
+        if status == 204:
+            return None
+
+        try:
+            return _loads(content)
+        except ValueError:
+            return content.decode("utf-8", "replace")
+
+    # Health check
+    async def health_check(self) -> HealthCheck:
+        """Check API health status."""
+        data = await self._request("GET", "/health", auth=False)
+        return HealthCheck.from_dict(data)
+
+    # Authentication
+    async def login(self, request: LoginRequest) -> AuthTokens:
+        """Login user."""
+        data = await self._request(
+            "POST",
+            "/api/v1/auth/login",
+            data={"username": request.username, "password": request.password},
+            auth=False,
+        )
+        tokens = AuthTokens.from_dict(data)
+        self.set_tokens(tokens)
+        return tokens
+
+    async def register(self, request: RegisterRequest) -> User:
+        """Register new user."""
+        data = await self._request(
+            "POST",
+            "/api/v1/auth/register",
+            data={
+                "email": request.email,
+                "username": request.username,
+                "password": request.password,
+                "full_name": request.full_name,
+            },
+            auth=False,
+        )
+        return User.from_dict(data)
+
+    async def logout(self) -> None:
+        """Logout current user."""
+        try:
+            await self._request("POST", "/api/v1/auth/logout")
+        finally:
+            self.clear_tokens()
+
+    async def refresh_access_token(self, refresh_token: str) -> AuthTokens:
+        """Refresh access token."""
+        data = await self._request(
+            "POST",
+            "/api/v1/auth/refresh",
+            data={"refresh_token": refresh_token},
+            auth=False,
+            retry_on_401=False,
+        )
+        # The refresh token is not rotated, so keep using the current one
+        return AuthTokens.from_dict({"refresh_token": refresh_token, **data})
+
+    async def request_password_reset(
+        self, request: PasswordResetRequest
+    ) -> Dict[str, str]:
+        """Request password reset."""
+        return await self._request(
+            "POST",
+            "/api/v1/auth/password-reset",
+            data={"email": request.email},
+            auth=False,
+        )
+
+    async def confirm_password_reset(
+        self, request: PasswordResetConfirm
+    ) -> Dict[str, str]:
+        """Confirm password reset."""
+        return await self._request(
+            "POST",
+            "/api/v1/auth/password-reset/confirm",
+            data={"token": request.token, "new_password": request.new_password},
+            auth=False,
+        )
+
+    # User management
+    async def get_current_user(self) -> User:
+        """Get current user."""
+        data = await self._request("GET", "/api/v1/users/me")
+        return User.from_dict(data)
+
+    async def try_get_current_user(self) -> Optional[User]:
+        """Get current user, or None if not authenticated."""
+        if not self.is_authenticated():
+            return None
+        try:
+            return await self.get_current_user()
+        except AuthenticationError:
+            self.clear_tokens()
+            return None
+
+    async def update_current_user(self, request: UpdateUserRequest) -> User:
+        """Update current user."""
+        data = await self._request("PATCH", "/api/v1/users/me", data=request.to_dict())
+        return User.from_dict(data)
+
+    async def change_password(self, request: ChangePasswordRequest) -> Dict[str, str]:
+        """Change password."""
+        return await self._request(
+            "POST",
+            "/api/v1/users/me/change-password",
+            data={
+                "old_password": request.old_password,
+                "new_password": request.new_password,
+            },
+        )
+
+    async def delete_account(self, password: str) -> Dict[str, str]:
+        """Delete current user account."""
+        result = await self._request(
+            "DELETE",
+            "/api/v1/users/me",
+            data={"password": password},
+        )
+        self.clear_tokens()
+        return result
+
+    # Utility methods
+    def is_authenticated(self) -> bool:
+        """Check if user is authenticated."""
+        return self.token_storage.get_access_token() is not None
+
+    def set_tokens(self, tokens: AuthTokens) -> None:
+        """Set tokens manually."""
+        self.token_storage.set_tokens(tokens)
+        self._set_auth_header(tokens.access_token)
+        self._access_expires_at = (
+            time.monotonic() + tokens.expires_in - TOKEN_EXPIRY_SKEW
+            if tokens.expires_in
+            else None
+        )
+
+    def clear_tokens(self) -> None:
+        """Clear stored tokens."""
+        self.token_storage.clear_tokens()
+        self._set_auth_header(None)
+        self._access_expires_at = None
+
+    def get_tokens(self) -> Dict[str, Optional[str]]:
+        """Get current tokens."""
+        return {
+            "access_token": self.token_storage.get_access_token(),
+            "refresh_token": self.token_storage.get_refresh_token(),
+        }
+
+    async def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -1,12 +1,21 @@
 """FullStack API Client."""
 
+import json
+import socket
 import time
-from typing import Any, Dict, Optional, Union
-from urllib.parse import urljoin
+from typing import Any, Dict, NoReturn, Optional, Union
 
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # Optional; falls back to the stdlib codec
+    HAS_ORJSON = False
 
 from .exceptions import (
     AuthenticationError,
@@ -29,6 +38,73 @@ from .types import (
     User,
 )
 
+# Refresh this many seconds before the access token expires
+TOKEN_EXPIRY_SKEW = 30
+
+# Responses worth retrying, and the idempotent methods that may be retried
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_METHODS = ("HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE")
+RETRY_BACKOFF_FACTOR = 1
+
+# Per-request override that drops the session's Authorization header
+_NO_AUTH_HEADERS: Dict[str, Any] = {"Authorization": None}
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode a request body as JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON response body; raises ValueError if it is not JSON."""
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _raise_api_error(status_code: int, content: bytes, text: str) -> NoReturn:
+    """Raise the exception matching an error response.
+
+    Shared by the sync and async clients.
+    """
+    try:
+        error_data = _loads(content)
+        message = error_data.get("error", "Unknown error")
+        code = error_data.get("code")
+        details = error_data.get("details", {})
+    except ValueError:
+        message = text or "Unknown error"
+        code = None
+        details = {}
+
+    if status_code == 401:
+        raise AuthenticationError(message, code, details, status_code)
+    elif status_code == 422:
+        raise ValidationError(message, code, details, status_code)
+    elif status_code == 429:
+        raise RateLimitError(message, code, details, status_code)
+    elif status_code == 404:
+        raise NotFoundError(message, code, details, status_code)
+    elif status_code >= 500:
+        raise ServerError(message, code, details, status_code)
+    else:
+        raise FullStackAPIError(message, code, details, status_code)
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled sockets use TCP keep-alive."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with keep-alive socket options."""
+        kwargs.setdefault(
+            "socket_options",
+            HTTPConnection.default_socket_options
+            + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+        )
+        super().init_poolmanager(*args, **kwargs)
+
 
 class FullStackClient:
     """FullStack API Client."""
@@ -40,6 +116,7 @@ class FullStackClient:
         timeout: int = 30,
         max_retries: int = 3,
         verify_ssl: bool = True,
+        pool_maxsize: int = 32,
     ):
         """Initialize client.
 
@@ -49,6 +126,7 @@ class FullStackClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             verify_ssl: Whether to verify SSL certificates
+            pool_maxsize: Maximum number of pooled connections per host
         """
         self.base_url = base_url.rstrip("/")
         self.token_storage = token_storage or MemoryTokenStorage()
@@ -59,11 +137,15 @@ class FullStackClient:
         self.session = requests.Session()
         retry_strategy = Retry(
             total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"],
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+        )
+        adapter = _KeepAliveAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=pool_maxsize,
+            pool_block=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -74,60 +156,76 @@ class FullStackClient:
                 "Accept": "application/json",
             }
         )
+        self._set_auth_header(self.token_storage.get_access_token())
+        # Monotonic deadline for refreshing the access token, when known
+        self._access_expires_at: Optional[float] = None
 
     def _get_url(self, path: str) -> str:
-        """Get full URL for path."""
-        return urljoin(self.base_url, path)
+        """Get full URL for path.
+
+        Paths are absolute API paths, so they are appended to the base URL
+        (which has no trailing slash) without re-parsing either part. Unlike
+        ``urljoin``, this keeps any path prefix on the base URL:
+        ``https://host/prefix`` + ``/health`` gives ``https://host/prefix/health``.
+
+        Raises:
+            ValueError: If ``path`` does not start with ``/``
+        """
+        if not path.startswith("/"):
+            raise ValueError(f"API path must start with '/': {path!r}")
+        return self.base_url + path
 
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Get authorization headers."""
-        token = self.token_storage.get_access_token()
+    def _set_auth_header(self, token: Optional[str]) -> None:
+        """Keep the session's Authorization header in step with the token.
+
+        The header is built once per token rather than read back from token
+        storage on every request.
+        """
         if token:
-            return {"Authorization": f"Bearer {token}"}
-        return {}
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    def _access_token_expired(self) -> bool:
+        """Check whether the access token is known to be (nearly) expired."""
+        return (
+            self._access_expires_at is not None
+            and time.monotonic() >= self._access_expires_at
+        )
+
+    def _refresh_tokens(self) -> bool:
+        """Refresh the access token, clearing tokens if that fails."""
+        refresh_token = self.token_storage.get_refresh_token()
+        if not refresh_token:
+            return False
+        try:
+            self.set_tokens(self.refresh_access_token(refresh_token))
+        except (AuthenticationError, FullStackAPIError):
+            # Refresh failed, clear tokens
+            self.clear_tokens()
+            return False
+        return True
 
     def _handle_response(self, response: requests.Response) -> Any:
         """Handle API response."""
-        try:
-            response.raise_for_status()
-        except requests.HTTPError:
+        # Check the status directly; raise_for_status() would build an
+        # HTTPError only for it to be caught here
+        status = response.status_code
+        if status >= 400:
             self._handle_error(response)
 
         # Return None for 204 No Content
-        if response.status_code == 204:
+        if status == 204:
             return None
 
         try:
-            return response.json()
+            return _loads(response.content)
         except ValueError:
             return response.text
 
     def _handle_error(self, response: requests.Response) -> None:
         """Handle error response."""
-        try:
-            error_data = response.json()
-            message = error_data.get("error", "Unknown error")
-            code = error_data.get("code")
-            details = error_data.get("details", {})
-        except ValueError:
-            message = response.text or "Unknown error"
-            code = None
-            details = {}
-
-        status_code = response.status_code
-
-        if status_code == 401:
-            raise AuthenticationError(message, code, details, status_code)
-        elif status_code == 422:
-            raise ValidationError(message, code, details, status_code)
-        elif status_code == 429:
-            raise RateLimitError(message, code, details, status_code)
-        elif status_code == 404:
-            raise NotFoundError(message, code, details, status_code)
-        elif status_code >= 500:
-            raise ServerError(message, code, details, status_code)
-        else:
-            raise FullStackAPIError(message, code, details, status_code)
+        _raise_api_error(response.status_code, response.content, response.text)
 
     def _request(
         self,
@@ -140,15 +238,17 @@ class FullStackClient:
     ) -> Any:
         """Make API request."""
         url = self._get_url(path)
-        headers = {}
+        headers = None if auth else _NO_AUTH_HEADERS
+        body = _dumps(data) if data is not None else None
 
-        if auth:
-            headers.update(self._get_auth_headers())
+        # Refresh ahead of a known expiry instead of waiting for a 401
+        if auth and retry_on_401 and self._access_token_expired():
+            self._refresh_tokens()
 
         response = self.session.request(
             method,
             url,
-            json=data,
+            data=body,
             params=params,
             headers=headers,
             timeout=self.timeout,
@@ -157,26 +257,17 @@ class FullStackClient:
 
         # Handle token refresh on 401
         if response.status_code == 401 and auth and retry_on_401:
-            refresh_token = self.token_storage.get_refresh_token()
-            if refresh_token:
-                try:
-                    tokens = self.refresh_access_token(refresh_token)
-                    self.token_storage.set_tokens(tokens)
-
-                    # Retry request with new token
-                    headers.update(self._get_auth_headers())
-                    response = self.session.request(
-                        method,
-                        url,
-                        json=data,
-                        params=params,
-                        headers=headers,
-                        timeout=self.timeout,
-                        verify=self.verify_ssl,
-                    )
-                except (AuthenticationError, FullStackAPIError):
-                    # Refresh failed, clear tokens
-                    self.token_storage.clear_tokens()
+            if self._refresh_tokens():
+                # Retry request with new token
+                response = self.session.request(
+                    method,
+                    url,
+                    data=body,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                    verify=self.verify_ssl,
+                )
 
         return self._handle_response(response)
 
@@ -195,8 +286,8 @@ class FullStackClient:
             data={"username": request.username, "password": request.password},
             auth=False,
         )
-        tokens = AuthTokens(**data)
-        self.token_storage.set_tokens(tokens)
+        tokens = AuthTokens.from_dict(data)
+        self.set_tokens(tokens)
         return tokens
 
     def register(self, request: RegisterRequest) -> User:
@@ -219,7 +310,7 @@ class FullStackClient:
         try:
             self._request("POST", "/api/v1/auth/logout")
         finally:
-            self.token_storage.clear_tokens()
+            self.clear_tokens()
 
     def refresh_access_token(self, refresh_token: str) -> AuthTokens:
         """Refresh access token."""
@@ -230,7 +321,8 @@ class FullStackClient:
             auth=False,
             retry_on_401=False,
         )
-        return AuthTokens(**data)
+        # The refresh token is not rotated, so keep using the current one
+        return AuthTokens.from_dict({"refresh_token": refresh_token, **data})
 
     def request_password_reset(self, request: PasswordResetRequest) -> Dict[str, str]:
         """Request password reset."""
@@ -256,6 +348,20 @@ class FullStackClient:
         data = self._request("GET", "/api/v1/users/me")
         return User.from_dict(data)
 
+    def try_get_current_user(self) -> Optional[User]:
+        """Get current user, or None if not authenticated.
+
+        Issues a single request; a 401 that survives the token refresh clears
+        the stored tokens and returns None. Other errors are raised.
+        """
+        if not self.is_authenticated():
+            return None
+        try:
+            return self.get_current_user()
+        except AuthenticationError:
+            self.clear_tokens()
+            return None
+
     def update_current_user(self, request: UpdateUserRequest) -> User:
         """Update current user."""
         data = self._request("PATCH", "/api/v1/users/me", data=request.to_dict())
@@ -279,7 +385,7 @@ class FullStackClient:
             "/api/v1/users/me",
             data={"password": password},
         )
-        self.token_storage.clear_tokens()
+        self.clear_tokens()
         return result
 
     # Utility methods
@@ -290,10 +396,18 @@ class FullStackClient:
     def set_tokens(self, tokens: AuthTokens) -> None:
         """Set tokens manually."""
         self.token_storage.set_tokens(tokens)
+        self._set_auth_header(tokens.access_token)
+        self._access_expires_at = (
+            time.monotonic() + tokens.expires_in - TOKEN_EXPIRY_SKEW
+            if tokens.expires_in
+            else None
+        )
 
     def clear_tokens(self) -> None:
         """Clear stored tokens."""
         self.token_storage.clear_tokens()
+        self._set_auth_header(None)
+        self._access_expires_at = None
 
     def get_tokens(self) -> Dict[str, Optional[str]]:
         """Get current tokens."""
@@ -301,3 +415,7 @@ class FullStackClient:
             "access_token": self.token_storage.get_access_token(),
             "refresh_token": self.token_storage.get_refresh_token(),
         }
+
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
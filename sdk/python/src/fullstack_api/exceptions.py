@@ -6,6 +6,8 @@ from typing import Any, Dict, Optional
 class FullStackAPIError(Exception):
     """Base exception for FullStack API errors."""
 
+    __slots__ = ("message", "code", "details", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -24,12 +26,14 @@ class FullStackAPIError(Exception):
 class AuthenticationError(FullStackAPIError):
     """Authentication failed."""
 
-    pass
+    __slots__ = ()
 
 
 class ValidationError(FullStackAPIError):
     """Validation error."""
 
+    __slots__ = ()
+
     @property
     def errors(self) -> list:
         """Get validation errors."""
@@ -39,6 +43,8 @@ class ValidationError(FullStackAPIError):
 class RateLimitError(FullStackAPIError):
     """Rate limit exceeded."""
 
+    __slots__ = ()
+
     @property
     def retry_after(self) -> Optional[int]:
         """Get retry after time in seconds."""
@@ -48,10 +54,10 @@ class RateLimitError(FullStackAPIError):
 class NotFoundError(FullStackAPIError):
     """Resource not found."""
 
-    pass
+    __slots__ = ()
 
 
 class ServerError(FullStackAPIError):
     """Server error."""
 
-    pass
+    __slots__ = ()
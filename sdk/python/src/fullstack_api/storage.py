@@ -78,16 +78,30 @@ class FileTokenStorage(TokenStorage):
         # Create directory if it doesn't exist
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Parsed file contents, valid while the file's mtime is unchanged
+        self._cache: Optional[dict] = None
+        self._cache_mtime_ns: Optional[int] = None
+
     def _read_tokens(self) -> dict:
-        """Read tokens from file."""
-        if not self.file_path.exists():
-            return {}
+        """Read tokens from file.
 
+        The file is only re-parsed when its mtime changes, so repeated reads
+        cost a stat call; writes from other processes are still picked up.
+        """
         try:
-            with open(self.file_path, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
+            mtime_ns = self.file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._cache, self._cache_mtime_ns = {}, None
+            return self._cache
+
+        if self._cache is None or mtime_ns != self._cache_mtime_ns:
+            try:
+                with open(self.file_path, "r") as f:
+                    self._cache = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                self._cache = {}
+            self._cache_mtime_ns = mtime_ns
+        return self._cache
 
     def _write_tokens(self, tokens: dict) -> None:
         """Write tokens to file."""
@@ -97,6 +111,9 @@ class FileTokenStorage(TokenStorage):
         # Set restrictive permissions (owner read/write only)
         os.chmod(self.file_path, 0o600)
 
+        self._cache = dict(tokens)
+        self._cache_mtime_ns = self.file_path.stat().st_mtime_ns
+
     def get_access_token(self) -> Optional[str]:
         """Get stored access token."""
         tokens = self._read_tokens()
@@ -121,3 +138,4 @@ class FileTokenStorage(TokenStorage):
         """Clear stored tokens."""
         if self.file_path.exists():
             self.file_path.unlink()
+        self._cache, self._cache_mtime_ns = {}, None
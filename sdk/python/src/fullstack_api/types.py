@@ -12,6 +12,17 @@ class AuthTokens:
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
+    expires_in: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuthTokens":
+        """Create AuthTokens from dictionary."""
+        return cls(
+            access_token=data["access_token"],
+            refresh_token=data["refresh_token"],
+            token_type=data.get("token_type", "bearer"),
+            expires_in=data.get("expires_in"),
+        )
 
 
 @dataclass
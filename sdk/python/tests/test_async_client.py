@@ -0,0 +1,242 @@
+"""Tests for the async client against a local aiohttp server."""
+
+import asyncio
+from typing import AsyncGenerator, List
+
+import pytest
+import pytest_asyncio
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from fullstack_api import async_client  # noqa: E402
+from fullstack_api.async_client import AsyncFullStackClient  # noqa: E402
+from fullstack_api.exceptions import (  # noqa: E402
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+from fullstack_api.types import AuthTokens, LoginRequest  # noqa: E402
+
+USER = {
+    "id": "user-1",
+    "email": "user@example.com",
+    "username": "user",
+    "full_name": None,
+    "is_active": True,
+    "is_verified": True,
+    "is_superuser": False,
+    "created_at": "2024-01-01T00:00:00",
+    "updated_at": "2024-01-01T00:00:00",
+}
+
+
+class FakeAPI:
+    """Minimal API server that records the requests it receives."""
+
+    def __init__(self) -> None:
+        self.base_url = ""
+        self.valid_token = "access-1"
+        self.refresh_calls = 0
+        self.me_calls = 0
+        self.statuses: List[int] = []
+        self.auth_headers: List[str] = []
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/api/v1/auth/login", self.login)
+        app.router.add_post("/api/v1/auth/refresh", self.refresh)
+        app.router.add_get("/api/v1/users/me", self.me)
+        app.router.add_get("/status/{code}", self.status)
+        app.router.add_post("/status/{code}", self.status)
+        return app
+
+    async def login(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        if body["password"] != "secret":
+            return web.json_response({"detail": "Bad credentials"}, status=401)
+        return web.json_response(
+            {
+                "access_token": self.valid_token,
+                "refresh_token": "refresh-1",
+                "token_type": "bearer",
+            }
+        )
+
+    async def refresh(self, request: web.Request) -> web.Response:
+        self.refresh_calls += 1
+        body = await request.json()
+        if body["refresh_token"] != "refresh-1":
+            return web.json_response({"detail": "Invalid token"}, status=401)
+        # Let concurrent requests pile up on the refresh lock
+        await asyncio.sleep(0.05)
+        self.valid_token = f"access-{self.refresh_calls + 1}"
+        return web.json_response(
+            {"access_token": self.valid_token, "token_type": "bearer"}
+        )
+
+    async def me(self, request: web.Request) -> web.Response:
+        self.me_calls += 1
+        header = request.headers.get("Authorization", "")
+        self.auth_headers.append(header)
+        if header != f"Bearer {self.valid_token}":
+            return web.json_response({"detail": "Expired"}, status=401)
+        return web.json_response(USER)
+
+    async def status(self, request: web.Request) -> web.Response:
+        code = self.statuses.pop(0) if self.statuses else 200
+        if code >= 400:
+            return web.json_response({"detail": f"status {code}"}, status=code)
+        return web.json_response({"ok": True})
+
+
+@pytest_asyncio.fixture
+async def api() -> AsyncGenerator[FakeAPI, None]:
+    """Run the fake API on a local port."""
+    fake = FakeAPI()
+    server = TestServer(fake.app())
+    await server.start_server()
+    fake.base_url = str(server.make_url(""))
+    yield fake
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def client(api: FakeAPI) -> AsyncGenerator[AsyncFullStackClient, None]:
+    """Client pointed at the fake API."""
+    async with AsyncFullStackClient(api.base_url) as client:
+        yield client
+
+
+@pytest.fixture
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip retry backoff sleeps."""
+    monkeypatch.setattr(async_client, "RETRY_BACKOFF_FACTOR", 0)
+
+
+class TestAuthentication:
+    """Test login and token refresh."""
+
+    @pytest.mark.asyncio
+    async def test_login_stores_tokens(self, client: AsyncFullStackClient) -> None:
+        tokens = await client.login(LoginRequest("user@example.com", "secret"))
+
+        assert tokens.access_token == "access-1"
+        assert client.get_tokens() == {
+            "access_token": "access-1",
+            "refresh_token": "refresh-1",
+        }
+        user = await client.get_current_user()
+        assert user.email == "user@example.com"
+
+    @pytest.mark.asyncio
+    async def test_login_failure(self, client: AsyncFullStackClient) -> None:
+        with pytest.raises(AuthenticationError):
+            await client.login(LoginRequest("user@example.com", "wrong"))
+        assert not client.is_authenticated()
+
+    @pytest.mark.asyncio
+    async def test_401_refreshes_and_retries(
+        self, api: FakeAPI, client: AsyncFullStackClient
+    ) -> None:
+        client.set_tokens(AuthTokens("stale", "refresh-1"))
+
+        user = await client.get_current_user()
+
+        assert user.id == "user-1"
+        assert api.refresh_calls == 1
+        assert api.auth_headers == ["Bearer stale", "Bearer access-2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_401s_share_one_refresh(
+        self, api: FakeAPI, client: AsyncFullStackClient
+    ) -> None:
+        client.set_tokens(AuthTokens("stale", "refresh-1"))
+
+        users = await asyncio.gather(*(client.get_current_user() for _ in range(5)))
+
+        assert [user.id for user in users] == ["user-1"] * 5
+        assert api.refresh_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_clears_tokens(
+        self, api: FakeAPI, client: AsyncFullStackClient
+    ) -> None:
+        client.set_tokens(AuthTokens("stale", "revoked"))
+
+        with pytest.raises(AuthenticationError):
+            await client.get_current_user()
+
+        assert api.refresh_calls == 1
+        assert not client.is_authenticated()
+
+
+class TestErrorsAndRetries:
+    """Test error mapping and retries of failed requests."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "code, error",
+        [
+            (404, NotFoundError),
+            (422, ValidationError),
+            (429, RateLimitError),
+            (503, ServerError),
+        ],
+    )
+    async def test_errors_are_mapped(
+        self,
+        api: FakeAPI,
+        client: AsyncFullStackClient,
+        no_backoff: None,
+        code: int,
+        error: type,
+    ) -> None:
+        api.statuses = [code] * 10
+
+        with pytest.raises(error) as exc_info:
+            await client._request("POST", f"/status/{code}", auth=False)
+
+        assert exc_info.value.status_code == code
+
+    @pytest.mark.asyncio
+    async def test_get_retried_until_success(
+        self, api: FakeAPI, client: AsyncFullStackClient, no_backoff: None
+    ) -> None:
+        api.statuses = [503, 429]
+
+        result = await client._request("GET", "/status/0", auth=False)
+
+        assert result == {"ok": True}
+        assert api.statuses == []
+
+    @pytest.mark.asyncio
+    async def test_get_retries_are_limited(
+        self, api: FakeAPI, client: AsyncFullStackClient, no_backoff: None
+    ) -> None:
+        api.statuses = [502] * 10
+
+        with pytest.raises(ServerError):
+            await client._request("GET", "/status/0", auth=False)
+
+        # One request plus max_retries retries
+        assert len(api.statuses) == 10 - (1 + client.max_retries)
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried(
+        self, api: FakeAPI, client: AsyncFullStackClient, no_backoff: None
+    ) -> None:
+        api.statuses = [503, 200]
+
+        with pytest.raises(ServerError):
+            await client._request("POST", "/status/0", auth=False)
+
+        assert api.statuses == [200]
+
+    @pytest.mark.asyncio
+    async def test_relative_path_rejected(self, client: AsyncFullStackClient) -> None:
+        with pytest.raises(ValueError):
+            await client._request("GET", "status/0", auth=False)
@@ -0,0 +1,39 @@
+"""Tests for the package's lazy exports."""
+
+import sys
+
+import pytest
+
+import fullstack_api
+
+
+@pytest.fixture
+def fresh_async_export(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Forget any imported async client so the next access imports it."""
+    monkeypatch.delitem(vars(fullstack_api), "AsyncFullStackClient", raising=False)
+    monkeypatch.delitem(sys.modules, "fullstack_api.async_client", raising=False)
+
+
+def test_missing_aiohttp_names_the_extra(
+    monkeypatch: pytest.MonkeyPatch, fresh_async_export: None
+) -> None:
+    monkeypatch.setitem(sys.modules, "aiohttp", None)
+
+    with pytest.raises(ImportError, match=r"fullstack-api-client\[async\]"):
+        fullstack_api.AsyncFullStackClient
+
+
+def test_other_import_errors_propagate(
+    monkeypatch: pytest.MonkeyPatch, fresh_async_export: None
+) -> None:
+    monkeypatch.setitem(sys.modules, "fullstack_api.async_client", None)
+
+    with pytest.raises(ImportError) as exc_info:
+        fullstack_api.AsyncFullStackClient
+
+    assert exc_info.value.name == "fullstack_api.async_client"
+
+
+def test_unknown_name_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError):
+        fullstack_api.NotAnExport
@@ -4,7 +4,8 @@ import asyncio
 
 import click
 
-from app.db.init_db import init_db
+from app.db.init_db import create_audit_log_partitions, init_db
+from app.db.partitions import PARTITION_MONTHS_AHEAD
 
 
 @click.group()
@@ -21,5 +22,19 @@ def init_database() -> None:
     click.echo("Database initialization complete!")
 
 
+@cli.command()
+@click.option(
+    "--months-ahead",
+    default=PARTITION_MONTHS_AHEAD,
+    show_default=True,
+    help="Number of future months to create partitions for.",
+)
+def create_audit_partitions(months_ahead: int) -> None:
+    """Pre-create monthly audit log partitions (schedule monthly)."""
+    click.echo("Creating audit log partitions...")
+    asyncio.run(create_audit_log_partitions(months_ahead))
+    click.echo("Audit log partitions are up to date!")
+
+
 if __name__ == "__main__":
     cli()
@@ -43,6 +43,8 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "password"
     POSTGRES_DB: str = "fullstack_db"
     DATABASE_URL: Optional[PostgresDsn] = None
+    # Skip creating the engine, for tooling that only needs the routes
+    SKIP_DB_INIT: bool = False
 
     @field_validator("DATABASE_URL", mode="before")
     @classmethod
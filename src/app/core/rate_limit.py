@@ -57,10 +57,13 @@ class LoginRateLimiter:
         self,
         db: AsyncSession,
         email: str,
-        ip_address: str,
+        ip_address: Optional[str],
     ) -> tuple[bool, int, Optional[datetime]]:
         """Check if login rate limit is exceeded.
 
+        Attempts are counted per (email, IP address). Requests without a
+        client address share a per-email bucket (``ip_address IS NULL``).
+
         Returns:
             tuple: (is_allowed, remaining_attempts, retry_after)
         """
@@ -113,7 +116,7 @@ class LoginRateLimiter:
         self,
         db: AsyncSession,
         email: str,
-        ip_address: str,
+        ip_address: Optional[str],
         success: bool,
         user_id: Optional[str] = None,
         user_agent: Optional[str] = None,
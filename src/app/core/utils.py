@@ -1,5 +1,6 @@
 """Utility functions."""
 
+import ipaddress
 import re
 from typing import Any, Dict, List, Optional
 
@@ -74,21 +75,39 @@ def clean_dict(
     return cleaned
 
 
-def get_client_ip(request: Any) -> str:
-    """Get client IP address from request."""
+def _parse_ip(value: str) -> Optional[str]:
+    """Normalize an IP address, or return None if it is not one."""
+    try:
+        return str(ipaddress.ip_address(value.strip()))
+    except ValueError:
+        return None
+
+
+def get_client_ip(request: Any) -> Optional[str]:
+    """Get client IP address from request.
+
+    Proxy headers that do not hold a valid address are ignored in favour of
+    the peer address. Returns None when there is no valid address at all
+    (e.g. a unix socket peer), rather than a placeholder that would pool
+    such clients into one rate-limit bucket.
+    """
     # Check for X-Forwarded-For header (behind proxy)
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
         # Get the first IP in the chain
-        return str(forwarded_for.split(",")[0].strip())
+        ip = _parse_ip(forwarded_for.split(",")[0])
+        if ip:
+            return ip
 
     # Check for X-Real-IP header
     real_ip = request.headers.get("X-Real-IP")
     if real_ip:
-        return str(real_ip)
+        ip = _parse_ip(real_ip)
+        if ip:
+            return ip
 
     # Fall back to direct connection
-    return str(request.client.host) if request.client else "unknown"
+    return _parse_ip(str(request.client.host)) if request.client else None
 
 
 def get_user_agent(request: Any) -> Optional[str]:
@@ -0,0 +1,44 @@
+"""Bulk insert helpers for append-heavy tables."""
+
+from typing import Any, Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.base import Base
+
+# Below this many rows a multi-row INSERT is as cheap as setting up a COPY
+COPY_THRESHOLD = 100
+
+
+async def bulk_insert_copy(
+    session: AsyncSession,
+    table_name: str,
+    rows: Sequence[Sequence[Any]],
+    columns: Sequence[str],
+) -> None:
+    """Insert many rows into a table within the session's transaction.
+
+    On PostgreSQL (asyncpg), batches of at least ``COPY_THRESHOLD`` rows are
+    streamed with COPY, which checks types and permissions once and writes a
+    single buffered stream instead of planning and logging one INSERT per
+    row. Smaller batches and other databases fall back to an executemany
+    INSERT. Row values must already be in the driver's native types (e.g.
+    ``uuid.UUID``, ``datetime``), since COPY bypasses SQLAlchemy's type
+    processing. The caller is responsible for committing.
+    """
+    if not rows:
+        return
+
+    connection = await session.connection()
+    if len(rows) >= COPY_THRESHOLD and connection.dialect.driver == "asyncpg":
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        assert driver_connection is not None
+        await driver_connection.copy_records_to_table(
+            table_name, records=rows, columns=list(columns)
+        )
+        return
+
+    table = Base.metadata.tables[table_name]
+    await session.execute(insert(table), [dict(zip(columns, row)) for row in rows])
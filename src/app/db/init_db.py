@@ -1,14 +1,16 @@
 """Database initialization."""
 
 import asyncio
+from datetime import date
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_password_hash
 from app.db.models.user import User
-from app.db.session import AsyncSessionLocal, engine
+from app.db.partitions import PARTITION_MONTHS_AHEAD, partition_statements
+from app.db.session import AsyncSessionLocal, get_engine
 
 
 async def create_superuser(db: AsyncSession) -> Optional[User]:
@@ -49,10 +51,21 @@ async def init_db() -> None:
         print("Database initialization complete")
 
 
+async def create_audit_log_partitions(
+    months_ahead: int = PARTITION_MONTHS_AHEAD,
+) -> None:
+    """Create any missing monthly audit log partitions."""
+    async with get_engine().begin() as conn:
+        for statement in partition_statements(date.today(), months_ahead):
+            await conn.execute(text(statement))
+
+    print(f"Audit log partitions ensured for the next {months_ahead} months")
+
+
 async def check_db_connection() -> bool:
     """Check if database is accessible."""
     try:
-        async with engine.connect() as conn:
+        async with get_engine().connect() as conn:
             await conn.execute(select(1))
         return True
     except Exception as e:
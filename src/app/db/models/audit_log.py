@@ -1,21 +1,23 @@
 """Audit log database model."""
 
-from uuid import uuid4
-
 from sqlalchemy import (
+    JSON,
+    BigInteger,
     Column,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
     Integer,
     String,
     Text,
     func,
 )
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.db.models.base import Base
+from app.db.models.inet import IPAddress
 from app.db.models.uuid import UUID
 
 
@@ -24,7 +26,11 @@ class AuditLog(Base):  # type: ignore[misc]  # type: ignore[misc]
 
     __tablename__ = "audit_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    # Sequential ids keep inserts on this append-heavy table index-local.
+    # They come from the PostgreSQL identity; SQLite only auto-increments a
+    # lone INTEGER PRIMARY KEY, so with the composite key inserts there must
+    # supply id explicitly.
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
@@ -33,12 +39,16 @@ class AuditLog(Base):  # type: ignore[misc]  # type: ignore[misc]
     action = Column(String(100), nullable=False)
     resource_type = Column(String(50), nullable=True)
     resource_id = Column(String(100), nullable=True)
-    ip_address = Column(String(45), nullable=True)
+    ip_address = Column(IPAddress(), nullable=True)
     user_agent = Column(Text, nullable=True)
-    request_data = Column(JSON, nullable=True)
+    request_data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     response_status = Column(Integer, nullable=True)
+    # Range partition key (monthly), so it is part of the primary key
     created_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True,
+        nullable=False,
     )
 
     # Relationships
@@ -50,6 +60,7 @@ class AuditLog(Base):  # type: ignore[misc]  # type: ignore[misc]
         Index("idx_audit_created", "created_at"),
         Index("idx_audit_resource", "resource_type", "resource_id"),
         Index("idx_audit_action", "action"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,38 @@
+"""Custom IP address type that works with both PostgreSQL and SQLite."""
+
+import ipaddress
+from typing import Any
+
+from sqlalchemy import Dialect, String, TypeDecorator
+from sqlalchemy.dialects.postgresql import INET
+
+
+class IPAddress(TypeDecorator[str]):
+    """Platform-independent IP address type.
+
+    Uses PostgreSQL's INET type when available (7 bytes for IPv4, 19 for
+    IPv6), otherwise uses VARCHAR(45). Values are exposed as strings, and
+    values that are not IP addresses are rejected on PostgreSQL.
+    """
+
+    impl = String(45)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> Any:
+        """Load implementation based on dialect."""
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(INET())
+        else:
+            return dialect.type_descriptor(String(45))
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        """Process value before saving to database."""
+        if value is None or dialect.name != "postgresql":
+            return value
+        return str(ipaddress.ip_address(str(value).strip()))
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        """Process value when loading from database."""
+        if value is None:
+            return value
+        return str(value)
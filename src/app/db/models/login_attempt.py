@@ -1,19 +1,21 @@
 """Login attempt database model."""
 
-from uuid import uuid4
-
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
     ForeignKey,
+    Identity,
     Index,
+    Integer,
     String,
     func,
 )
 from sqlalchemy.orm import relationship
 
 from app.db.models.base import Base
+from app.db.models.inet import IPAddress
 from app.db.models.uuid import UUID
 
 
@@ -22,14 +24,21 @@ class LoginAttempt(Base):  # type: ignore[misc]  # type: ignore[misc]
 
     __tablename__ = "login_attempts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    # Sequential ids keep inserts on this append-heavy table index-local;
+    # SQLite only auto-increments INTEGER PRIMARY KEY columns.
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        Identity(always=True),
+        primary_key=True,
+    )
     email = Column(String(255), nullable=False)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
     )
-    ip_address = Column(String(45), nullable=False)
+    # NULL when the request carried no valid client address
+    ip_address = Column(IPAddress(), nullable=True)
     user_agent = Column(String(500), nullable=True)
     success = Column(Boolean, nullable=False)
     attempted_at = Column(
@@ -41,8 +50,6 @@ class LoginAttempt(Base):  # type: ignore[misc]  # type: ignore[misc]
 
     # Indexes
     __table_args__ = (
-        Index("idx_login_attempts_email", "email"),
-        Index("idx_login_attempts_ip", "ip_address"),
         Index("idx_login_attempts_time", "attempted_at"),
         Index("idx_login_attempts_email_ip", "email", "ip_address"),
         Index("idx_login_attempts_user_id", "user_id"),
@@ -30,7 +30,6 @@ class RefreshToken(Base):  # type: ignore[misc]  # type: ignore[misc]
 
     # Indexes
     __table_args__ = (
-        Index("idx_refresh_tokens_hash", "token_hash"),
         Index("idx_refresh_tokens_user", "user_id"),
         Index("idx_refresh_tokens_expires", "expires_at"),
     )
@@ -46,8 +46,6 @@ class User(Base):  # type: ignore[misc]  # type: ignore[misc]
 
     # Indexes
     __table_args__ = (
-        Index("idx_users_email", "email"),
-        Index("idx_users_username", "username"),
         Index("idx_users_is_active", "is_active"),
         Index("idx_users_deleted_at", "deleted_at"),
     )
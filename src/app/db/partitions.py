@@ -0,0 +1,69 @@
+"""Monthly range partitions for the audit log table."""
+
+from datetime import date
+from typing import List, Optional
+
+AUDIT_LOGS_TABLE = "audit_logs"
+PARTITION_MONTHS_AHEAD = 3
+DEFAULT_PARTITION = f"{AUDIT_LOGS_TABLE}_default"
+
+
+def month_start(day: date) -> date:
+    """Return the first day of the month containing ``day``."""
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Return the first day of the month ``months`` after ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Return the partition table name for a month."""
+    return f"{AUDIT_LOGS_TABLE}_{month:%Y_%m}"
+
+
+def create_partition_sql(month: date) -> str:
+    """Build the DDL creating the audit log partition for one month."""
+    start = month_start(month)
+    end = add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(start)} "
+        f"PARTITION OF {AUDIT_LOGS_TABLE} "
+        f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') "
+        f"TO ('{end.isoformat()} 00:00:00+00')"
+    )
+
+
+def default_partition_sql() -> str:
+    """Build the DDL creating the catch-all audit log partition.
+
+    Rows outside every monthly partition (e.g. when the monthly job was
+    missed) land here instead of failing the insert. PostgreSQL refuses to
+    create a monthly partition while the default one holds rows in its
+    range, so such rows must be moved out before the missing month is added.
+    """
+    return (
+        f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} "
+        f"PARTITION OF {AUDIT_LOGS_TABLE} DEFAULT"
+    )
+
+
+def partition_statements(
+    first: date,
+    months_ahead: int = PARTITION_MONTHS_AHEAD,
+    today: Optional[date] = None,
+) -> List[str]:
+    """Build partition DDL from ``first`` through ``months_ahead`` past today.
+
+    Every statement is idempotent, so the same range can be re-applied by a
+    scheduled job to keep partitions created ahead of incoming rows.
+    """
+    month = month_start(first)
+    last = add_months(month_start(today or date.today()), months_ahead)
+    statements = []
+    while month <= last:
+        statements.append(create_partition_sql(month))
+        month = add_months(month, 1)
+    return statements
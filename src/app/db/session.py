@@ -1,8 +1,9 @@
 """Database session management."""
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -10,14 +11,17 @@ from sqlalchemy.ext.asyncio import (
 
 from app.core.config import settings
 
-# Create async engine
-engine = create_async_engine(
-    str(settings.DATABASE_URL),
-    echo=settings.DEBUG,
-    pool_size=settings.CONNECTION_POOL_SIZE,
-    max_overflow=0,
-    pool_pre_ping=True,
-)
+# Create async engine (left unset when SKIP_DB_INIT is on, so importing the
+# app for tasks like OpenAPI export does not load the database driver)
+engine: Optional[AsyncEngine] = None
+if not settings.SKIP_DB_INIT:
+    engine = create_async_engine(
+        str(settings.DATABASE_URL),
+        echo=settings.DEBUG,
+        pool_size=settings.CONNECTION_POOL_SIZE,
+        max_overflow=0,
+        pool_pre_ping=True,
+    )
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -29,6 +33,13 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def get_engine() -> AsyncEngine:
+    """Get the database engine."""
+    if engine is None:
+        raise RuntimeError("Database engine is disabled by SKIP_DB_INIT")
+    return engine
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
     async with AsyncSessionLocal() as session:
@@ -0,0 +1,96 @@
+"""Unit tests for bulk insert helpers."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy import func, select
+
+from app.db.bulk import COPY_THRESHOLD, bulk_insert_copy
+from app.db.models import LoginAttempt
+
+
+class TestBulkInsertCopy:
+    """Test bulk_insert_copy fallback path."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_rows(self, db_session):
+        """Test rows are inserted in one call."""
+        columns = ("email", "ip_address", "success")
+        rows = [(f"user{i}@example.com", "127.0.0.1", False) for i in range(3)]
+
+        await bulk_insert_copy(db_session, "login_attempts", rows, columns)
+
+        result = await db_session.execute(select(func.count(LoginAttempt.id)))
+        assert result.scalar() == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_above_threshold_without_asyncpg(self, db_session):
+        """Test large batches fall back to INSERT on non-PostgreSQL databases."""
+        columns = ("email", "ip_address", "success")
+        rows = [("user@example.com", "10.0.0.1", True)] * COPY_THRESHOLD
+
+        await bulk_insert_copy(db_session, "login_attempts", rows, columns)
+
+        result = await db_session.execute(select(func.count(LoginAttempt.id)))
+        assert result.scalar() == COPY_THRESHOLD
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_empty(self, db_session):
+        """Test an empty batch is a no-op."""
+        await bulk_insert_copy(db_session, "login_attempts", [], ("email",))
+
+        result = await db_session.execute(select(func.count(LoginAttempt.id)))
+        assert result.scalar() == 0
+
+
+def _asyncpg_session():
+    """Build a mock session whose connection reports the asyncpg driver."""
+    driver_connection = Mock(copy_records_to_table=AsyncMock())
+    connection = Mock()
+    connection.dialect.driver = "asyncpg"
+    connection.get_raw_connection = AsyncMock(
+        return_value=Mock(driver_connection=driver_connection)
+    )
+    session = AsyncMock()
+    session.connection = AsyncMock(return_value=connection)
+    return session, driver_connection
+
+
+class TestBulkInsertCopyAsyncpg:
+    """Test bulk_insert_copy COPY path on asyncpg."""
+
+    @pytest.mark.asyncio
+    async def test_copy_at_threshold(self):
+        """Test batches at the threshold are streamed with COPY."""
+        session, driver_connection = _asyncpg_session()
+        columns = ("email", "ip_address", "success")
+        rows = [("user@example.com", "10.0.0.1", True)] * COPY_THRESHOLD
+
+        await bulk_insert_copy(session, "login_attempts", rows, columns)
+
+        driver_connection.copy_records_to_table.assert_awaited_once_with(
+            "login_attempts", records=rows, columns=list(columns)
+        )
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_insert_below_threshold(self):
+        """Test smaller batches use INSERT even on asyncpg."""
+        session, driver_connection = _asyncpg_session()
+        columns = ("email", "ip_address", "success")
+        rows = [("user@example.com", "10.0.0.1", True)] * (COPY_THRESHOLD - 1)
+
+        await bulk_insert_copy(session, "login_attempts", rows, columns)
+
+        driver_connection.copy_records_to_table.assert_not_awaited()
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_connection(self):
+        """Test an empty batch returns before touching the connection."""
+        session, driver_connection = _asyncpg_session()
+
+        await bulk_insert_copy(session, "login_attempts", [], ("email",))
+
+        session.connection.assert_not_awaited()
+        driver_connection.copy_records_to_table.assert_not_awaited()
@@ -2,7 +2,13 @@
 
 from datetime import datetime, timedelta, timezone
 
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
 from app.db.models import AuditLog, LoginAttempt, RefreshToken, User
+from app.db.models.inet import IPAddress
 
 
 class TestUserModel:
@@ -99,3 +105,48 @@ class TestAuditLogModel:
         """Test AuditLog string representation."""
         log = AuditLog(id="log-123", action="user.login", user_id="user-456")
         assert repr(log) == "<AuditLog user.login by user-456>"
+
+    @pytest.mark.asyncio
+    async def test_audit_log_insert_on_sqlite(self, db_session):
+        """Test SQLite inserts need an explicit id with the composite key."""
+        db_session.add(AuditLog(id=1, action="user.login"))
+        await db_session.commit()
+
+        result = await db_session.execute(select(AuditLog.id, AuditLog.action))
+        assert result.all() == [(1, "user.login")]
+
+        db_session.add(AuditLog(action="user.logout"))
+        with pytest.raises(IntegrityError):
+            await db_session.commit()
+
+
+class TestIPAddressType:
+    """Test the IPAddress column type."""
+
+    def test_postgresql_normalizes_addresses(self):
+        """Test valid addresses are normalized for INET."""
+        ip_type = IPAddress()
+        dialect = postgresql.dialect()
+        assert ip_type.process_bind_param("127.0.0.1", dialect) == "127.0.0.1"
+        assert ip_type.process_bind_param("2001:DB8::1", dialect) == "2001:db8::1"
+
+    def test_postgresql_rejects_invalid_addresses(self):
+        """Test non-address values are rejected for INET."""
+        ip_type = IPAddress()
+        dialect = postgresql.dialect()
+        with pytest.raises(ValueError):
+            ip_type.process_bind_param("unknown", dialect)
+        assert ip_type.process_bind_param(None, dialect) is None
+
+    def test_postgresql_bind_processor_rejects_placeholder(self):
+        """Test the PostgreSQL bind processor raises for "unknown"."""
+        process = LoginAttempt.__table__.c.ip_address.type.bind_processor(
+            postgresql.dialect()
+        )
+        assert process("10.0.0.1") == "10.0.0.1"
+        with pytest.raises(ValueError):
+            process("unknown")
+
+    def test_sqlite_passes_values_through(self):
+        """Test SQLite stores values unchanged."""
+        assert IPAddress().process_bind_param("unknown", sqlite.dialect()) == "unknown"
@@ -0,0 +1,50 @@
+"""Unit tests for audit log partition helpers."""
+
+from datetime import date
+
+from app.db.partitions import (
+    add_months,
+    create_partition_sql,
+    default_partition_sql,
+    partition_name,
+    partition_statements,
+)
+
+
+class TestPartitionHelpers:
+    """Test monthly partition DDL generation."""
+
+    def test_add_months_rolls_over_year(self):
+        """Test month arithmetic across year boundaries."""
+        assert add_months(date(2024, 11, 1), 1) == date(2024, 12, 1)
+        assert add_months(date(2024, 12, 1), 1) == date(2025, 1, 1)
+        assert add_months(date(2024, 1, 1), 14) == date(2025, 3, 1)
+
+    def test_partition_name(self):
+        """Test partition naming."""
+        assert partition_name(date(2024, 3, 1)) == "audit_logs_2024_03"
+
+    def test_create_partition_sql(self):
+        """Test partition bounds cover exactly one month."""
+        sql = create_partition_sql(date(2024, 12, 17))
+        assert "CREATE TABLE IF NOT EXISTS audit_logs_2024_12" in sql
+        assert "PARTITION OF audit_logs" in sql
+        assert "FROM ('2024-12-01 00:00:00+00')" in sql
+        assert "TO ('2025-01-01 00:00:00+00')" in sql
+
+    def test_partition_statements_range(self):
+        """Test statements span from the first month to the look-ahead."""
+        statements = partition_statements(
+            date(2024, 1, 20), months_ahead=2, today=date(2024, 3, 5)
+        )
+        assert len(statements) == 5
+        assert "audit_logs_2024_01" in statements[0]
+        assert "audit_logs_2024_05" in statements[-1]
+
+    def test_default_partition_sql(self):
+        """Test the catch-all partition DDL is idempotent."""
+        sql = default_partition_sql()
+        assert sql == (
+            "CREATE TABLE IF NOT EXISTS audit_logs_default "
+            "PARTITION OF audit_logs DEFAULT"
+        )
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.core.rate_limit import LoginRateLimiter
 from app.db.models import LoginAttempt
@@ -107,6 +108,26 @@ class TestLoginRateLimiter:
         assert remaining == 0
         assert retry_after is not None
 
+    @pytest.mark.asyncio
+    async def test_check_login_rate_limit_without_ip(self):
+        """Test requests without a client address are bucketed by email."""
+        limiter = LoginRateLimiter()
+        mock_db = AsyncMock()
+
+        mock_result = Mock()
+        mock_result.scalar.return_value = 0
+        mock_db.execute.return_value = mock_result
+
+        result = await limiter.check_login_rate_limit(mock_db, "test@example.com", None)
+        assert result == (True, 15, None)
+
+        # The query must compile and bind on PostgreSQL, where INET rejects
+        # placeholder values such as "unknown"
+        statement = mock_db.execute.call_args[0][0]
+        compiled = statement.compile(dialect=postgresql.dialect())
+        assert "login_attempts.ip_address IS NULL" in str(compiled)
+        assert "unknown" not in compiled.params.values()
+
     @pytest.mark.asyncio
     async def test_record_login_attempt_success(self):
         """Test recording successful login attempt."""
@@ -42,7 +42,25 @@ class TestRequestUtils:
         mock_request.client = None
 
         ip = get_client_ip(mock_request)
-        assert ip == "unknown"
+        assert ip is None
+
+    def test_get_client_ip_non_address_peer(self):
+        """Test a peer host that is not an IP address yields None."""
+        mock_request = Mock()
+        mock_request.headers = {}
+        mock_request.client = Mock(host="testclient")
+
+        ip = get_client_ip(mock_request)
+        assert ip is None
+
+    def test_get_client_ip_ignores_invalid_headers(self):
+        """Test malformed proxy headers fall back to the peer address."""
+        mock_request = Mock()
+        mock_request.headers = {"X-Forwarded-For": "unknown", "X-Real-IP": "abc"}
+        mock_request.client = Mock(host="192.168.1.4")
+
+        ip = get_client_ip(mock_request)
+        assert ip == "192.168.1.4"
 
     def test_get_user_agent_present(self):
         """Test getting user agent when present."""